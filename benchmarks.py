@@ -0,0 +1,787 @@
+"""
+MAIN LOL - Benchmarks
+---------------------
+Mesures de performance reproductibles, avec budgets.
+Le script retourne un code de sortie non nul si un budget est dépassé.
+
+Usage:
+    python benchmarks.py startup [--runs N] [--no-gui]
+    python benchmarks.py headless [--runs N] [--no-gui]
+    python benchmarks.py events [--runs N] [--events N]
+    python benchmarks.py discovery [--runs N] [--polls N]
+    python benchmarks.py lockin [--runs N]
+    python benchmarks.py instance [--runs N] [--processes N]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from time import perf_counter
+from statistics import median
+from typing import Dict, Any, List, Tuple, Optional
+
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# ───────────────────────────────────────────────────────────────────────────
+# BUDGETS
+# ───────────────────────────────────────────────────────────────────────────
+
+# Temps cumulé de `import launcher` (-X importtime)
+IMPORT_BUDGET_MS: float = 250.0
+# Temps entre le lancement du processus et la première itération de mainloop
+FIRST_LOOP_BUDGET_MS: float = 2500.0
+# Temps entre la demande de fermeture (quit_app) et la fin du processus
+SHUTDOWN_BUDGET_MS: float = 3000.0
+
+# Latence publication -> traitement du bus d'événements (p99, abonnés callback et asyncio)
+EVENT_LATENCY_P99_BUDGET_MS: float = 5.0
+# Coût d'un publish() avec trois abonnés (réveil des consommateurs compris)
+PUBLISH_BUDGET_US: float = 100.0
+
+# Délai entre le lancement du client et sa détection (au-delà de l'intervalle de recherche)
+DISCOVERY_LATENCY_MARGIN_MS: float = 250.0
+
+# Pick automatique (pause technique de 50 ms comprise), classes read/write saturées
+LOCK_IN_BUDGET_MS: float = 100.0
+
+# Reprise du verrou d'instance unique après la mort (kill -9) du propriétaire
+RELOCK_BUDGET_MS: float = 500.0
+
+# Modules qui ne doivent jamais être importés par `import launcher`
+LAZY_MODULES: Tuple[str, ...] = (
+    "pygame", "pystray", "keyboard", "requests", "PIL",
+    "lcu_driver", "aiohttp", "psutil", "ttkbootstrap",
+)
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# STARTUP
+# ───────────────────────────────────────────────────────────────────────────
+
+def measure_import_time() -> Tuple[float, List[Tuple[str, float]], List[str]]:
+    """
+    Mesure `import launcher` avec -X importtime.
+    
+    Returns:
+        (temps cumulé en ms, 10 imports directs les plus lourds, modules paresseux importés)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import launcher"],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import launcher a échoué:\n{proc.stderr[-2000:]}")
+    
+    # -X importtime liste les sous-modules AVANT leur parent: on accumule
+    # les lignes depuis le dernier import de premier niveau.
+    total_ms = 0.0
+    children: List[Tuple[str, float]] = []
+    imported: List[str] = []
+    pending: List[Tuple[int, str, float]] = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        cumulative_ms = int(match.group(2)) / 1000
+        indent, name = len(match.group(3)), match.group(4)
+        if indent > 1:
+            pending.append((indent, name, cumulative_ms))
+            continue
+        if name == "launcher":
+            total_ms = cumulative_ms
+            imported = [child for _, child, _ in pending]
+            # Imports directs de launcher (un niveau d'indentation)
+            children = [(child, ms) for child_indent, child, ms in pending if child_indent == 3]
+        pending = []
+    
+    eager = sorted({
+        name.split(".")[0] for name in imported
+        if name.split(".")[0] in LAZY_MODULES
+    })
+    children.sort(key=lambda item: item[1], reverse=True)
+    return total_ms, children[:10], eager
+
+
+def run_probe(extra_args: List[str]) -> Optional[Tuple[float, Dict, float]]:
+    """
+    Lance `launcher.py --startup-probe` et attend la ligne STARTUP_PROBE.
+    
+    Args:
+        extra_args: Arguments supplémentaires (ex: ["--headless"])
+    
+    Returns:
+        (temps mur jusqu'à la ligne en ms, contenu JSON de la ligne,
+        temps entre la ligne et la fin du processus en ms) ou None
+    """
+    started_at = perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "launcher.py", "--startup-probe"] + extra_args,
+        cwd=ROOT_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    try:
+        for line in proc.stdout:
+            if line.startswith("STARTUP_PROBE "):
+                probe_at = perf_counter()
+                payload = json.loads(line.split(" ", 1)[1])
+                proc.wait(timeout=60)
+                exit_ms = (perf_counter() - probe_at) * 1000
+                return (probe_at - started_at) * 1000, payload, exit_ms
+        proc.wait(timeout=60)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+    return None
+
+
+def measure_first_loop() -> Optional[Tuple[float, float, float]]:
+    """
+    Lance `launcher.py --startup-probe` et mesure le temps de première
+    itération, puis la durée de la fermeture qui suit (quit_app).
+    
+    Returns:
+        (temps mur vu du processus parent en ms, temps interne en ms,
+        temps de fermeture en ms) ou None sans affichage
+    """
+    result = run_probe([])
+    if result is None:
+        return None
+    wall_ms, payload, exit_ms = result
+    return wall_ms, payload["first_loop_ms"], exit_ms
+
+
+def bench_startup(runs: int, with_gui: bool) -> bool:
+    """Benchmark du démarrage. Retourne True si les budgets sont respectés."""
+    ok = True
+    
+    import_times = []
+    for _ in range(runs):
+        total_ms, heaviest, eager = measure_import_time()
+        import_times.append(total_ms)
+    import_ms = median(import_times)
+    
+    print(f"\n📦 import launcher : {import_ms:.1f} ms (médiane sur {runs}, budget {IMPORT_BUDGET_MS:.0f} ms)")
+    for name, ms in heaviest:
+        print(f"   {name:<30} {ms:8.1f} ms")
+    
+    if import_ms > IMPORT_BUDGET_MS:
+        print(f"❌ Budget d'import dépassé ({import_ms:.1f} > {IMPORT_BUDGET_MS:.0f} ms)")
+        ok = False
+    if eager:
+        print(f"❌ Modules importés trop tôt : {', '.join(eager)}")
+        ok = False
+    
+    if with_gui:
+        results = [measure_first_loop() for _ in range(runs)]
+        results = [r for r in results if r is not None]
+        if not results:
+            print("⚠️  Première itération non mesurée (pas d'affichage ?)")
+        else:
+            wall_ms = median(r[0] for r in results)
+            internal_ms = median(r[1] for r in results)
+            print(f"\n🪟 Première itération mainloop : {wall_ms:.1f} ms "
+                  f"(interne {internal_ms:.1f} ms, budget {FIRST_LOOP_BUDGET_MS:.0f} ms)")
+            if wall_ms > FIRST_LOOP_BUDGET_MS:
+                print(f"❌ Budget de démarrage dépassé ({wall_ms:.1f} > {FIRST_LOOP_BUDGET_MS:.0f} ms)")
+                ok = False
+            
+            ok = _check_exit("quit_app", [r[2] for r in results]) and ok
+    
+    # Toujours mesurée, même sans affichage
+    headless = [r for r in (run_probe(["--headless"]) for _ in range(runs)) if r is not None]
+    if not headless:
+        print("❌ Fermeture headless non mesurée (pas de ligne STARTUP_PROBE)")
+        ok = False
+    else:
+        ok = _check_exit("headless", [r[2] for r in headless]) and ok
+    
+    return ok
+
+
+def _check_exit(label: str, exits_ms: List[float]) -> bool:
+    """Vérifie le pire temps entre la demande de fermeture et la fin du processus."""
+    exit_ms = max(exits_ms)
+    print(f"\n🚪 Fermeture {label} (→ fin du processus) : {exit_ms:.1f} ms "
+          f"(pire cas, budget {SHUTDOWN_BUDGET_MS:.0f} ms)")
+    if exit_ms > SHUTDOWN_BUDGET_MS:
+        print(f"❌ Budget de fermeture dépassé ({exit_ms:.1f} > {SHUTDOWN_BUDGET_MS:.0f} ms)")
+        return False
+    return True
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# HEADLESS
+# ───────────────────────────────────────────────────────────────────────────
+
+def bench_headless(runs: int, with_gui: bool) -> bool:
+    """
+    Compare le mode headless au mode graphique (temps de démarrage et pic
+    mémoire). Retourne False si le mode headless charge un module graphique.
+    """
+    ok = True
+    modes = [("headless", ["--headless"], "ready_ms")]
+    if with_gui:
+        modes.append(("graphique", [], "first_loop_ms"))
+    
+    print(f"\n{'Mode':<12} {'Démarrage (ms)':>16} {'Pic mémoire (Mo)':>18}")
+    for label, args, key in modes:
+        results = [r for r in (run_probe(args) for _ in range(runs)) if r is not None]
+        if not results:
+            print(f"{label:<12} {'non mesuré':>16}")
+            continue
+        startup_ms = median(r[1][key] for r in results)
+        memories = [r[1].get("peak_memory_kb") for r in results if r[1].get("peak_memory_kb")]
+        memory = f"{median(memories) / 1024:.1f}" if memories else "?"
+        print(f"{label:<12} {startup_ms:>16.1f} {memory:>18}")
+        
+        gui_modules = sorted({name for r in results for name in r[1].get("gui_modules", [])})
+        if gui_modules:
+            print(f"❌ Modules graphiques chargés en headless : {', '.join(gui_modules)}")
+            ok = False
+    
+    return ok
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# BUS D'ÉVÉNEMENTS
+# ───────────────────────────────────────────────────────────────────────────
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Percentile simple (valeurs non vides)."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure_event_bus(count: int) -> Dict[str, Dict[str, float]]:
+    """
+    Publie `count` événements depuis un thread (comme la boucle WebSocket)
+    vers trois abonnés: callback, asyncio et pull (drain périodique, comme
+    la boucle Tk). Les événements sont espacés pour mesurer la latence hors
+    saturation.
+    
+    Returns:
+        {mode: {"p50_ms", "p99_ms", "max_ms", "received"}} et "publish"
+        ({"avg_us"}: coût moyen d'un publish())
+    """
+    import asyncio
+    import threading
+    from time import sleep
+    sys.path.insert(0, ROOT_DIR)
+    from src.events import EventBus
+    
+    bus = EventBus()
+    latencies: Dict[str, List[float]] = {"callback": [], "asyncio": [], "pull": []}
+    
+    bus.subscribe(lambda event: latencies["callback"].append(perf_counter() - event.published_at),
+                  name="callback", maxsize=count)
+    
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    
+    async def consume() -> None:
+        subscription = bus.subscribe(name="asyncio", maxsize=count)
+        ready.set()
+        for _ in range(count):
+            event = await subscription.get()
+            latencies["asyncio"].append(perf_counter() - event.published_at)
+    
+    consumer = threading.Thread(target=lambda: loop.run_until_complete(consume()), daemon=True)
+    consumer.start()
+    ready.wait(5)
+    
+    pull = bus.subscribe(name="pull", maxsize=count)
+    stop_pull = threading.Event()
+    
+    def pump() -> None:
+        while not stop_pull.is_set():
+            for event in pull.drain():
+                latencies["pull"].append(perf_counter() - event.published_at)
+            sleep(0.05)
+    
+    pump_thread = threading.Thread(target=pump, daemon=True)
+    pump_thread.start()
+    
+    publish_total = 0.0
+    for index in range(count):
+        started_at = perf_counter()
+        bus.publish("status", index, "bench")
+        publish_total += perf_counter() - started_at
+        sleep(0.001)
+    
+    consumer.join(5)
+    sleep(0.1)
+    stop_pull.set()
+    pump_thread.join(1)
+    bus.close()
+    loop.close()
+    
+    results: Dict[str, Dict[str, float]] = {"publish": {"avg_us": publish_total / count * 1e6}}
+    for mode, values in latencies.items():
+        if not values:
+            results[mode] = {"p50_ms": float("nan"), "p99_ms": float("nan"), "max_ms": float("nan"), "received": 0}
+            continue
+        results[mode] = {
+            "p50_ms": _percentile(values, 0.5) * 1000,
+            "p99_ms": _percentile(values, 0.99) * 1000,
+            "max_ms": max(values) * 1000,
+            "received": len(values),
+        }
+    return results
+
+
+def bench_events(runs: int, count: int) -> bool:
+    """Benchmark du bus d'événements. Retourne True si les budgets sont respectés."""
+    ok = True
+    runs_results = [measure_event_bus(count) for _ in range(runs)]
+    
+    publish_us = median(r["publish"]["avg_us"] for r in runs_results)
+    print(f"\n📨 publish() : {publish_us:.1f} µs en moyenne (3 abonnés, budget {PUBLISH_BUDGET_US:.0f} µs)")
+    if publish_us > PUBLISH_BUDGET_US:
+        print(f"❌ Budget de publication dépassé ({publish_us:.1f} > {PUBLISH_BUDGET_US:.0f} µs)")
+        ok = False
+    
+    print(f"\n{'Abonné':<10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10} {'reçus':>8}")
+    for mode in ("callback", "asyncio", "pull"):
+        p50 = median(r[mode]["p50_ms"] for r in runs_results)
+        p99 = median(r[mode]["p99_ms"] for r in runs_results)
+        worst = max(r[mode]["max_ms"] for r in runs_results)
+        received = min(r[mode]["received"] for r in runs_results)
+        print(f"{mode:<10} {p50:>10.3f} {p99:>10.3f} {worst:>10.3f} {received:>8}")
+        if received < count:
+            print(f"❌ {mode}: {count - received} événements perdus")
+            ok = False
+        # L'abonné pull est vidé à cadence fixe (50 ms): pas de budget de latence
+        if mode != "pull" and p99 > EVENT_LATENCY_P99_BUDGET_MS:
+            print(f"❌ {mode}: latence p99 hors budget ({p99:.3f} > {EVENT_LATENCY_P99_BUDGET_MS:.0f} ms)")
+            ok = False
+    
+    return ok
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# DÉCOUVERTE DU CLIENT
+# ───────────────────────────────────────────────────────────────────────────
+
+def measure_discovery_cpu(polls: int, lockfile: str) -> Dict[str, float]:
+    """
+    Temps CPU d'un passage de recherche, client fermé.
+    
+    Returns:
+        {"process": ms, "lockfile": ms} par passage
+    """
+    from time import process_time
+    sys.path.insert(0, ROOT_DIR)
+    from lcu_driver.utils import _return_ux_process
+    from src.lcu import LockfileWatcher
+    
+    watcher = LockfileWatcher([lockfile])
+    results: Dict[str, float] = {}
+    for mode, poll in (
+        ("process", lambda: next(_return_ux_process(), None)),
+        ("lockfile", watcher.poll),
+    ):
+        started_at = process_time()
+        for _ in range(polls):
+            poll()
+        results[mode] = (process_time() - started_at) / polls * 1000
+    return results
+
+
+def measure_discovery_latency(lockfile: str, fake_client: Optional[str]) -> Dict[str, float]:
+    """
+    Délai entre l'apparition du client et sa détection, avec la boucle de
+    recherche des connecteurs (un passage toutes les CLIENT_POLL_INTERVAL_S).
+    
+    Le client est simulé: écriture du lockfile, ou lancement d'un processus
+    nommé LeagueClientUx (copie de `sleep`, Linux/macOS uniquement).
+    
+    Returns:
+        {"process": ms, "lockfile": ms} ("process" absent sans faux client)
+    """
+    import random
+    import threading
+    from time import sleep
+    sys.path.insert(0, ROOT_DIR)
+    from lcu_driver.utils import _return_ux_process
+    from src.config import CLIENT_POLL_INTERVAL_S
+    from src.lcu import LockfileWatcher
+    
+    def detect(find, launch) -> float:
+        launched: Dict[str, float] = {}
+        
+        def delayed_launch() -> None:
+            sleep(random.uniform(0.1, 1.0))
+            launched["at"] = perf_counter()
+            launch()
+        
+        launcher = threading.Thread(target=delayed_launch, daemon=True)
+        launcher.start()
+        while not find():
+            sleep(CLIENT_POLL_INTERVAL_S)
+        detected_at = perf_counter()
+        launcher.join()
+        return (detected_at - launched["at"]) * 1000
+    
+    results: Dict[str, float] = {}
+    
+    def write_lockfile() -> None:
+        with open(lockfile, "w", encoding="utf-8") as f:
+            f.write(f"LeagueClient:{os.getpid()}:2999:bench:https")
+    
+    watcher = LockfileWatcher([lockfile])
+    results["lockfile"] = detect(watcher.poll, write_lockfile)
+    os.remove(lockfile)
+    
+    if fake_client is not None:
+        processes: List[subprocess.Popen] = []
+        results["process"] = detect(
+            lambda: next(_return_ux_process(), None),
+            lambda: processes.append(subprocess.Popen([fake_client, "30"]))
+        )
+        for process in processes:
+            process.kill()
+            process.wait()
+    return results
+
+
+def bench_discovery(runs: int, polls: int) -> bool:
+    """Découverte par lockfile vs recherche de processus. Retourne True si les budgets sont respectés."""
+    import shutil
+    import tempfile
+    sys.path.insert(0, ROOT_DIR)
+    from src.config import CLIENT_POLL_INTERVAL_S
+    
+    ok = True
+    with tempfile.TemporaryDirectory() as folder:
+        lockfile = os.path.join(folder, "lockfile")
+        sleep_binary = shutil.which("sleep") if os.name != "nt" else None
+        fake_client = None
+        if sleep_binary:
+            fake_client = os.path.join(folder, "LeagueClientUx")
+            shutil.copy(sleep_binary, fake_client)
+        
+        cpu_runs = [measure_discovery_cpu(polls, lockfile) for _ in range(runs)]
+        print(f"\n🔎 Client fermé: CPU par passage, un passage toutes les {CLIENT_POLL_INTERVAL_S} s")
+        print(f"{'Mode':<10} {'ms/passage':>12} {'CPU moyen':>10}")
+        cpu = {}
+        for mode in ("process", "lockfile"):
+            cpu[mode] = median(r[mode] for r in cpu_runs)
+            share = cpu[mode] / (CLIENT_POLL_INTERVAL_S * 1000) * 100
+            print(f"{mode:<10} {cpu[mode]:>12.4f} {share:>9.3f}%")
+        if cpu["lockfile"] >= cpu["process"]:
+            print("❌ Le lockfile ne coûte pas moins que la recherche de processus")
+            ok = False
+        
+        latency_runs = [measure_discovery_latency(lockfile, fake_client) for _ in range(runs)]
+        budget = CLIENT_POLL_INTERVAL_S * 1000 + DISCOVERY_LATENCY_MARGIN_MS
+        print(f"\n⏱️  Lancement du client -> détection (budget {budget:.0f} ms)")
+        for mode in ("process", "lockfile"):
+            values = [r[mode] for r in latency_runs if mode in r]
+            if not values:
+                print(f"{mode:<10} non mesuré (pas de faux client sur cette plateforme)")
+                continue
+            print(f"{mode:<10} médiane {median(values):>7.0f} ms, max {max(values):>7.0f} ms")
+            if max(values) > budget:
+                print(f"❌ {mode}: détection hors budget ({max(values):.0f} > {budget:.0f} ms)")
+                ok = False
+    return ok
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# VERROUILLAGE DU CHAMPION
+# ───────────────────────────────────────────────────────────────────────────
+
+def measure_lock_in() -> Dict[str, Any]:
+    """
+    Tick de sélection complet (lecture de session, hover, pick) alors que les
+    classes "read" et "write" du limiteur ont plusieurs secondes de retard
+    (refresh, timer...), à travers la vraie NarrowConnection.request (seule la
+    session HTTP est simulée).
+    
+    Returns:
+        {"elapsed_ms": délai jusqu'au /complete, "requests",
+         "waited": {classe: requêtes freinées pendant le tick}, "picked"}
+    """
+    import asyncio
+    from types import SimpleNamespace
+    sys.path.insert(0, ROOT_DIR)
+    from src.core import WebSocketManager
+    from src.events import EventBus
+    from src.lcu import get_lcu_classes, LANE_READ, LANE_WRITE
+    
+    requests: List[Tuple[str, str]] = []
+    completed_at: List[float] = []
+    session = {
+        "localPlayerCellId": 0,
+        "myTeam": [{"cellId": 0, "assignedPosition": ""}],
+        "actions": [[{
+            "id": 1, "actorCellId": 0, "type": "pick",
+            "isInProgress": True, "completed": False, "championId": 0,
+        }]],
+    }
+    
+    class FakeSession:
+        async def request(self, method, url, **kwargs):
+            requests.append((method, url))
+            if url.endswith("/complete"):
+                completed_at.append(perf_counter())
+            body = session if url.endswith("/lol-champ-select/v1/session") else []
+            return SimpleNamespace(status=200, json=lambda: asyncio.sleep(0, result=body))
+    
+    async def pick() -> Dict[str, Any]:
+        connector_class, _ = get_lcu_classes()
+        connector = connector_class(loop=asyncio.get_running_loop())
+        connection = connector_class.connection_class(connector, "1:1:2999:bench")
+        connection.session = FakeSession()
+        
+        bus = EventBus()
+        params = {"auto_pick_enabled": True, "selected_pick_1": "Garen", "auto_summoners_enabled": False}
+        manager = WebSocketManager(
+            bus=bus, dd=SimpleNamespace(resolve_champion=lambda name: 86), get_params=lambda: params
+        )
+        manager.connection = connection
+        connection.rate_limiter = manager.rate_limiter
+        
+        # Retard de plusieurs secondes sur les classes freinées
+        for lane in (LANE_READ, LANE_WRITE):
+            bucket = manager.rate_limiter._bucket(lane)
+            while bucket.reserve() < 5.0:
+                pass
+        before = manager.rate_limiter.get_stats()
+        
+        started_at = perf_counter()
+        await manager._champ_select_tick()
+        elapsed_ms = ((completed_at[0] if completed_at else perf_counter()) - started_at) * 1000
+        
+        after = manager.rate_limiter.get_stats()
+        bus.close()
+        return {
+            "elapsed_ms": elapsed_ms,
+            "requests": len(requests),
+            "waited": {lane: after[lane]["throttled"] - before[lane]["throttled"] for lane in after},
+            "picked": manager.state.has_picked,
+        }
+    
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(pick())
+    finally:
+        loop.close()
+
+
+def bench_lock_in(runs: int) -> bool:
+    """Le verrouillage ne doit jamais attendre le limiteur. Retourne True si le budget est respecté."""
+    ok = True
+    results = [measure_lock_in() for _ in range(runs)]
+    elapsed = max(r["elapsed_ms"] for r in results)
+    print(f"\n🔒 Tick de sélection jusqu'au verrouillage, lectures/écritures saturées: {elapsed:.1f} ms au pire "
+          f"({results[0]['requests']} requêtes, budget {LOCK_IN_BUDGET_MS:.0f} ms)")
+    for result in results:
+        waited = {lane: count for lane, count in result["waited"].items() if count}
+        if not result["picked"]:
+            print("❌ Champion non verrouillé")
+            ok = False
+        if waited:
+            print(f"❌ Requêtes du tick freinées: {waited}")
+            ok = False
+    if elapsed > LOCK_IN_BUDGET_MS:
+        print(f"❌ Verrouillage hors budget ({elapsed:.1f} > {LOCK_IN_BUDGET_MS:.0f} ms)")
+        ok = False
+    return ok
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# INSTANCE UNIQUE
+# ───────────────────────────────────────────────────────────────────────────
+
+# Processus concurrent: attend l'instant de départ commun puis prend le
+# verrou (OWNER, puis une ligne SHOW par demande reçue) ou demande
+# l'affichage à l'instance en place (SHOW_ACK / SHOW_FAIL)
+_INSTANCE_CHILD = """
+import sys, time
+sys.path.insert(0, sys.argv[3])
+from src.utils import SingleInstanceLock
+lock = SingleInstanceLock(int(sys.argv[1]))
+time.sleep(max(0.0, float(sys.argv[2]) - time.time()))
+if lock.acquire():
+    print("OWNER", flush=True)
+    # Les demandes reçues avant le handler sont rejouées ici
+    lock.set_show_handler(lambda: print("SHOW", flush=True))
+    time.sleep(60)
+else:
+    print("SHOW_ACK" if lock.request_show() else "SHOW_FAIL", flush=True)
+"""
+
+
+def _free_port() -> int:
+    """Port local libre (verrou de test, distinct de celui de l'application)."""
+    import socket
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _spawn_instance(port: int, start_at: float) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", _INSTANCE_CHILD, str(port), str(start_at), ROOT_DIR],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+
+
+def measure_instance_race(processes: int) -> Dict[str, Any]:
+    """
+    Lance `processes` instances sur le même verrou au même instant, puis
+    tue le propriétaire (kill -9) et relance aussitôt une instance.
+    
+    Returns:
+        {"owners", "acks", "failures", "shows_received", "relock_ms", "relocked"}
+    """
+    import time
+    port = _free_port()
+    start_at = time.time() + 1.0
+    children = [_spawn_instance(port, start_at) for _ in range(processes)]
+    
+    # Les perdants se terminent après l'accusé de réception du propriétaire
+    owner: Optional[subprocess.Popen] = None
+    owners, acks, failures = 0, 0, 0
+    for child in children:
+        first_line = child.stdout.readline().strip()
+        if first_line == "OWNER":
+            owners += 1
+            owner = child
+        elif first_line == "SHOW_ACK":
+            acks += 1
+            child.wait(5)
+        else:
+            failures += 1
+            child.wait(5)
+    
+    shows_received = 0
+    relock_ms = None
+    relocked = False
+    if owner is not None:
+        # Le propriétaire confirme avant d'appeler son handler: lecture bornée des SHOW
+        import threading
+        shows: List[str] = []
+        
+        def read_shows() -> None:
+            while len(shows) < acks + failures:
+                line = owner.stdout.readline()
+                if not line:
+                    return
+                shows.append(line.strip())
+        
+        reader = threading.Thread(target=read_shows, daemon=True)
+        reader.start()
+        reader.join(5)
+        shows_received = shows.count("SHOW")
+        owner.kill()
+        owner.wait(5)
+        
+        started_at = perf_counter()
+        successor = _spawn_instance(port, 0.0)
+        relocked = successor.stdout.readline().strip() == "OWNER"
+        relock_ms = (perf_counter() - started_at) * 1000
+        successor.kill()
+        successor.wait(5)
+    for child in children:
+        if child.poll() is None:
+            child.kill()
+            child.wait(5)
+    return {
+        "owners": owners, "acks": acks, "failures": failures,
+        "shows_received": shows_received, "relock_ms": relock_ms, "relocked": relocked,
+    }
+
+
+def bench_instance(runs: int, processes: int) -> bool:
+    """Course au verrou d'instance unique. Retourne True si tout est conforme."""
+    ok = True
+    print(f"\n🔐 {processes} lancements simultanés, {runs} essai(s)")
+    print(f"{'Essai':<6} {'Proprio.':>9} {'SHOW ok':>8} {'Reçus':>6} {'Reprise (ms)':>13}")
+    for index in range(runs):
+        result = measure_instance_race(processes)
+        relock = f"{result['relock_ms']:.0f}" if result["relock_ms"] is not None else "-"
+        print(f"{index + 1:<6} {result['owners']:>9} {result['acks']:>8} {result['shows_received']:>6} {relock:>13}")
+        if result["owners"] != 1:
+            print(f"❌ {result['owners']} propriétaire(s) au lieu d'un seul")
+            ok = False
+        if result["acks"] != processes - 1 or result["shows_received"] != processes - 1:
+            print(f"❌ Demandes d'affichage: {result['acks']} confirmées, {result['shows_received']} reçues "
+                  f"(attendu {processes - 1})")
+            ok = False
+        if result["owners"] == 1 and not result["relocked"]:
+            print("❌ Verrou non repris après la mort du propriétaire")
+            ok = False
+        elif result["relock_ms"] is not None and result["relock_ms"] > RELOCK_BUDGET_MS:
+            print(f"❌ Reprise du verrou hors budget ({result['relock_ms']:.0f} > {RELOCK_BUDGET_MS:.0f} ms)")
+            ok = False
+    return ok
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# POINT D'ENTRÉE
+# ───────────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks MAIN LOL")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    startup = sub.add_parser("startup", help="Temps d'import, de premier rendu et de fermeture")
+    startup.add_argument("--runs", type=int, default=3)
+    startup.add_argument("--no-gui", action="store_true", help="Ne pas lancer la fenêtre")
+    
+    headless = sub.add_parser("headless", help="Démarrage et mémoire: headless vs graphique")
+    headless.add_argument("--runs", type=int, default=3)
+    headless.add_argument("--no-gui", action="store_true", help="Ne mesurer que le mode headless")
+    
+    events = sub.add_parser("events", help="Latence publication -> traitement du bus d'événements")
+    events.add_argument("--runs", type=int, default=3)
+    events.add_argument("--events", type=int, default=1000, help="Événements publiés par mesure")
+    
+    discovery = sub.add_parser("discovery", help="Découverte du client: lockfile vs recherche de processus")
+    discovery.add_argument("--runs", type=int, default=3)
+    discovery.add_argument("--polls", type=int, default=200, help="Passages mesurés par mode")
+    
+    lockin = sub.add_parser("lockin", help="Verrouillage du champion avec le limiteur de débit saturé")
+    lockin.add_argument("--runs", type=int, default=3)
+    
+    instance = sub.add_parser("instance", help="Lancements simultanés: un seul propriétaire du verrou")
+    instance.add_argument("--runs", type=int, default=3)
+    instance.add_argument("--processes", type=int, default=4, help="Lancements simultanés par essai")
+    
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"   MAIN LOL - Benchmark : {args.command}")
+    print("=" * 60)
+    
+    results: Dict[str, bool] = {}
+    if args.command == "startup":
+        results["startup"] = bench_startup(args.runs, with_gui=not args.no_gui)
+    elif args.command == "headless":
+        results["headless"] = bench_headless(args.runs, with_gui=not args.no_gui)
+    elif args.command == "events":
+        results["events"] = bench_events(args.runs, args.events)
+    elif args.command == "discovery":
+        results["discovery"] = bench_discovery(args.runs, args.polls)
+    elif args.command == "lockin":
+        results["lockin"] = bench_lock_in(args.runs)
+    elif args.command == "instance":
+        results["instance"] = bench_instance(args.runs, args.processes)
+    
+    if all(results.values()):
+        print("\n✅ Budgets respectés")
+    else:
+        print("\n❌ Budget dépassé")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,7 +44,13 @@ def main():
         # Modules du package src (pour être sûr qu'ils sont inclus)
         '--hidden-import=src',
         '--hidden-import=src.config',
+        '--hidden-import=src.cache',
         '--hidden-import=src.core',
+        '--hidden-import=src.events',
+        '--hidden-import=src.headless',
+        '--hidden-import=src.lcu',
+        '--hidden-import=src.startup',
+        '--hidden-import=src.supervisor',
         '--hidden-import=src.ui',
         '--hidden-import=src.utils',
         
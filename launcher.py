@@ -6,181 +6,321 @@ Initialise l'application, gère les threads et la fermeture propre.
 Améliorations v6.1:
 - Chargement asynchrone de DataDragon (ne bloque plus l'UI)
 - Meilleure gestion des erreurs avec logging
+- Import paresseux de l'UI (tray, hotkeys, son et HTTP hors du chemin critique)
+- Graphe de démarrage parallèle chronométré (src/startup.py)
+- Sauvegarde des paramètres différée, regroupée et atomique (ParamsWriter)
+- Logging non bloquant (file + thread d'écriture) avec rotation
+- Instance unique par socket local; un second lancement ré-affiche la fenêtre
+
+Option --startup-probe: affiche le temps jusqu'à la première itération de
+la boucle Tk puis quitte (utilisé par benchmarks.py).
+Option --headless: automatismes sans interface (src/headless.py).
 """
 
+from time import perf_counter
+
+# Référence pour la mesure du démarrage (avant tout import applicatif)
+_STARTUP_T0: float = perf_counter()
+
+import os
 import sys
+import json
 import logging
+from time import sleep
 from threading import Thread
-from typing import Dict, Any
+from typing import Optional, Mapping, FrozenSet, Any
 
-# Imports locaux depuis le package src
+# Imports locaux depuis le package src (l'UI est importée dans MainLoLApplication)
+from src import config
 from src.config import (
-    load_parameters, save_parameters, DEFAULT_PARAMS, 
-    get_cache_dirs, CURRENT_VERSION
+    load_parameters, ParamsStore, ParamsWriter, DEFAULT_PARAMS, 
+    get_cache_dirs, CURRENT_VERSION, cache_max_bytes
+)
+from src.utils import (
+    enable_high_dpi, check_single_instance, set_show_window_handler,
+    release_single_instance, check_for_updates, get_peak_memory_kb
 )
-from src.utils import enable_high_dpi, check_single_instance, remove_lockfile, check_for_updates
 from src.core import DataDragon, WebSocketManager
-from src.ui import LoLAssistantUI
+from src.events import EventBus
+from src.startup import StartupPipeline, STAGE_BACKGROUND, STAGE_DEFERRED
+
+# Préfixe de la ligne émise par --startup-probe
+STARTUP_PROBE_PREFIX = "STARTUP_PROBE"
+
+# Durée maximale de la fermeture coordonnée (quit_app)
+SHUTDOWN_BUDGET_S: float = 3.0
+# Part du budget réservée à l'écriture des paramètres et de l'index du cache
+SHUTDOWN_FLUSH_RESERVE_S: float = 0.5
+# Au-delà, le processus est terminé de force (threads tiers non daemon)
+SHUTDOWN_HARD_LIMIT_S: float = 2.0
 
 
 class MainLoLApplication:
     """Classe principale gérant le cycle de vie de l'application."""
     
-    def __init__(self):
+    def __init__(self, startup_probe: bool = False):
         """
         Initialise l'application MAIN LOL.
         
-        v6.1: DataDragon est maintenant chargé de manière asynchrone
-        pour éviter de bloquer l'interface utilisateur au démarrage.
+        Le démarrage est un graphe d'étapes (src/startup.py): instance
+        unique, paramètres et dossiers de cache en parallèle, puis UI et
+        WebSocketManager sur le thread principal. DataDragon se charge en
+        arrière-plan; WebSocket, son, tray, hotkeys et vérification des
+        mises à jour sont différés après le premier rendu.
+        
+        Args:
+            startup_probe: Quitter dès la première itération de la boucle Tk
         """
+        self._startup_probe = startup_probe
+        self._quitting = False
+        self._params: Optional[ParamsStore] = None
+        self._params_writer = ParamsWriter(self._get_params)
+        self.ui = None
+        self.ws_manager = None
+        
         # Activer High DPI
         enable_high_dpi()
         
-        # Vérifier instance unique
-        if not check_single_instance():
+        # Initialiser DataDragon (NE PAS CHARGER ICI - fait en arrière-plan)
+        self.dd = DataDragon()
+        
+        # Bus d'événements core -> UI (et autres abonnés)
+        self.bus = EventBus()
+        
+        # Graphe de démarrage: les étapes indépendantes tournent en parallèle,
+        # les étapes non critiques attendent la première itération de la boucle Tk
+        self.startup = StartupPipeline(t0=_STARTUP_T0)
+        self._register_startup_stages()
+        self.startup.run_critical()
+        
+        if not self.startup.succeeded("single_instance"):
             logging.info("Une autre instance est déjà en cours. Fermeture.")
             sys.exit(0)
+        if not self.startup.succeeded("core"):
+            for line in self.startup.report_lines():
+                logging.info(line)
+            raise RuntimeError("Échec du démarrage de l'interface (voir le rapport de démarrage)")
         
-        # Charger les paramètres
-        self._params: Dict[str, Any] = load_parameters()
+    def _register_startup_stages(self) -> None:
+        """Déclare les étapes du démarrage et leurs dépendances."""
+        ui = self._get_ui
         
-        # Créer les dossiers de cache
-        get_cache_dirs()
+        # Critiques (avant la boucle Tk)
+        self.startup.add("single_instance", check_single_instance)
+        self.startup.add("params", self._load_params_stage)
+        self.startup.add("cache_dirs", get_cache_dirs)
+        self.startup.add("ui", self._create_ui_stage, deps=("single_instance", "params"), main_thread=True)
+        self.startup.add("core", self._create_core_stage, deps=("ui",), main_thread=True)
         
-        # Initialiser DataDragon (NE PAS CHARGER ICI - fait en async)
-        logging.info("Initialisation de DataDragon...")
-        self.dd = DataDragon()
-        # Note: dd.load() sera appelé en arrière-plan
+        # Arrière-plan (non attendu)
+        self.startup.add("datadragon", self._load_datadragon, deps=("cache_dirs", "ui"), kind=STAGE_BACKGROUND)
         
-        # Créer l'interface AVANT de charger DataDragon
+        # Différées (après le premier rendu)
+        self.startup.add("websocket", lambda: self.ws_manager.start(), deps=("core",), kind=STAGE_DEFERRED)
+        self.startup.add("sound", lambda: ui().init_sound(), deps=("ui",), kind=STAGE_DEFERRED)
+        self.startup.add("tray", lambda: ui().create_system_tray(), deps=("ui",), kind=STAGE_DEFERRED)
+        self.startup.add("hotkeys", lambda: ui().setup_hotkeys(), deps=("ui",), kind=STAGE_DEFERRED)
+        # Jamais en concurrence avec les téléchargements DataDragon du démarrage
+        self.startup.add("update_check", self._check_updates, deps=("ui",), kind=STAGE_DEFERRED, after=("datadragon",))
+        self.startup.add("cache_gc", self._prune_cache, deps=("params",), kind=STAGE_DEFERRED, after=("datadragon",))
+    
+    def _get_ui(self):
+        """Retourne l'interface (disponible après l'étape 'ui')."""
+        return self.ui
+    
+    def _load_params_stage(self) -> None:
+        """Étape: charge les paramètres et branche la sauvegarde différée."""
+        self._params = ParamsStore(load_parameters())
+        self._params.subscribe(lambda snapshot, changed: self._params_writer.schedule())
+        self._params.subscribe(self._apply_cache_limit)
+        self._apply_cache_limit(self._params.get(), frozenset({"cache_max_mb"}))
+    
+    def _apply_cache_limit(self, params: Mapping[str, Any], changed: FrozenSet[str]) -> None:
+        """Applique le plafond de taille du cache disque (paramètre cache_max_mb)."""
+        if "cache_max_mb" in changed:
+            self.dd.cache.max_bytes = cache_max_bytes(params)
+    
+    def _prune_cache(self) -> None:
+        """Étape: éviction LRU du cache disque au-delà du plafond."""
+        self.dd.cache.prune()
+        self.dd.cache.flush()
+    
+    def _create_ui_stage(self) -> None:
+        """Étape: crée l'interface (thread principal, import paresseux de l'UI)."""
         logging.info("Création de l'interface...")
+        from src.ui import LoLAssistantUI
         self.ui = LoLAssistantUI(
             dd=self.dd,
-            params=self._params,
+            params=self._params.get(),
             save_callback=self._save_params,
             update_param_callback=self._update_param,
             get_params_callback=self._get_params,
-            quit_callback=self.quit_app
+            quit_callback=self.quit_app,
+            bus=self.bus
         )
         
-        # Créer le gestionnaire WebSocket
+    def _create_core_stage(self) -> None:
+        """Étape: crée le gestionnaire WebSocket et le relie à l'UI."""
         logging.info("Initialisation du WebSocket...")
         self.ws_manager = WebSocketManager(
-            ui_callback=self.ui.on_core_event,
+            bus=self.bus,
             dd=self.dd,
             get_params=self._get_params
         )
-        
-        # Connecter le WS à l'UI
         self.ui.set_ws_manager(self.ws_manager)
+        # Un second lancement ré-affiche la fenêtre de cette instance
+        set_show_window_handler(lambda: self.ui.root.after(0, self.ui.show_window))
         
-        # Charger DataDragon en arrière-plan (v6.1)
-        self._load_datadragon_async()
-        
-        # Vérifier les mises à jour en arrière-plan
-        self._check_updates_async()
-        
-        # Démarrer le WebSocket
-        self.ws_manager.start()
-    
-    def _load_datadragon_async(self) -> None:
+    def _load_datadragon(self) -> None:
         """
-        Charge DataDragon en arrière-plan pour ne pas bloquer l'UI.
+        Charge DataDragon (étape d'arrière-plan, ne bloque pas l'UI).
         
         Une fois chargé, affiche un toast de confirmation.
         """
-        def load_task():
-            try:
-                logging.info("Chargement de DataDragon en arrière-plan...")
-                self.dd.load()
+        try:
+            logging.info("Chargement de DataDragon en arrière-plan...")
+            self.dd.load()
                 
-                # Notifier l'UI que le chargement est terminé
-                champion_count = len(self.dd.all_names)
-                if champion_count > 0:
-                    message = f"Champions chargés ({champion_count})"
-                    self.ui.root.after(0, lambda: self.ui.show_toast(message, duration=1500))
-                    logging.info(f"DataDragon chargé: {champion_count} champions")
-                else:
-                    logging.warning("DataDragon chargé mais sans champions")
+            # Notifier l'UI que le chargement est terminé
+            champion_count = len(self.dd.all_names)
+            if champion_count > 0:
+                message = f"Champions chargés ({champion_count})"
+                self.ui.root.after(0, lambda: self.ui.show_toast(message, duration=1500))
+                logging.info(f"DataDragon chargé: {champion_count} champions")
+            else:
+                logging.warning("DataDragon chargé mais sans champions")
                     
-            except Exception as e:
-                logging.error(f"Erreur lors du chargement de DataDragon: {e}")
-                self.ui.root.after(0, lambda: self.ui.show_toast("Erreur chargement champions", duration=3000))
+        except Exception as e:
+            logging.error(f"Erreur lors du chargement de DataDragon: {e}")
+            self.ui.root.after(0, lambda: self.ui.show_toast("Erreur chargement champions", duration=3000))
+            raise
         
-        # Utiliser le ThreadPoolExecutor de l'UI si disponible
-        if hasattr(self.ui, 'executor'):
-            self.ui.executor.submit(load_task)
-        else:
-            Thread(target=load_task, daemon=True).start()
-    
-    def _get_params(self) -> Dict[str, Any]:
-        """Retourne les paramètres actuels."""
-        return self._params.copy()
+    def _get_params(self) -> Mapping[str, Any]:
+        """Retourne l'instantané courant des paramètres (lecture seule, sans copie)."""
+        return self._params.get()
     
     def _update_param(self, key: str, value: Any) -> None:
-        """Met à jour un paramètre."""
-        self._params[key] = value
+        """Met à jour un paramètre (sauvegarde différée via l'abonnement du ParamsWriter)."""
+        self._params.set(key, value)
     
     def _save_params(self) -> None:
-        """Sauvegarde les paramètres."""
-        if save_parameters(self._params):
+        """Demande une sauvegarde immédiate, écrite hors du thread appelant."""
+        self._params_writer.schedule(immediate=True)
+    
+    def _flush_params(self, timeout: float = 2.0) -> None:
+        """Écrit les paramètres en attente (fermeture)."""
+        if self._params_writer.stop(timeout):
             logging.info("Paramètres sauvegardés avec succès.")
         else:
             logging.error("Échec de la sauvegarde des paramètres.")
+        logging.info(f"[Params] Sauvegardes: {self._params_writer.get_stats()}")
     
-    def _check_updates_async(self) -> None:
-        """Vérifie les mises à jour en arrière-plan."""
-        def check_task():
-            try:
-                new_version = check_for_updates()
-                if new_version:
-                    logging.info(f"Nouvelle version disponible: {new_version}")
-                    # Planifier l'affichage du popup sur le thread UI
-                    self.ui.root.after(0, lambda: self.ui.show_update_popup(new_version))
-                else:
-                    logging.info("Application à jour.")
-            except Exception as e:
-                logging.warning(f"Erreur lors de la vérification des mises à jour: {e}")
-        
-        # Utiliser le ThreadPoolExecutor de l'UI si disponible
-        if hasattr(self.ui, 'executor'):
-            self.ui.executor.submit(check_task)
-        else:
-            Thread(target=check_task, daemon=True).start()
+    def _flush_cache(self, timeout: float) -> None:
+        """Écrit l'index du cache disque dans la limite du délai (écriture atomique)."""
+        writer = Thread(target=self.dd.cache.flush, name="CacheFlush", daemon=True)
+        writer.start()
+        writer.join(timeout)
+        if writer.is_alive():
+            logging.info("[Cache] Index toujours en cours d'écriture, abandonné à la fermeture.")
+    
+    def _check_updates(self) -> None:
+        """Vérifie les mises à jour (étape différée)."""
+        try:
+            new_version = check_for_updates()
+            if new_version:
+                logging.info(f"Nouvelle version disponible: {new_version}")
+                # Planifier l'affichage du popup sur le thread UI
+                self.ui.root.after(0, lambda: self.ui.show_update_popup(new_version))
+            else:
+                logging.info("Application à jour.")
+        except Exception as e:
+            logging.warning(f"Erreur lors de la vérification des mises à jour: {e}")
     
     def run(self) -> None:
         """Lance la boucle principale de l'application."""
         logging.info(f"MAIN LOL v{CURRENT_VERSION} démarré.")
-        try:
-            self.ui.run()
-        finally:
-            self.cleanup()
+        self.ui.run(on_first_iteration=self._on_first_iteration)
+    
+    def _on_first_iteration(self) -> None:
+        """Mesure le temps jusqu'à la première itération de la boucle Tk."""
+        self.startup.run_deferred()
+        first_loop_ms = self.startup.first_iteration_ms
+        logging.info(f"Démarrage: première itération de la boucle Tk à {first_loop_ms:.1f} ms")
+        
+        if self._startup_probe:
+            probe = {"first_loop_ms": round(first_loop_ms, 1), "peak_memory_kb": get_peak_memory_kb()}
+            print(f"{STARTUP_PROBE_PREFIX} {json.dumps(probe)}", flush=True)
+            self.quit_app()
     
     def quit_app(self) -> None:
-        """Ferme l'application proprement."""
+        """
+        Ferme l'application dans la limite de SHUTDOWN_BUDGET_S.
+        
+        Ordre: WebSocket (tâches annulées, connexion fermée), interface
+        (hotkeys, tray, tâches d'images, boucle Tk), bus d'événements,
+        paramètres en attente, index du cache. Les trois premières étapes
+        laissent SHUTDOWN_FLUSH_RESERVE_S aux écritures.
+        Le verrou d'instance et les logs sont libérés par main() à la sortie.
+        """
+        if self._quitting:
+            return
+        self._quitting = True
+        
+        started_at = perf_counter()
+        deadline = started_at + SHUTDOWN_BUDGET_S
         logging.info("Fermeture de l'application...")
-        self._save_params()
-        self.ws_manager.stop()
-        self.ui.stop()
-        self.cleanup()
-    
-    def cleanup(self) -> None:
-        """Nettoyage final avant fermeture."""
-        remove_lockfile()
-        logging.info("Nettoyage terminé.")
+        
+        def remaining(reserve: float = 0.0) -> float:
+            return max(0.0, deadline - reserve - perf_counter())
+        
+        if self.ws_manager is not None:
+            self.ws_manager.stop(timeout=min(1.5, remaining(SHUTDOWN_FLUSH_RESERVE_S)))
+        if self.ui is not None:
+            self.ui.stop(timeout=min(0.5, remaining(SHUTDOWN_FLUSH_RESERVE_S)))
+        self.bus.close(timeout=min(0.2, remaining(SHUTDOWN_FLUSH_RESERVE_S)))
+        self._flush_params(timeout=remaining())
+        self._flush_cache(timeout=remaining())
+        logging.info(f"Fermeture terminée en {(perf_counter() - started_at) * 1000:.0f} ms")
 
 
 def main() -> None:
     """Point d'entrée principal."""
+    if "--headless" in sys.argv:
+        from src import headless
+        sys.exit(headless.main([arg for arg in sys.argv[1:] if arg != "--headless"], t0=_STARTUP_T0))
+    
+    config.init()
+    app: Optional[MainLoLApplication] = None
     try:
-        app = MainLoLApplication()
+        app = MainLoLApplication(startup_probe="--startup-probe" in sys.argv)
         app.run()
     except KeyboardInterrupt:
         logging.info("Interruption clavier détectée.")
     except Exception as e:
         logging.critical(f"Erreur fatale: {e}", exc_info=True)
     finally:
-        remove_lockfile()
+        # Sortie sans quit_app (interruption, erreur fatale): le thread
+        # d'écriture est daemon, les changements en attente seraient perdus.
+        # Sans effet si quit_app a déjà tout écrit.
+        params_writer = getattr(app, "_params_writer", None)
+        if params_writer is not None and not params_writer.stop(SHUTDOWN_FLUSH_RESERVE_S):
+            logging.error("Échec de la sauvegarde des paramètres.")
+        release_single_instance()
+        logging.info("Nettoyage terminé.")
+        config.shutdown_logging()
+        _start_exit_watchdog(SHUTDOWN_HARD_LIMIT_S)
+
+
+def _start_exit_watchdog(delay_s: float) -> None:
+    """
+    Garantit la sortie du processus: si des threads non daemon (hooks
+    clavier, tray...) le retiennent encore après delay_s, il est terminé.
+    """
+    def watchdog():
+        sleep(delay_s)
+        os._exit(0)
+    
+    Thread(target=watchdog, name="ExitWatchdog", daemon=True).start()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,309 @@
+"""
+MAIN LOL - Module Cache
+-----------------------
+Cache disque persistant (AppData/MainLoL/cache), organisé par espaces de
+noms versionnés (ex: "ddragon/14.1.1/champion"), plafonné en taille avec
+éviction LRU.
+
+L'heure de dernier accès de chaque fichier est sa date de modification,
+mise à jour à chaque lecture: l'ordre LRU survit ainsi aux redémarrages
+sans index séparé. Les ETag des téléchargements sont conservés dans
+index.json pour permettre des requêtes conditionnelles lors d'un
+changement de version.
+
+Usage:
+    python -m src.cache stats
+    python -m src.cache prune [--max-mb N]
+"""
+
+import os
+import sys
+import json
+import logging
+from threading import Lock
+from typing import Optional, Dict, Any, List, Tuple
+
+from .config import CACHE_ROOT, CACHE_MAX_MB, write_json_atomic, load_parameters, cache_max_bytes
+
+
+# Fichier d'index (ETag par entrée), à la racine: exclu de l'éviction
+INDEX_FILENAME = "index.json"
+
+
+class DiskCache:
+    """Cache disque versionné, plafonné en taille, avec éviction LRU."""
+    
+    def __init__(self, root: str = CACHE_ROOT, max_bytes: int = CACHE_MAX_MB * 1024 * 1024):
+        """
+        Args:
+            root: Dossier racine du cache
+            max_bytes: Taille totale maximale en octets
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_dirty: bool = False
+        
+        # Métriques
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidated: int = 0
+        self.evicted: int = 0
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # CHEMINS & INDEX
+    # ───────────────────────────────────────────────────────────────────────
+    
+    @staticmethod
+    def _key(namespace: str, filename: str) -> str:
+        """Clé d'index d'une entrée (séparateurs '/')."""
+        return f"{namespace.strip('/')}/{filename}"
+    
+    def path(self, namespace: str, filename: str) -> str:
+        """Retourne le chemin disque d'une entrée (qu'elle existe ou non)."""
+        return os.path.join(self.root, *namespace.strip("/").split("/"), filename)
+    
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Charge l'index à la première utilisation (appelé sous verrou)."""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.root, INDEX_FILENAME), "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                self._index = index if isinstance(index, dict) else {}
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+    
+    def flush(self) -> None:
+        """Enregistre l'index s'il a changé."""
+        with self._lock:
+            if not self._index_dirty or self._index is None:
+                return
+            index = dict(self._index)
+            self._index_dirty = False
+        try:
+            write_json_atomic(os.path.join(self.root, INDEX_FILENAME), index)
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"[Cache] Index non enregistré: {e}")
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # LECTURE / ÉCRITURE
+    # ───────────────────────────────────────────────────────────────────────
+    
+    def get(self, namespace: str, filename: str) -> Optional[str]:
+        """
+        Retourne le chemin d'une entrée présente et la marque comme récemment utilisée.
+        
+        Returns:
+            Chemin du fichier ou None si absent
+        """
+        path = self.path(namespace, filename)
+        try:
+            os.utime(path, None)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+    
+    def put(self, namespace: str, filename: str, data: bytes, etag: Optional[str] = None) -> str:
+        """
+        Écrit une entrée de manière atomique.
+        
+        Args:
+            namespace: Espace de noms (ex: "ddragon/14.1.1/champion")
+            filename: Nom du fichier
+            data: Contenu
+            etag: ETag HTTP du contenu, pour les revalidations futures
+        
+        Returns:
+            Chemin du fichier écrit
+        """
+        path = self.path(namespace, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._set_etag(self._key(namespace, filename), etag)
+        return path
+    
+    def _set_etag(self, key: str, etag: Optional[str]) -> None:
+        """Mémorise (ou oublie) l'ETag d'une entrée."""
+        with self._lock:
+            index = self._load_index()
+            if etag:
+                index[key] = {"etag": etag}
+                self._index_dirty = True
+            elif index.pop(key, None) is not None:
+                self._index_dirty = True
+    
+    def find_previous(self, namespace_prefix: str, subdir: str, filename: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Cherche la même entrée dans une autre version (la plus récemment utilisée).
+        
+        Args:
+            namespace_prefix: Préfixe versionné (ex: "ddragon")
+            subdir: Sous-dossier sous la version (ex: "champion")
+            filename: Nom du fichier
+        
+        Returns:
+            (chemin, namespace, ETag) ou None si aucune copie avec ETag
+        """
+        base = os.path.join(self.root, *namespace_prefix.strip("/").split("/"))
+        candidates = []
+        try:
+            versions = os.listdir(base)
+        except OSError:
+            return None
+        with self._lock:
+            index = self._load_index()
+            for version in versions:
+                namespace = f"{namespace_prefix.strip('/')}/{version}/{subdir}"
+                entry = index.get(self._key(namespace, filename))
+                path = self.path(namespace, filename)
+                if entry and entry.get("etag") and os.path.isfile(path):
+                    candidates.append((os.path.getmtime(path), path, namespace, entry["etag"]))
+        if not candidates:
+            return None
+        _, path, namespace, etag = max(candidates)
+        return path, namespace, etag
+    
+    def adopt(self, source_path: str, namespace: str, filename: str, etag: str) -> Optional[str]:
+        """
+        Reprend le contenu d'une autre version après revalidation (304).
+        
+        Returns:
+            Chemin de la nouvelle entrée ou None en cas d'échec
+        """
+        try:
+            with open(source_path, "rb") as f:
+                data = f.read()
+            path = self.put(namespace, filename, data, etag)
+        except OSError as e:
+            logging.debug(f"[Cache] Reprise impossible de {source_path}: {e}")
+            return None
+        self.revalidated += 1
+        return path
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # STATISTIQUES & ÉVICTION
+    # ───────────────────────────────────────────────────────────────────────
+    
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """
+        Liste les entrées des espaces de noms: (dernier accès, taille, chemin).
+        Les fichiers à la racine (index, données DataDragon) ne sont pas concernés.
+        """
+        entries = []
+        for folder, _, files in os.walk(self.root):
+            if folder == self.root:
+                continue
+            for name in files:
+                path = os.path.join(folder, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def stats(self) -> Dict[str, Any]:
+        """Retourne la taille du cache par espace de noms et les métriques d'accès."""
+        entries = self._scan()
+        namespaces: Dict[str, Dict[str, int]] = {}
+        for _, size, path in entries:
+            relative = os.path.relpath(os.path.dirname(path), self.root).replace(os.sep, "/")
+            bucket = namespaces.setdefault(relative, {"files": 0, "bytes": 0})
+            bucket["files"] += 1
+            bucket["bytes"] += size
+        return {
+            "root": self.root,
+            "files": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "namespaces": namespaces,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evicted": self.evicted,
+        }
+    
+    def prune(self, max_bytes: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à passer sous le plafond.
+        
+        Args:
+            max_bytes: Plafond (self.max_bytes par défaut)
+        
+        Returns:
+            (nombre de fichiers supprimés, octets libérés)
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        removed = freed = 0
+        
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            freed += size
+            relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+            self._set_etag(relative, None)
+        
+        if removed:
+            self.evicted += removed
+            self._remove_empty_dirs()
+            self.flush()
+            logging.info(f"[Cache] {removed} fichiers supprimés ({freed / 1024:.0f} Ko libérés)")
+        return removed, freed
+    
+    def _remove_empty_dirs(self) -> None:
+        """Supprime les dossiers de version devenus vides."""
+        for folder, dirs, files in os.walk(self.root, topdown=False):
+            if folder != self.root and not dirs and not files:
+                try:
+                    os.rmdir(folder)
+                except OSError:
+                    pass
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# POINT D'ENTRÉE (python -m src.cache)
+# ───────────────────────────────────────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Commandes stats et prune du cache."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="python -m src.cache", description="Cache disque MAIN LOL")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Taille du cache par espace de noms")
+    prune = sub.add_parser("prune", help="Éviction LRU jusqu'au plafond")
+    prune.add_argument("--max-mb", type=float, default=None, help="Plafond en Mo (défaut: cache_max_mb de parameters.json)")
+    args = parser.parse_args(argv)
+    
+    cache = DiskCache(max_bytes=cache_max_bytes(load_parameters()))
+    if args.command == "stats":
+        stats = cache.stats()
+        print(f"Cache : {stats['root']}")
+        print(f"Total : {stats['files']} fichiers, {stats['bytes'] / 1024 / 1024:.1f} Mo "
+              f"(plafond {stats['max_bytes'] / 1024 / 1024:.0f} Mo)")
+        for namespace, bucket in sorted(stats["namespaces"].items()):
+            print(f"   {namespace:<40} {bucket['files']:6d} fichiers {bucket['bytes'] / 1024:10.0f} Ko")
+    else:
+        max_bytes = None if args.max_mb is None else int(args.max_mb * 1024 * 1024)
+        removed, freed = cache.prune(max_bytes)
+        print(f"{removed} fichiers supprimés, {freed / 1024 / 1024:.1f} Mo libérés")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
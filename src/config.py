@@ -2,21 +2,24 @@
 MAIN LOL - Module de Configuration
 ----------------------------------
 Contient toutes les constantes, endpoints, et la gestion des paramètres.
+
+L'import de ce module est sans effet de bord: les chemins sont calculés
+sans toucher au disque, et la création des dossiers ainsi que la
+configuration du logging sont faites par init(), appelé par le launcher.
 """
 
 import os
 import sys
 import json
+import time
+import queue
 import tempfile
 import logging
-from typing import Dict, Any, Optional
-
-# ───────────────────────────────────────────────────────────────────────────
-# LOGGING CONFIGURATION (configured after get_appdata_path is defined below)
-# ───────────────────────────────────────────────────────────────────────────
-
-# Note: logging.basicConfig is called at the end of this file to ensure
-# the log file is ALWAYS in AppData, never in the project root.
+import logging.handlers
+from time import perf_counter
+from types import MappingProxyType
+from threading import Thread, Condition, Lock
+from typing import Dict, Any, Optional, Callable, Mapping, FrozenSet, List, Tuple
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -26,6 +29,8 @@ from typing import Dict, Any, Optional
 CURRENT_VERSION: str = "6.1"
 GITHUB_REPO_URL: str = "https://github.com/qurnt1/main_lol_2"
 GITHUB_RELEASES_API: str = "https://api.github.com/repos/qurnt1/main_lol_2/releases/latest"
+# Durée de validité du résultat de la vérification des mises à jour
+UPDATE_CHECK_TTL_S: int = 6 * 3600
 
 # ───────────────────────────────────────────────────────────────────────────
 # DATA DRAGON URLS
@@ -45,12 +50,16 @@ URL_DD_SPLASH: str = "https://ddragon.leagueoflegends.com/cdn/img/champion/splas
 EP_SESSION: str = "/lol-champ-select/v1/session"
 EP_SESSION_TIMER: str = "/lol-champ-select/v1/session/timer"
 EP_SESSION_LEGACY: str = "/lol-champ-select-legacy/v1/session"
+EP_SESSION_TIMER_LEGACY: str = "/lol-champ-select-legacy/v1/session/timer"
 EP_GAMEFLOW: str = "/lol-gameflow/v1/gameflow-phase"
 EP_READY_CHECK: str = "/lol-matchmaking/v1/ready-check"
 EP_PICKABLE: str = "/lol-champ-select/v1/pickable-champion-ids"
 EP_CURRENT_SUMMONER: str = "/lol-summoner/v1/current-summoner"
 EP_CHAT_ME: str = "/lol-chat/v1/me"
 EP_LOGIN: str = "/lol-login/v1/session"
+EP_REGION_LOCALE_OLD: str = "/riotclient/get_region_locale"
+EP_REGION_LOCALE: str = "/riotclient/region-locale"
+EP_BUILDS: str = "/system/v1/builds"
 
 # ───────────────────────────────────────────────────────────────────────────
 # GAME DATA MAPPINGS
@@ -105,6 +114,12 @@ DEFAULT_PARAMS: Dict[str, Any] = {
     "auto_play_again_enabled": False,
     "auto_hide_on_connect": True,
     "close_app_on_lol_exit": True,
+    "cache_max_mb": 100,
+    # Découverte du client: "auto" (lockfile si le dossier d'installation
+    # existe, sinon recherche de processus), "lockfile" ou "process"
+    "client_discovery": "auto",
+    # Dossier d'installation de LoL ("" = emplacements par défaut)
+    "lol_install_dir": "",
 }
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -138,9 +153,23 @@ def resource_path(relative_path: str) -> str:
 
 
 
+def get_app_folder() -> Optional[str]:
+    """
+    Retourne le dossier AppData de l'application (sans le créer).
+    
+    Returns:
+        Chemin de AppData/MainLoL/ ou None si APPDATA n'est pas défini
+    """
+    app_data_dir = os.getenv('APPDATA')
+    if not app_data_dir:
+        return None
+    return os.path.join(app_data_dir, "MainLoL")
+
+
 def get_appdata_path(filename: str) -> str:
     """
     Retourne le chemin vers un fichier dans le dossier AppData de l'application.
+    Calcul pur: le dossier est créé par init().
     
     Args:
         filename: Nom du fichier
@@ -148,17 +177,9 @@ def get_appdata_path(filename: str) -> str:
     Returns:
         Chemin complet vers le fichier dans AppData/MainLoL/
     """
-    app_data_dir = os.getenv('APPDATA')
-    if not app_data_dir:
+    app_folder = get_app_folder()
+    if not app_folder:
         return filename
-    
-    app_folder = os.path.join(app_data_dir, "MainLoL")
-    if not os.path.exists(app_folder):
-        try:
-            os.makedirs(app_folder)
-        except OSError:
-            return filename
-    
     return os.path.join(app_folder, filename)
 
 
@@ -167,15 +188,62 @@ def get_appdata_path(filename: str) -> str:
 # ───────────────────────────────────────────────────────────────────────────
 
 PARAMETERS_PATH: str = get_appdata_path("parameters.json")
-LOCKFILE_PATH: str = os.path.join(tempfile.gettempdir(), 'main_lol.lock')
-DDRAGON_CACHE_FILE: str = os.path.join(tempfile.gettempdir(), "mainlol_ddragon_champions.json")
-ICONS_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "mainlol_icons")
-SPELLS_CACHE_DIR: str = os.path.join(tempfile.gettempdir(), "mainlol_spells")
+UPDATE_CHECK_CACHE_PATH: str = get_appdata_path("update_check.json")
+# Port local du verrou d'instance unique (voir utils.SingleInstanceLock)
+SINGLE_INSTANCE_PORT: int = 47319
+# Cache persistant (voir src/cache.py): AppData/MainLoL/cache
+CACHE_ROOT: str = get_appdata_path("cache")
+CACHE_MAX_MB: int = DEFAULT_PARAMS["cache_max_mb"]
+DDRAGON_CACHE_FILE: str = os.path.join(CACHE_ROOT, "ddragon_champions.json")
+# Endpoints LCU disponibles par version du client (voir src/lcu.py)
+LCU_CAPABILITIES_FILE: str = os.path.join(CACHE_ROOT, "lcu_capabilities.json")
+
+# Découverte du client par son lockfile (voir src/lcu.py)
+LOL_INSTALL_DIRS: tuple = (
+    "C:/Riot Games/League of Legends",
+    "D:/Riot Games/League of Legends",
+)
+LOCKFILE_NAME: str = "lockfile"
+# Intervalle de recherche du client (lockfile ou processus)
+CLIENT_POLL_INTERVAL_S: float = 0.5
+
+# Limites de requêtes LCU par classe (voir src/lcu.py): (jetons par seconde,
+# rafale), None = illimité. Surchargeables via "lcu_rate_limits" dans
+# parameters.json, ex: {"write": [5, 3]}.
+#   read/write: toute requête GET / autre (attend un jeton)
+#   priority:   verrouillage du champion (jamais freiné)
+#   hover, action, cs_timer: tentatives abandonnées sans jeton
+LCU_RATE_LIMITS: Dict[str, Optional[Tuple[float, int]]] = {
+    "read": (20.0, 10),
+    "write": (5.0, 3),
+    "priority": None,
+    "hover": (2.0, 1),
+    "action": (10.0, 1),
+    "cs_timer": (5.0, 1),
+}
 
 # ───────────────────────────────────────────────────────────────────────────
 # PARAMETERS MANAGEMENT
 # ───────────────────────────────────────────────────────────────────────────
 
+def cache_max_bytes(params: Mapping[str, Any]) -> int:
+    """
+    Plafond du cache disque en octets (paramètre cache_max_mb).
+    
+    Args:
+        params: Paramètres de l'application
+        
+    Returns:
+        Plafond en octets (CACHE_MAX_MB si la valeur est invalide)
+    """
+    try:
+        megabytes = float(params.get("cache_max_mb", CACHE_MAX_MB))
+    except (TypeError, ValueError):
+        logging.warning(f"cache_max_mb invalide: {params.get('cache_max_mb')!r}, {CACHE_MAX_MB} Mo utilisés")
+        megabytes = CACHE_MAX_MB
+    return int(megabytes * 1024 * 1024)
+
+
 def load_parameters() -> Dict[str, Any]:
     """
     Charge les paramètres depuis le fichier JSON.
@@ -198,9 +266,43 @@ def load_parameters() -> Dict[str, Any]:
         return DEFAULT_PARAMS.copy()
 
 
-def save_parameters(params: Dict[str, Any]) -> bool:
+def write_json_atomic(path: str, data: Any) -> None:
     """
-    Sauvegarde les paramètres dans le fichier JSON.
+    Écrit un fichier JSON de manière atomique.
+    
+    Fichier temporaire dans le même dossier puis os.replace(), pour qu'un
+    arrêt brutal ne laisse jamais un fichier tronqué.
+    
+    Args:
+        path: Chemin du fichier
+        data: Données sérialisables en JSON
+    
+    Raises:
+        OSError, TypeError, ValueError: En cas d'échec (le fichier existant est conservé)
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=folder or None
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_parameters(params: Mapping[str, Any]) -> bool:
+    """
+    Sauvegarde les paramètres dans le fichier JSON (écriture atomique).
     
     Args:
         params: Dictionnaire des paramètres à sauvegarder
@@ -209,33 +311,402 @@ def save_parameters(params: Dict[str, Any]) -> bool:
         True si succès, False sinon
     """
     try:
-        os.makedirs(os.path.dirname(PARAMETERS_PATH), exist_ok=True)
-        with open(PARAMETERS_PATH, 'w', encoding='utf-8') as f:
-            json.dump(params, f, indent=4, ensure_ascii=False)
+        write_json_atomic(PARAMETERS_PATH, dict(params))
         return True
-    except (IOError, OSError) as e:
+    except (IOError, OSError, TypeError, ValueError) as e:
         logging.error(f"Erreur sauvegarde paramètres: {e}")
         return False
 
 
+class ParamsStore:
+    """
+    Paramètres sous forme d'instantanés immuables et versionnés.
+    
+    Chaque mise à jour construit un nouveau dictionnaire et remplace
+    l'instantané courant d'un bloc: les lecteurs (thread Tk, boucle
+    asyncio) obtiennent une vue cohérente en lecture seule, sans copie.
+    Les abonnés sont notifiés des clés modifiées.
+    """
+    
+    def __init__(self, initial: Mapping[str, Any]):
+        """
+        Args:
+            initial: Paramètres de départ
+        """
+        self._lock = Lock()
+        self._snapshot: Mapping[str, Any] = MappingProxyType(dict(initial))
+        self._version: int = 0
+        self._subscribers: List[Callable[[Mapping[str, Any], FrozenSet[str]], None]] = []
+    
+    def get(self) -> Mapping[str, Any]:
+        """Retourne l'instantané courant (lecture seule, sans copie)."""
+        return self._snapshot
+    
+    @property
+    def version(self) -> int:
+        """Version de l'instantané courant (incrémentée à chaque changement)."""
+        return self._version
+    
+    def get_versioned(self) -> Tuple[int, Mapping[str, Any]]:
+        """Retourne (version, instantané) de manière cohérente."""
+        with self._lock:
+            return self._version, self._snapshot
+    
+    def update(self, changes: Mapping[str, Any]) -> bool:
+        """
+        Applique des modifications et publie un nouvel instantané.
+        
+        Args:
+            changes: Clés et nouvelles valeurs
+        
+        Returns:
+            True si au moins une valeur a changé
+        """
+        with self._lock:
+            current = self._snapshot
+            changed = frozenset(
+                key for key, value in changes.items()
+                if key not in current or current[key] != value
+            )
+            if not changed:
+                return False
+            new_params = dict(current)
+            for key in changed:
+                new_params[key] = changes[key]
+            snapshot = MappingProxyType(new_params)
+            self._snapshot = snapshot
+            self._version += 1
+            subscribers = list(self._subscribers)
+        
+        for callback in subscribers:
+            try:
+                callback(snapshot, changed)
+            except Exception as e:
+                logging.error(f"Erreur abonné paramètres: {e}", exc_info=True)
+        return True
+    
+    def set(self, key: str, value: Any) -> bool:
+        """Modifie un paramètre (voir update)."""
+        return self.update({key: value})
+    
+    def subscribe(self, callback: Callable[[Mapping[str, Any], FrozenSet[str]], None]) -> Callable[[], None]:
+        """
+        Abonne un callback aux changements (appelé sur le thread qui modifie).
+        
+        Args:
+            callback: Fonction (instantané, clés modifiées)
+        
+        Returns:
+            Fonction de désabonnement
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        
+        return unsubscribe
+
+
+class ParamsWriter:
+    """
+    Sauvegarde différée (write-behind) des paramètres.
+    
+    Les demandes rapprochées sont regroupées: l'écriture a lieu
+    SAVE_DEBOUNCE_S après la dernière demande, sur un thread dédié,
+    jamais sur le thread appelant (Tk). flush() écrit immédiatement
+    les changements en attente (fermeture de l'application).
+    """
+    
+    # Délai de regroupement des demandes de sauvegarde
+    SAVE_DEBOUNCE_S: float = 0.5
+    
+    def __init__(self, get_snapshot: Callable[[], Mapping[str, Any]], debounce_s: Optional[float] = None):
+        """
+        Args:
+            get_snapshot: Fonction retournant les paramètres à écrire
+            debounce_s: Délai de regroupement (SAVE_DEBOUNCE_S par défaut)
+        """
+        self._get_snapshot = get_snapshot
+        self._debounce_s = self.SAVE_DEBOUNCE_S if debounce_s is None else debounce_s
+        self._cond = Condition()
+        
+        self._dirty_since: Optional[float] = None
+        self._deadline: float = 0.0
+        self._pending_version: int = 0
+        self._written_version: int = 0
+        self._stopped: bool = False
+        
+        # Métriques
+        self._requests: int = 0
+        self._writes: int = 0
+        self._failures: int = 0
+        self._latency_total_ms: float = 0.0
+        self._latency_max_ms: float = 0.0
+        self._write_total_ms: float = 0.0
+        
+        self._thread = Thread(target=self._worker, name="ParamsWriter", daemon=True)
+        self._thread.start()
+    
+    def schedule(self, immediate: bool = False) -> None:
+        """
+        Demande une sauvegarde (non bloquant).
+        
+        Args:
+            immediate: Écrire sans attendre le délai de regroupement
+        """
+        with self._cond:
+            now = perf_counter()
+            self._requests += 1
+            self._pending_version += 1
+            if self._dirty_since is None:
+                self._dirty_since = now
+            self._deadline = now if immediate else now + self._debounce_s
+            self._cond.notify()
+    
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Écrit les changements en attente et attend la fin de l'écriture.
+        
+        Returns:
+            True si tout est écrit, False en cas d'échec ou de délai dépassé
+        """
+        with self._cond:
+            if self._pending_version == self._written_version:
+                return True
+            self._deadline = perf_counter()
+            self._cond.notify_all()
+            target = self._pending_version
+            self._cond.wait_for(
+                lambda: self._written_version >= target or not self._thread.is_alive(),
+                timeout=timeout
+            )
+            return self._written_version >= target
+    
+    def stop(self, timeout: float = 2.0) -> bool:
+        """Écrit les changements en attente puis arrête le thread d'écriture."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+    
+    def _worker(self) -> None:
+        """Boucle du thread d'écriture."""
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._pending_version != self._written_version:
+                        remaining = self._deadline - perf_counter()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._pending_version == self._written_version:
+                    return
+                version = self._pending_version
+                dirty_since = self._dirty_since
+            
+            started_at = perf_counter()
+            ok = save_parameters(self._get_snapshot())
+            finished_at = perf_counter()
+            
+            with self._cond:
+                if ok:
+                    self._writes += 1
+                    self._write_total_ms += (finished_at - started_at) * 1000
+                    latency_ms = (finished_at - dirty_since) * 1000
+                    self._latency_total_ms += latency_ms
+                    self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+                    self._written_version = version
+                    self._dirty_since = None if version == self._pending_version else finished_at
+                else:
+                    self._failures += 1
+                    if self._stopped:
+                        # Abandonner: ne pas boucler sur un disque en erreur à la fermeture
+                        self._written_version = self._pending_version
+                    else:
+                        self._deadline = finished_at + self._debounce_s
+                self._cond.notify_all()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les métriques de sauvegarde."""
+        with self._cond:
+            writes = self._writes
+            return {
+                "requests": self._requests,
+                "writes": writes,
+                "coalesced": max(0, self._requests - writes - self._failures),
+                "failures": self._failures,
+                "pending": self._pending_version != self._written_version,
+                "latency_avg_ms": round(self._latency_total_ms / writes, 1) if writes else 0.0,
+                "latency_max_ms": round(self._latency_max_ms, 1),
+                "write_avg_ms": round(self._write_total_ms / writes, 2) if writes else 0.0,
+            }
+
+
 def get_cache_dirs() -> None:
-    """Crée les dossiers de cache s'ils n'existent pas."""
-    for cache_dir in [ICONS_CACHE_DIR, SPELLS_CACHE_DIR]:
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir, exist_ok=True)
+    """Crée le dossier racine du cache s'il n'existe pas."""
+    os.makedirs(CACHE_ROOT, exist_ok=True)
 
 
 # ───────────────────────────────────────────────────────────────────────────
 # LOGGING CONFIGURATION (STRICT: AppData ONLY)
 # ───────────────────────────────────────────────────────────────────────────
 
-def _setup_logging() -> str:
+# Rotation du fichier de log
+LOG_MAX_BYTES: int = 2 * 1024 * 1024
+LOG_BACKUP_COUNT: int = 3
+
+# File d'attente entre les threads applicatifs et le thread d'écriture
+LOG_QUEUE_SIZE: int = 10000
+# Au-delà de ce délai entre émission et écriture, un enregistrement est compté "retardé"
+LOG_DELAY_THRESHOLD_S: float = 0.1
+# Délai maximal pour vider la file à l'arrêt du logging
+LOG_STOP_TIMEOUT_S: float = 1.0
+
+LOG_FORMAT: str = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+
+# Niveau par sous-système: modules de src/ (core, ui, config, utils, startup,
+# launcher) ou nom de logger tiers (lcu-driver, urllib3, PIL...).
+# Surchargeable via la variable d'environnement MAINLOL_LOG_LEVELS,
+# ex: "core=DEBUG,ui=WARNING,lcu-driver=ERROR".
+LOG_DEFAULT_LEVEL: int = logging.INFO
+LOG_LEVELS: Dict[str, int] = {
+    "lcu-driver": logging.WARNING,
+    "urllib3": logging.WARNING,
+    "PIL": logging.WARNING,
+}
+
+
+def _parse_log_levels(spec: str) -> Dict[str, int]:
+    """
+    Parse une spécification "sous-système=NIVEAU,..." (entrées invalides ignorées).
+    
+    Args:
+        spec: Spécification, ex: "core=DEBUG,ui=WARNING"
+    
+    Returns:
+        Niveaux par sous-système
+    """
+    levels: Dict[str, int] = {}
+    for item in spec.split(","):
+        name, _, level_name = item.partition("=")
+        level = logging.getLevelName(level_name.strip().upper())
+        if name.strip() and isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+class _SubsystemFilter(logging.Filter):
+    """
+    Applique le niveau du sous-système d'un enregistrement.
+    
+    Les appels logging.info() du projet passent par le logger racine: le
+    sous-système est alors déduit du module émetteur.
+    """
+    
+    def __init__(self, levels: Dict[str, int], default_level: int):
+        super().__init__()
+        self._levels = levels
+        self._default_level = default_level
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.name == "root":
+            subsystem = record.module
+        else:
+            subsystem = record.name.split(".")[0]
+        return record.levelno >= self._levels.get(subsystem, self._default_level)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler non bloquant: si la file est pleine, l'enregistrement est abandonné."""
+    
+    def __init__(self, log_queue: "queue.Queue"):
+        super().__init__(log_queue)
+        self.emitted: int = 0
+        self.dropped: int = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.emitted += 1
+        except queue.Full:
+            self.dropped += 1
+
+
+class _TimedRotatingWriter(logging.handlers.RotatingFileHandler):
+    """Fichier de log à rotation qui mesure le délai émission → écriture."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.written: int = 0
+        self.delayed: int = 0
+        self.max_delay_ms: float = 0.0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        delay_s = time.time() - record.created
+        self.written += 1
+        if delay_s > LOG_DELAY_THRESHOLD_S:
+            self.delayed += 1
+        self.max_delay_ms = max(self.max_delay_ms, delay_s * 1000)
+        super().emit(record)
+
+
+class _BoundedQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener dont l'arrêt est borné: la version standard dépose sa
+    sentinelle avec put_nowait (queue.Full si la file est pleine) puis attend
+    le thread sans limite.
+    """
+    
+    def stop(self, timeout: float = LOG_STOP_TIMEOUT_S) -> bool:
+        """
+        Dépose la sentinelle (en attendant de la place) et attend la fin du thread.
+        
+        Returns:
+            True si la file est vidée et le thread terminé dans le délai
+        """
+        thread = self._thread
+        if thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(self._sentinel, timeout=timeout)
+        except queue.Full:
+            return False
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            return False
+        self._thread = None
+        return True
+
+
+_log_handler: Optional[_DroppingQueueHandler] = None
+_log_writer: Optional[_TimedRotatingWriter] = None
+_log_listener: Optional[_BoundedQueueListener] = None
+
+
+def _setup_logging(console: bool = False) -> str:
     """
     Configure le logging vers AppData/MainLoL/app_debug.log.
     
+    Les threads applicatifs (boucle LCU, thread Tk) ne font que déposer les
+    enregistrements dans une file bornée; un thread dédié les écrit dans un
+    fichier à rotation.
+    
+    Args:
+        console: Écrire aussi les enregistrements sur la sortie d'erreur (mode headless)
+    
     Returns:
         Chemin absolu du fichier de log
     """
+    global _log_handler, _log_writer, _log_listener
+    
     # STRICT: Le log doit TOUJOURS être dans AppData, JAMAIS à la racine du projet
     app_data_dir = os.getenv('APPDATA')
     if not app_data_dir:
@@ -254,16 +725,95 @@ def _setup_logging() -> str:
     
     log_path = os.path.join(log_folder, "app_debug.log")
     
-    # Configuration du logging
-    logging.basicConfig(
-        filename=log_path,
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        encoding='utf-8'
+    levels = dict(LOG_LEVELS)
+    levels.update(_parse_log_levels(os.getenv("MAINLOL_LOG_LEVELS", "")))
+    
+    _log_writer = _TimedRotatingWriter(
+        log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
     )
+    _log_writer.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    _log_handler = _DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    _log_handler.addFilter(_SubsystemFilter(levels, LOG_DEFAULT_LEVEL))
+    
+    root = logging.getLogger()
+    root.addHandler(_log_handler)
+    # Le filtre décide par sous-système: le logger racine laisse passer le plus bas
+    root.setLevel(min([LOG_DEFAULT_LEVEL] + list(levels.values())))
+    
+    handlers = [_log_writer]
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        handlers.append(console_handler)
+    
+    _log_listener = _BoundedQueueListener(_log_handler.queue, *handlers)
+    _log_listener.start()
     
     return log_path
 
 
-# Initialiser le logging au chargement du module
-LOG_FILE_PATH: str = _setup_logging()
+def get_logging_stats() -> Dict[str, Any]:
+    """Retourne les métriques du logging (émis, écrits, abandonnés, retardés)."""
+    if _log_handler is None or _log_writer is None:
+        return {}
+    return {
+        "emitted": _log_handler.emitted,
+        "written": _log_writer.written,
+        "dropped": _log_handler.dropped,
+        "delayed": _log_writer.delayed,
+        "max_delay_ms": round(_log_writer.max_delay_ms, 1),
+        "queue_depth": _log_handler.queue.qsize(),
+    }
+
+
+def shutdown_logging() -> None:
+    """
+    Journalise les métriques, vide la file et arrête le thread d'écriture.
+    
+    Ne lève jamais: une file encore pleine après LOG_STOP_TIMEOUT_S laisse
+    le thread d'écriture (daemon) finir seul, la fermeture continue.
+    """
+    global _log_listener
+    if _log_listener is None:
+        return
+    logging.info(f"[Logging] {get_logging_stats()}")
+    logging.getLogger().removeHandler(_log_handler)
+    stopped = _log_listener.stop()
+    _log_listener = None
+    if stopped:
+        _log_writer.close()
+
+
+# Chemin effectif du fichier de log (défini par init())
+LOG_FILE_PATH: Optional[str] = None
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# INITIALISATION EXPLICITE
+# ───────────────────────────────────────────────────────────────────────────
+
+def init(console_log: bool = False) -> str:
+    """
+    Prépare l'environnement de l'application: crée le dossier AppData et
+    configure le logging. Idempotent; à appeler par le point d'entrée.
+    
+    Args:
+        console_log: Dupliquer les logs sur la sortie d'erreur
+    
+    Returns:
+        Chemin absolu du fichier de log
+    """
+    global LOG_FILE_PATH
+    if LOG_FILE_PATH is not None:
+        return LOG_FILE_PATH
+    
+    app_folder = get_app_folder()
+    if app_folder:
+        try:
+            os.makedirs(app_folder, exist_ok=True)
+        except OSError as e:
+            logging.warning(f"Impossible de créer {app_folder}: {e}")
+    
+    LOG_FILE_PATH = _setup_logging(console=console_log)
+    return LOG_FILE_PATH
@@ -3,6 +3,9 @@ MAIN LOL - Module Core (Logique Métier)
 ---------------------------------------
 Contient DataDragon, WebSocketManager et la logique de jeu.
 Ce module est agnostique de l'interface (pas d'import tkinter).
+
+Les dépendances lourdes (requests, PIL, lcu_driver) sont importées à la
+première utilisation, hors du chemin critique du démarrage.
 """
 
 import os
@@ -12,27 +15,31 @@ import asyncio
 import logging
 import unicodedata
 from io import BytesIO
-from time import time
+from time import perf_counter, monotonic
 from functools import lru_cache
 from threading import Thread, Event, Lock
-from typing import Optional, Dict, Any, List, Callable, Set
-
-import requests
-from PIL import Image
+from typing import (
+    Optional, Dict, Any, List, Tuple, Callable, Set, Mapping, Iterable, Coroutine,
+    NamedTuple, TYPE_CHECKING
+)
 
-try:
-    from lcu_driver import Connector
-except ImportError:
-    Connector = None
+if TYPE_CHECKING:
+    from PIL import Image
 
 from .config import (
     URL_DD_VERSIONS, URL_DD_CHAMPIONS, URL_DD_SUMMONERS,
     URL_DD_IMG_CHAMP, URL_DD_IMG_SPELL, URL_DD_SPLASH,
-    DDRAGON_CACHE_FILE, ICONS_CACHE_DIR, SPELLS_CACHE_DIR,
+    DDRAGON_CACHE_FILE,
     EP_SESSION, EP_SESSION_TIMER, EP_GAMEFLOW, EP_READY_CHECK,
     EP_CURRENT_SUMMONER, EP_CHAT_ME, EP_LOGIN,
     SUMMONER_SPELL_MAP, PLATFORM_TO_REGION, PHASE_DISPLAY_MAP,
-    get_cache_dirs
+    get_cache_dirs, write_json_atomic
+)
+from .cache import DiskCache
+from .events import EventBus
+from .lcu import (
+    CapabilityRegistry, RateLimiter, get_lcu_classes, configure_discovery,
+    LANE_PRIORITY, LANE_HOVER, LANE_ACTION, LANE_CS_TIMER
 )
 
 
@@ -46,7 +53,12 @@ class DataDragon:
     Gère le cache local et le téléchargement des icônes.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[DiskCache] = None):
+        """
+        Args:
+            cache: Cache disque des icônes (DiskCache par défaut)
+        """
+        self.cache = cache if cache is not None else DiskCache()
         self.loaded: bool = False
         self.version: Optional[str] = None
         self.by_norm_name: Dict[str, int] = {}
@@ -55,7 +67,7 @@ class DataDragon:
         self.all_names: List[str] = []
         self.summoner_data: Dict[str, str] = {}
         self.summoner_loaded: bool = False
-        self._image_cache: Dict[str, Image.Image] = {}
+        self._image_cache: Dict[str, "Image.Image"] = {}
         self._cache_lock = Lock()
     
     @staticmethod
@@ -90,13 +102,12 @@ class DataDragon:
     def _save_cache(self) -> None:
         """Sauvegarde les données dans le cache local."""
         try:
-            with open(DDRAGON_CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump({
-                    "version": self.version,
-                    "by_norm_name": self.by_norm_name,
-                    "by_id": self.by_id,
-                    "name_by_id": self.name_by_id,
-                }, f)
+            write_json_atomic(DDRAGON_CACHE_FILE, {
+                "version": self.version,
+                "by_norm_name": self.by_norm_name,
+                "by_id": self.by_id,
+                "name_by_id": self.name_by_id,
+            })
         except Exception as e:
             logging.warning(f"DataDragon: Erreur sauvegarde cache - {e}")
     
@@ -109,6 +120,8 @@ class DataDragon:
         if self.loaded:
             return
         
+        import requests
+        
         get_cache_dirs()  # S'assurer que les dossiers de cache existent
         
         # Récupérer la version en ligne (une seule fois)
@@ -162,6 +175,8 @@ class DataDragon:
     
     def _fetch_latest_version(self) -> Optional[str]:
         """Récupère la dernière version de Data Dragon depuis l'API."""
+        import requests
+        
         try:
             response = requests.get(URL_DD_VERSIONS, timeout=5)
             response.raise_for_status()
@@ -224,7 +239,7 @@ class DataDragon:
         self.load()
         return self.name_by_id.get(champion_id)
     
-    def get_champion_icon(self, name_or_id: Any) -> Optional[Image.Image]:
+    def get_champion_icon(self, name_or_id: Any) -> Optional["Image.Image"]:
         """
         Récupère l'icône d'un champion avec cache LRU.
         
@@ -252,30 +267,63 @@ class DataDragon:
         if not image_filename:
             return None
         
+        url = URL_DD_IMG_CHAMP.format(version=self.version, filename=image_filename)
+        return self._load_icon(cache_key, "champion", image_filename, url)
+    
+    def _load_icon(self, cache_key: str, subdir: str, filename: str, url: str) -> Optional["Image.Image"]:
+        """
+        Charge une icône depuis le cache disque de la version courante, sinon
+        la télécharge et la met en cache.
+        
+        Après un changement de version, si la même icône existe dans une
+        version précédente, la requête est conditionnelle (If-None-Match):
+        une réponse 304 réutilise le fichier existant sans le re-télécharger.
+        
+        Args:
+            cache_key: Clé du cache mémoire
+            subdir: Type d'icône ("champion" ou "spell")
+            filename: Nom du fichier Data Dragon
+            url: URL de téléchargement
+        
+        Returns:
+            Image PIL ou None en cas d'échec
+        """
+        import requests
+        from PIL import Image
+        
+        namespace = f"ddragon/{self.version}/{subdir}"
+        
         # Vérifier le cache fichier
-        local_path = os.path.join(ICONS_CACHE_DIR, image_filename)
-        if os.path.exists(local_path):
+        local_path = self.cache.get(namespace, filename)
+        if local_path:
             try:
                 img = Image.open(local_path)
+                img.load()
                 with self._cache_lock:
                     self._image_cache[cache_key] = img.copy()
                 return img
             except Exception as e:
-                logging.debug(f"Erreur lecture cache icône {image_filename}: {e}")
+                logging.debug(f"Erreur lecture cache icône {filename}: {e}")
         
-        # Télécharger
-        url = URL_DD_IMG_CHAMP.format(version=self.version, filename=image_filename)
+        # Télécharger (conditionnellement si une version précédente est en cache)
+        previous = self.cache.find_previous("ddragon", subdir, filename)
+        headers = {"If-None-Match": previous[2]} if previous else {}
         try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
+            response = requests.get(url, headers=headers, timeout=5)
+            if response.status_code == 304 and previous:
+                img = Image.open(self.cache.adopt(previous[0], namespace, filename, previous[2]) or previous[0])
+            elif response.status_code == 200:
+                self.cache.put(namespace, filename, response.content, response.headers.get("ETag"))
                 img = Image.open(BytesIO(response.content))
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
-                with self._cache_lock:
-                    self._image_cache[cache_key] = img.copy()
-                return img
+            else:
+                return None
+            
+            img.load()
+            with self._cache_lock:
+                self._image_cache[cache_key] = img.copy()
+            return img
         except Exception as e:
-            logging.warning(f"DataDragon: Erreur téléchargement icône champion - {e}")
+            logging.warning(f"DataDragon: Erreur téléchargement icône {subdir} {filename} - {e}")
         return None
     
     def load_summoners(self) -> None:
@@ -285,6 +333,8 @@ class DataDragon:
         if not self.version:
             self.load()
         
+        import requests
+        
         url = URL_DD_SUMMONERS.format(version=self.version)
         try:
             r = requests.get(url, timeout=5)
@@ -299,7 +349,7 @@ class DataDragon:
         except Exception as e:
             logging.warning(f"DataDragon: Erreur chargement summoners - {e}")
     
-    def get_summoner_icon(self, spell_name: str) -> Optional[Image.Image]:
+    def get_summoner_icon(self, spell_name: str) -> Optional["Image.Image"]:
         """
         Récupère l'icône d'un sort d'invocateur avec cache.
         
@@ -323,33 +373,10 @@ class DataDragon:
         if not image_filename:
             return None
         
-        # Vérifier le cache fichier
-        local_path = os.path.join(SPELLS_CACHE_DIR, image_filename)
-        if os.path.exists(local_path):
-            try:
-                img = Image.open(local_path)
-                with self._cache_lock:
-                    self._image_cache[cache_key] = img.copy()
-                return img
-            except Exception as e:
-                logging.debug(f"Erreur lecture cache icône spell {image_filename}: {e}")
-        
-        # Télécharger
         url = URL_DD_IMG_SPELL.format(version=self.version, filename=image_filename)
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                img = Image.open(BytesIO(response.content))
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
-                with self._cache_lock:
-                    self._image_cache[cache_key] = img.copy()
-                return img
-        except Exception as e:
-            logging.warning(f"DataDragon: Erreur téléchargement icône summoner - {e}")
-        return None
-    
-    def get_splash_art(self, champion_name: str) -> Optional[Image.Image]:
+        return self._load_icon(cache_key, "spell", image_filename, url)
+        
+    def get_splash_art(self, champion_name: str) -> Optional["Image.Image"]:
         """
         Récupère le splash art d'un champion.
         
@@ -363,6 +390,9 @@ class DataDragon:
         if not champion_id:
             return None
         
+        import requests
+        from PIL import Image
+        
         real_name = self.by_id[champion_id].get("id", champion_name)
         url = URL_DD_SPLASH.format(champion=real_name)
         
@@ -379,18 +409,85 @@ class DataDragon:
 # WEBSOCKET MANAGER
 # ───────────────────────────────────────────────────────────────────────────
 
+def register_session_handlers(
+    connector: Any,
+    resolve: Callable[[Any], Optional["WebSocketManager"]]
+) -> None:
+    """
+    Enregistre les handlers LCU sur un connecteur lcu_driver.
+    
+    Chaque événement est transmis à la session (WebSocketManager) associée
+    à la connexion: toujours la même en mode simple, une par client pour
+    le superviseur multi-clients.
+    
+    Args:
+        connector: Connector ou MultipleClientConnector de lcu_driver
+        resolve: Retourne la session d'une connexion (None pour ignorer)
+    """
+    async def on_ready(connection):
+        session = resolve(connection)
+        if session is not None:
+            await session.on_connection_ready(connection)
+    
+    async def on_close(connection):
+        session = resolve(connection)
+        if session is not None:
+            await session.on_connection_close(connection)
+    
+    connector.ready(on_ready)
+    connector.close(on_close)
+    
+    def make_route(method_name: str):
+        async def route(connection, event):
+            session = resolve(connection)
+            if session is not None:
+                await getattr(session, method_name)(connection, event)
+        route.__name__ = method_name
+        return route
+    
+    for uri, method_name in WebSocketManager.WS_ROUTES:
+        connector.ws.register(uri)(make_route(method_name))
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Vue immuable et cohérente de l'état du jeu.
+    
+    Publiée par le thread WebSocket à chaque changement (nouvelle instance,
+    version incrémentée), lue sans verrou par les autres threads.
+    """
+    
+    version: int = 0
+    connected: bool = False
+    phase: str = "None"
+    summoner: str = ""
+    game_name: Optional[str] = None
+    tag_line: Optional[str] = None
+    summoner_id: Optional[int] = None
+    puuid: Optional[str] = None
+    platform_routing: str = "euw1"
+    region_routing: str = "europe"
+    
+    @property
+    def riot_id(self) -> Optional[str]:
+        """Riot ID complet (GameName#TagLine), ou nom du joueur à défaut."""
+        if self.game_name and self.tag_line:
+            return f"{self.game_name}#{self.tag_line}"
+        return self.summoner or None
+
+
 class GameState:
-    """État du jeu partagé entre le WebSocket et l'UI."""
+    """
+    État du jeu.
+    
+    Les champs de travail (actions, anti-spam) n'appartiennent qu'au thread
+    WebSocket. Ce que les autres threads lisent (joueur, région, phase,
+    connexion) est publié dans `snapshot`, remplacé d'un bloc par publish():
+    un lecteur voit toujours une combinaison cohérente.
+    """
     
     def __init__(self):
-        self.current_phase: str = "None"
-        self.summoner: str = ""
-        self.summoner_id: Optional[int] = None
-        self.puuid: Optional[str] = None
-        self.auto_game_name: Optional[str] = None
-        self.auto_tag_line: Optional[str] = None
-        self.platform_routing: str = "euw1"
-        self.region_routing: str = "europe"
+        self.snapshot: GameSnapshot = GameSnapshot()
         self.assigned_position: str = ""
         
         # Flags d'actions
@@ -399,15 +496,30 @@ class GameState:
         self.intent_done: bool = False
         self.completed_actions: Set[int] = set()
         
-        # Timestamps anti-spam
-        self.last_action_try_ts: float = 0.0
-        self.last_intent_try_ts: float = 0.0
+        # Timestamps anti-spam (les tentatives pick/ban/survol/timer passent
+        # par le limiteur de débit, voir RateLimiter)
         self.last_game_start_notify_ts: float = 0.0
         self._last_cs_session_fetch: float = 0.0
-        self._last_cs_timer_fetch: float = 0.0
         self.has_played_accept_sound: bool = False
         self.last_reported_summoner: Optional[str] = None
     
+    def publish(self, **changes: Any) -> bool:
+        """
+        Publie un nouvel instantané si des champs changent (thread WebSocket uniquement).
+        
+        Args:
+            **changes: Champs de GameSnapshot à modifier
+        
+        Returns:
+            True si un nouvel instantané a été publié
+        """
+        current = self.snapshot
+        if all(getattr(current, key) == value for key, value in changes.items()):
+            return False
+        # Une seule affectation: les lecteurs voient l'ancien ou le nouvel instantané
+        self.snapshot = current._replace(version=current.version + 1, **changes)
+        return True
+    
     def reset_between_games(self) -> None:
         """Réinitialise l'état entre les parties."""
         self.completed_actions.clear()
@@ -415,17 +527,115 @@ class GameState:
         self.has_banned = False
         self.intent_done = False
         self.assigned_position = ""
-        self.last_action_try_ts = 0.0
-        self.last_intent_try_ts = 0.0
         self._last_cs_session_fetch = 0.0
-        self._last_cs_timer_fetch = 0.0
         self.has_played_accept_sound = False
 
 
+class PhaseTaskGroup:
+    """
+    Tâches annexes liées à des phases de jeu (ex: sorts en sélection des
+    champions, "rejouer" après la partie).
+    
+    Les tâches sont annulées dès que la phase quitte `phases` ou que le
+    client se déconnecte: une tâche périmée n'appelle jamais l'API pour
+    une partie terminée. Les exceptions sont journalisées.
+    
+    Utilisé depuis la boucle asyncio du WebSocket uniquement; get_stats()
+    est lisible depuis n'importe quel thread.
+    """
+    
+    def __init__(self, name: str, phases: Iterable[str]):
+        """
+        Args:
+            name: Nom du groupe (journaux, métriques)
+            phases: Phases pendant lesquelles les tâches peuvent s'exécuter
+        """
+        self.name = name
+        self.phases = frozenset(phases)
+        self._tasks: Set[asyncio.Task] = set()
+        self.started: int = 0
+        self.completed: int = 0
+        self.cancelled: int = 0
+        self.failed: int = 0
+    
+    @property
+    def outstanding(self) -> int:
+        """Nombre de tâches en cours."""
+        return len(self._tasks)
+    
+    def spawn(self, coro: Coroutine, label: str) -> asyncio.Task:
+        """
+        Lance une tâche rattachée au groupe.
+        
+        Args:
+            coro: Coroutine à exécuter
+            label: Nom de la tâche (journaux)
+        
+        Returns:
+            Tâche créée
+        """
+        task = asyncio.ensure_future(coro)
+        task.set_name(f"{self.name}:{label}")
+        self._tasks.add(task)
+        self.started += 1
+        task.add_done_callback(self._on_done)
+        return task
+    
+    def _on_done(self, task: asyncio.Task) -> None:
+        tracked = task in self._tasks
+        self._tasks.discard(task)
+        if task.cancelled():
+            # Les tâches annulées par cancel_all() y sont déjà comptées
+            if tracked:
+                self.cancelled += 1
+            return
+        error = task.exception()
+        if error is not None:
+            self.failed += 1
+            logging.error(f"[Tasks] {task.get_name()} a échoué: {error}", exc_info=error)
+        else:
+            self.completed += 1
+    
+    def cancel_all(self, reason: str) -> int:
+        """
+        Annule les tâches en cours.
+        
+        Args:
+            reason: Cause de l'annulation (journaux)
+        
+        Returns:
+            Nombre de tâches annulées
+        """
+        tasks = [task for task in self._tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+            # Retirée tout de suite: l'annulation n'aboutit qu'au prochain tour de boucle
+            self._tasks.discard(task)
+        self.cancelled += len(tasks)
+        if tasks:
+            logging.info(f"[Tasks] {len(tasks)} tâche(s) {self.name} annulée(s) ({reason}).")
+        return len(tasks)
+    
+    def on_phase(self, phase: str) -> None:
+        """Annule les tâches si la nouvelle phase n'appartient plus au groupe."""
+        if phase not in self.phases:
+            self.cancel_all(f"phase {phase}")
+    
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "outstanding": self.outstanding,
+            "started": self.started,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+        }
+
+
 class WebSocketManager:
     """
     Gestionnaire WebSocket pour la communication avec le client LoL.
-    Thread-safe: communique avec l'UI via callbacks uniquement.
+    Thread-safe: communique avec l'UI et les autres consommateurs
+    uniquement via le bus d'événements.
     """
     
     # Types d'événements pour les callbacks UI
@@ -434,80 +644,184 @@ class WebSocketManager:
     EVENT_STATUS = "status"
     EVENT_PHASE_CHANGE = "phase_change"
     EVENT_SUMMONER_UPDATE = "summoner_update"
+    EVENT_REGION_UPDATE = "region_update"
     EVENT_CHAMPION_PICKED = "champion_picked"
     EVENT_CHAMPION_BANNED = "champion_banned"
     EVENT_SPELLS_SET = "spells_set"
     EVENT_PLAY_AGAIN = "play_again"
     EVENT_TOAST = "toast"
     
+    # Phases des groupes de tâches annexes (PhaseTaskGroup)
+    CHAMP_SELECT_PHASES = frozenset({"ChampSelect"})
+    POST_GAME_PHASES = frozenset({"WaitingForStats", "EndOfGame"})
+    
     def __init__(
         self, 
-        ui_callback: Callable[[str, Any], None],
+        bus: EventBus,
         dd: DataDragon,
-        get_params: Callable[[], Dict[str, Any]]
+        get_params: Callable[[], Mapping[str, Any]],
+        source: str = ""
     ):
         """
         Initialise le WebSocketManager.
         
         Args:
-            ui_callback: Fonction appelée pour notifier l'UI (thread-safe via root.after)
+            bus: Bus sur lequel les événements EVENT_* sont publiés
             dd: Instance de DataDragon
-            get_params: Fonction retournant les paramètres actuels
+            get_params: Fonction retournant l'instantané courant des paramètres (lecture seule)
+            source: Émetteur indiqué dans les événements (ex: "client 1234")
         """
-        self.ui_callback = ui_callback
+        self.bus = bus
+        self.source = source
         self.dd = dd
         self.get_params = get_params
         
         self.state = GameState()
         self.connection = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
-        self.ws_active: bool = False
+        self._connector = None
+        self._thread: Optional[Thread] = None
         self._stop_event = Event()
         self._cs_tick_lock = asyncio.Lock()
         
         self.game_start_cooldown: float = 12.0
+        
+        # Rafraîchissement joueur/région: fusion des appels concurrents,
+        # région mise en cache pour la durée de la connexion
+        self._refresh_task: Optional[asyncio.Future] = None
+        self._refresh_again: bool = False
+        self._last_refresh_cost: int = 0
+        self._region_connection = None
+        self._region_cost: int = 0
+        self.capabilities = CapabilityRegistry()
+        self._idle_seconds: float = 0.0
+        self._idle_since: Optional[float] = None
+        self.refresh_stats: Dict[str, int] = {
+            "refreshes": 0, "requests": 0, "requests_saved": 0,
+            "deduplicated": 0, "region_cache_hits": 0,
+        }
+        # Trafic WebSocket par phase: phase -> [secondes, messages, octets]
+        self._ws_traffic: Dict[str, List[float]] = {}
+        self._ws_mark: Optional[Tuple[str, float, int, int]] = None
+        
+        # Tâches annexes annulées à la fin de leur phase ou à la déconnexion
+        self.champ_select_tasks = PhaseTaskGroup("champ-select", self.CHAMP_SELECT_PHASES)
+        self.post_game_tasks = PhaseTaskGroup("post-game", self.POST_GAME_PHASES)
+        self._task_groups: Tuple[PhaseTaskGroup, ...] = (self.champ_select_tasks, self.post_game_tasks)
+        
+        # Débit des requêtes LCU, partagé par tous les chemins de la session
+        self.rate_limiter = RateLimiter()
     
-    def _notify_ui(self, event_type: str, data: Any = None) -> None:
-        """Notifie l'UI d'un événement de manière thread-safe."""
-        self.ui_callback(event_type, data)
+    def _publish(self, event_type: str, data: Any = None) -> None:
+        """Publie un événement sur le bus (non bloquant, thread-safe)."""
+        self.bus.publish(event_type, data, self.source)
     
     def start(self) -> None:
-        """Démarre le thread WebSocket."""
-        if Connector is None:
-            self._notify_ui(self.EVENT_STATUS, ("❌ Erreur: 'lcu_driver' manquant.", ""))
-            return
+        """Démarre le thread WebSocket (lcu_driver y est importé)."""
+        self._thread = Thread(target=self._ws_loop, name="WebSocket", daemon=True)
+        self._thread.start()
         
-        thread = Thread(target=self._ws_loop, daemon=True)
-        thread.start()
+    def stop(self, timeout: float = 1.5) -> bool:
+        """
+        Arrête le WebSocket: annule les requêtes et tâches en cours, ferme la
+        connexion LCU et attend la fin du thread dans la limite du délai.
     
-    def stop(self) -> None:
-        """Arrête le WebSocket proprement."""
+        Args:
+            timeout: Délai maximal en secondes
+        
+        Returns:
+            True si le thread WebSocket est terminé
+        """
+        deadline = perf_counter() + timeout
         self._stop_event.set()
+        
+        connector, loop = self._connector, self.loop
+        if connector is not None:
+            # Ne plus rechercher de nouveau client après la connexion courante
+            connector._repeat_flag = False
+        
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        if loop is None or not loop.is_running():
+            # Recherche du processus client en cours (boucle bloquante de
+            # lcu_driver, sans connexion à fermer): thread daemon abandonné
+            return False
+        
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._shutdown_async(), loop)
+            future.result(max(0.0, deadline - perf_counter()))
+        except Exception as e:
+            logging.debug(f"[WS] Arrêt de la boucle: {e}")
+        thread.join(max(0.0, deadline - perf_counter()))
+        if thread.is_alive():
+            # Thread daemon (ex: recherche du processus client): abandonné à la sortie
+            logging.info("[WS] Thread WebSocket toujours actif, abandonné à la fermeture.")
+            return False
+        return True
+    
+    async def _shutdown_async(self) -> None:
+        """Annule les tâches en cours puis ferme le WebSocket (boucle LCU)."""
+        current = asyncio.current_task()
+        pending = [
+            task for task in asyncio.all_tasks()
+            if task is not current and not task.done()
+            # La tâche Connection.init se termine d'elle-même à la fermeture du WebSocket
+            and getattr(task.get_coro(), "__qualname__", "") != "Connection.init"
+        ]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.close_connection()
+    
+    async def close_connection(self) -> None:
+        """Ferme le WebSocket de la connexion courante (boucle LCU)."""
+        connection = self.connection
+        ws = getattr(connection, "_ws", None) if connection is not None else None
+        if connection is not None:
+            connection.closed = True
+        if ws is not None and not ws.closed:
+            await ws.close()
     
     @property
     def is_active(self) -> bool:
         """Retourne True si le WebSocket est connecté."""
-        return self.ws_active
+        return self.state.snapshot.connected
+    
+    def get_snapshot(self) -> GameSnapshot:
+        """
+        Retourne l'instantané courant de l'état du jeu (tout thread, sans verrou).
+        
+        Comparer `snapshot.version` à une version mémorisée suffit pour
+        savoir si quelque chose a changé.
+        """
+        return self.state.snapshot
     
     def get_riot_id(self) -> Optional[str]:
         """Retourne le Riot ID complet (GameName#TagLine)."""
-        if self.state.auto_game_name and self.state.auto_tag_line:
-            return f"{self.state.auto_game_name}#{self.state.auto_tag_line}"
-        return self.state.summoner or None
+        return self.state.snapshot.riot_id
     
-    def get_platform_for_websites(self) -> str:
-        """Retourne la région pour les URLs (op.gg, etc.)."""
+    def get_platform_for_websites(self, snapshot: Optional[GameSnapshot] = None) -> str:
+        """
+        Retourne la région pour les URLs (op.gg, etc.).
+        
+        Args:
+            snapshot: Instantané à utiliser (courant par défaut), pour rester
+                cohérent avec un Riot ID lu dans le même instantané
+        """
         params = self.get_params()
         if not params.get("summoner_name_auto_detect", True):
             return params.get("region", "euw").lower()
+        snapshot = snapshot or self.state.snapshot
         return PLATFORM_TO_REGION.get(
-            (self.state.platform_routing or "").lower(), 
+            (snapshot.platform_routing or "").lower(), 
             "euw"
         )
     
     def force_refresh_summoner(self) -> None:
         """Force un rafraîchissement des données du joueur."""
-        if self.ws_active and self.connection and self.loop:
+        if self.is_active and self.connection and self.loop:
             asyncio.run_coroutine_threadsafe(
                 self._refresh_player_and_region(), 
                 self.loop
@@ -515,144 +829,338 @@ class WebSocketManager:
     
     def _ws_loop(self) -> None:
         """Boucle principale du WebSocket (exécutée dans un thread séparé)."""
-        if Connector is None:
+        try:
+            Connector, _ = get_lcu_classes()
+        except ImportError:
+            self._publish(self.EVENT_STATUS, ("❌ Erreur: 'lcu_driver' manquant.", ""))
             return
         
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             self.loop = loop
-            connector = Connector()
+            connector = Connector(loop=loop)
+            self._connector = connector
+            discovery = configure_discovery(connector, self.get_params())
+            logging.info(f"[WS] Découverte du client: {discovery}")
             
-            @connector.ready
-            async def on_ready(connection):
-                self.connection = connection
-                self.ws_active = True
-                self._notify_ui(self.EVENT_CONNECTED, None)
-                self._notify_ui(self.EVENT_STATUS, ("Client LoL détecté ! Prêt à vous aider.", "⚡"))
-                logging.info("WebSocket: Connecté au client LCU.")
-                await self._refresh_player_and_region()
-            
-            @connector.close
-            async def on_close(connection):
-                self.connection = None
-                self.ws_active = False
-                self._notify_ui(self.EVENT_DISCONNECTED, None)
-                self._notify_ui(self.EVENT_STATUS, ("LoL fermé. En attente...", "💤"))
-                self.state.last_reported_summoner = None
-                logging.info("WebSocket: Déconnecté.")
-            
-            @connector.ws.register(EP_CURRENT_SUMMONER)
-            async def _ws_summoner_change(connection, event):
-                await self._refresh_player_and_region()
-            
-            @connector.ws.register(EP_CHAT_ME)
-            async def _ws_chat_me_change(connection, event):
-                await self._refresh_player_and_region()
-            
-            @connector.ws.register(EP_LOGIN)
-            async def _ws_login_session(connection, event):
-                data = event.data or {}
-                if data.get('status') == "SUCCEEDED":
-                    self._notify_ui(self.EVENT_STATUS, ("Login détecté...", "🔄"))
-                    await self._refresh_player_and_region()
-            
-            @connector.ws.register(EP_GAMEFLOW)
-            async def _ws_phase(connection, event):
-                phase = event.data
-                if not phase:
-                    return
-                
-                if phase != self.state.current_phase:
-                    logging.info(f"Phase changée : {self.state.current_phase} -> {phase}")
-                self.state.current_phase = phase
-                
-                friendly_phase = PHASE_DISPLAY_MAP.get(phase, phase)
-                self._notify_ui(self.EVENT_PHASE_CHANGE, phase)
-                self._notify_ui(self.EVENT_STATUS, (f"Statut : {friendly_phase}", "ℹ️"))
-                
-                if phase == "ChampSelect":
-                    self.state.reset_between_games()
-                    await self._champ_select_tick()
-                if phase in ("EndOfGame", "WaitingForStats"):
-                    await self._handle_post_game()
+            register_session_handlers(connector, lambda connection: self)
             
-            @connector.ws.register(EP_READY_CHECK)
-            async def _ws_ready(connection, event):
-                if self.state.current_phase not in ["Matchmaking", "ReadyCheck", "None", "Lobby"]:
-                    return
-                data = event.data or {}
-                params = self.get_params()
-                if (params.get("auto_accept_enabled", True) and 
-                    data.get('state') == 'InProgress' and 
-                    data.get('playerResponse') != 'Accepted'):
-                    await connection.request('post', f'{EP_READY_CHECK}/accept')
-                    self._notify_ui(self.EVENT_STATUS, ("Partie acceptée !", "✅"))
-            
-            @connector.ws.register(EP_SESSION)
-            async def _ws_cs_session(connection, event):
-                if self._cs_tick_lock.locked():
-                    return
-                async with self._cs_tick_lock:
-                    await self._champ_select_tick()
-            
-            @connector.ws.register(EP_SESSION_TIMER)
-            async def _ws_cs_timer(connection, event):
-                if time() - self.state._last_cs_timer_fetch > 0.2:
-                    await self._champ_select_timer_tick()
-                    self.state._last_cs_timer_fetch = time()
-            
-            loop.run_until_complete(connector.start())
+            if self._stop_event.is_set():
+                return
+            # Bloquant: recherche du client puis boucle jusqu'à sa fermeture
+            connector.start()
             
         except Exception as e:
+            if self._stop_event.is_set():
+                logging.debug(f"[WS] Boucle WebSocket interrompue par l'arrêt: {e}")
+                return
             logging.critical(f"[WS] Erreur critique dans la boucle WebSocket : {e}", exc_info=True)
-            self.ws_active = False
-            self._notify_ui(self.EVENT_DISCONNECTED, None)
+            self.state.publish(connected=False)
+            self._publish(self.EVENT_DISCONNECTED, None)
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # HANDLERS LCU (enregistrés par register_session_handlers)
+    # ───────────────────────────────────────────────────────────────────────
+    
+    async def on_connection_ready(self, connection) -> None:
+        """Connexion au client établie et API prête."""
+        self.connection = connection
+        self._region_connection = None
+        self.rate_limiter.configure(self.get_params().get("lcu_rate_limits"))
+        connection.rate_limiter = self.rate_limiter
+        await self.capabilities.bind(connection)
+        self.state.publish(connected=True)
+        self._track_idle()
+        self._track_ws_traffic()
+        self._publish(self.EVENT_CONNECTED, None)
+        self._publish(self.EVENT_STATUS, ("Client LoL détecté ! Prêt à vous aider.", "⚡"))
+        logging.info("WebSocket: Connecté au client LCU.")
+        await self._refresh_player_and_region()
+    
+    async def on_connection_close(self, connection) -> None:
+        """Connexion au client fermée."""
+        self.connection = None
+        for group in self._task_groups:
+            group.cancel_all("déconnexion")
+        self._track_ws_traffic(connection)
+        self.state.publish(connected=False, phase="None")
+        self._track_idle()
+        logging.info(f"[WS] Rafraîchissements joueur/région: {self.get_refresh_stats()}")
+        logging.info(f"[WS] Trafic WebSocket: {self.get_ws_stats()}")
+        logging.info(f"[Tasks] Tâches annexes: {self.get_task_stats()}")
+        logging.info(f"[LCU] Limiteur de débit: {self.rate_limiter.get_stats()}")
+        logging.info(f"[LCU] Capacités: {self.capabilities.get_stats()}")
+        if self._stop_event.is_set():
+            logging.info("WebSocket: Connexion fermée (arrêt de l'application).")
+            return
+        self._publish(self.EVENT_DISCONNECTED, None)
+        self._publish(self.EVENT_STATUS, ("LoL fermé. En attente...", "💤"))
+        self.state.last_reported_summoner = None
+        logging.info("WebSocket: Déconnecté.")
+    
+    async def _ws_summoner_change(self, connection, event) -> None:
+        await self._refresh_player_and_region()
+    
+    async def _ws_login_session(self, connection, event) -> None:
+        data = event.data or {}
+        if data.get('status') == "SUCCEEDED":
+            self._publish(self.EVENT_STATUS, ("Login détecté...", "🔄"))
+            # Nouveau compte possible: la région est relue
+            self._region_connection = None
+            await self._refresh_player_and_region()
+    
+    async def _ws_phase(self, connection, event) -> None:
+        phase = event.data
+        if not phase:
+            return
+        
+        previous_phase = self.state.snapshot.phase
+        self._track_ws_traffic()
+        if self.state.publish(phase=phase):
+            self._track_idle()
+            for group in self._task_groups:
+                group.on_phase(phase)
+            logging.info(f"Phase changée : {previous_phase} -> {phase}")
+            friendly_phase = PHASE_DISPLAY_MAP.get(phase, phase)
+            self._publish(self.EVENT_PHASE_CHANGE, phase)
+            self._publish(self.EVENT_STATUS, (f"Statut : {friendly_phase}", "ℹ️"))
+        
+        if phase == "ChampSelect":
+            self.state.reset_between_games()
+            await self._champ_select_tick()
+        if phase in self.POST_GAME_PHASES and not self.post_game_tasks.outstanding:
+            self.post_game_tasks.spawn(self._handle_post_game(), "play-again")
+    
+    async def _ws_ready(self, connection, event) -> None:
+        if self.state.snapshot.phase not in ["Matchmaking", "ReadyCheck", "None", "Lobby"]:
+            return
+        data = event.data or {}
+        params = self.get_params()
+        if (params.get("auto_accept_enabled", True) and 
+            data.get('state') == 'InProgress' and 
+            data.get('playerResponse') != 'Accepted'):
+            await connection.request('post', f'{EP_READY_CHECK}/accept')
+            self._publish(self.EVENT_STATUS, ("Partie acceptée !", "✅"))
+    
+    async def _ws_cs_session(self, connection, event) -> None:
+        if self._cs_tick_lock.locked():
+            return
+        async with self._cs_tick_lock:
+            await self._champ_select_tick()
+    
+    async def _ws_cs_timer(self, connection, event) -> None:
+        if self.rate_limiter.try_acquire(LANE_CS_TIMER):
+            await self._champ_select_timer_tick()
+    
+    # Endpoints écoutés -> méthode de la session
+    WS_ROUTES = (
+        (EP_CURRENT_SUMMONER, "_ws_summoner_change"),
+        (EP_CHAT_ME, "_ws_summoner_change"),
+        (EP_LOGIN, "_ws_login_session"),
+        (EP_GAMEFLOW, "_ws_phase"),
+        (EP_READY_CHECK, "_ws_ready"),
+        (EP_SESSION, "_ws_cs_session"),
+        (EP_SESSION_TIMER, "_ws_cs_timer"),
+    )
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # JOUEUR & RÉGION
+    # ───────────────────────────────────────────────────────────────────────
+    
+    # Phases pendant lesquelles le client est considéré inactif (hors file et partie)
+    IDLE_PHASES = frozenset({"None", "Lobby"})
     
     async def _refresh_player_and_region(self) -> None:
-        """Rafraîchit les données du joueur connecté."""
+        """
+        Rafraîchit les données du joueur connecté.
+        
+        /lol-chat/v1/me est émis à chaque changement de statut du chat: les
+        appels arrivant pendant un rafraîchissement en cours l'attendent et
+        déclenchent au plus un rafraîchissement supplémentaire (les données
+        ont pu changer entre-temps), quel que soit leur nombre.
+        """
         if not self.connection:
             return
         
-        chat_me = None
-        resp_chat = await self.connection.request('get', "/lol-chat/v1/me")
-        if resp_chat.status == 200:
-            chat_me = await resp_chat.json()
+        task = self._refresh_task
+        if task is not None and not task.done():
+            if self._refresh_again:
+                # Déjà couvert par le rafraîchissement supplémentaire prévu
+                # (coût inconnu avant le premier: joueur + région)
+                self.refresh_stats["deduplicated"] += 1
+                self.refresh_stats["requests_saved"] += self._last_refresh_cost or 2
+            self._refresh_again = True
+            await asyncio.shield(task)
+            return
+        
+        self._refresh_again = False
+        self._refresh_task = asyncio.ensure_future(self._refresh_loop())
+        await asyncio.shield(self._refresh_task)
+    
+    async def _refresh_loop(self) -> None:
+        """Rafraîchit tant que de nouvelles demandes arrivent pendant le rafraîchissement."""
+        while self.connection:
+            await self._refresh_once(self.connection)
+            if not self._refresh_again:
+                return
+            self._refresh_again = False
+    
+    async def _get_json(self, connection, endpoint: str) -> Any:
+        """GET LCU compté dans refresh_stats; retourne le JSON ou None si statut != 200."""
+        self.refresh_stats["requests"] += 1
+        response = await connection.request('get', endpoint)
+        if response.status != 200:
+            return None
+        return await response.json()
+    
+    async def _fetch_region(self, connection) -> Any:
+        """Lit la région du client (endpoint choisi par le registre de capacités) et mémorise le nombre d'appels."""
+        sent_before = self.capabilities.requests_sent
+        response = await self.capabilities.request(connection, "region_locale")
+        cost = self.capabilities.requests_sent - sent_before
+        self.refresh_stats["requests"] += cost
+        self._region_cost = cost
+        if response is None or response.status != 200:
+            return None
+        return await response.json()
+    
+    async def _refresh_once(self, connection) -> None:
+        """Lit le joueur et, si elle n'est pas en cache pour cette connexion, la région (en parallèle)."""
+        self.refresh_stats["refreshes"] += 1
+        cost = 1
+        
+        if self._region_connection is connection:
+            self.refresh_stats["region_cache_hits"] += 1
+            self.refresh_stats["requests_saved"] += self._region_cost
+            chat_me, reg = await self._get_json(connection, EP_CHAT_ME), None
+        else:
+            chat_me, reg = await asyncio.gather(
+                self._get_json(connection, EP_CHAT_ME),
+                self._fetch_region(connection)
+            )
+        cost += self._region_cost
         
         if isinstance(chat_me, dict):
-            self.state.auto_game_name = chat_me.get("gameName")
-            self.state.auto_tag_line = chat_me.get("gameTag")
-            if self.state.auto_game_name and self.state.auto_tag_line:
-                self.state.summoner = f"{self.state.auto_game_name}#{self.state.auto_tag_line}"
-            else:
-                self.state.summoner = chat_me.get("name", "Inconnu")
-            self.state.summoner_id = chat_me.get("summonerId")
-            self.state.puuid = chat_me.get("puuid")
+            game_name = chat_me.get("gameName")
+            tag_line = chat_me.get("gameTag")
+            # Nom, tag et identifiants publiés ensemble (jamais un nouveau nom avec un ancien tag)
+            self.state.publish(
+                game_name=game_name,
+                tag_line=tag_line,
+                summoner=f"{game_name}#{tag_line}" if game_name and tag_line else chat_me.get("name", "Inconnu"),
+                summoner_id=chat_me.get("summonerId"),
+                puuid=chat_me.get("puuid"),
+            )
         else:
-            resp_me = await self.connection.request('get', "/lol-summoner/v1/current-summoner")
-            if resp_me.status == 200:
-                me = await resp_me.json()
-                self.state.summoner = me.get("displayName", "Inconnu")
-        
-        # Anti-spam log
-        if self.state.summoner != self.state.last_reported_summoner:
-            self._notify_ui(self.EVENT_SUMMONER_UPDATE, self.get_riot_id())
-            self._notify_ui(self.EVENT_STATUS, (f"Connecté : {self.get_riot_id()}", "👤"))
-            self.state.last_reported_summoner = self.state.summoner
-        
-        # Région
-        reg = None
-        resp_reg = await self.connection.request('get', "/riotclient/get_region_locale")
-        if resp_reg.status != 200:
-            resp_reg = await self.connection.request('get', "/riotclient/region-locale")
-        if resp_reg.status == 200:
-            reg = await resp_reg.json()
+            cost += 1
+            me = await self._get_json(connection, EP_CURRENT_SUMMONER)
+            if isinstance(me, dict):
+                self.state.publish(summoner=me.get("displayName", "Inconnu"))
+        self._last_refresh_cost = cost
+        
+        # Notifications uniquement sur changement réel
+        snapshot = self.state.snapshot
+        if snapshot.summoner != self.state.last_reported_summoner:
+            self._publish(self.EVENT_SUMMONER_UPDATE, snapshot.riot_id)
+            self._publish(self.EVENT_STATUS, (f"Connecté : {snapshot.riot_id}", "👤"))
+            self.state.last_reported_summoner = snapshot.summoner
         
         if isinstance(reg, dict):
             platform = (reg.get("platformId") or reg.get("region") or "").lower()
             if platform:
-                self.state.platform_routing = platform
-                self.state.region_routing = self._platform_to_region_routing(platform)
+                self._region_connection = connection
+            if platform and self.state.publish(
+                platform_routing=platform,
+                region_routing=self._platform_to_region_routing(platform)
+            ):
+                self._publish(self.EVENT_REGION_UPDATE, PLATFORM_TO_REGION.get(platform, "euw"))
+    
+    def _track_idle(self) -> None:
+        """Cumule le temps passé connecté et inactif (après chaque changement de connexion ou de phase)."""
+        now = monotonic()
+        if self._idle_since is not None:
+            self._idle_seconds += now - self._idle_since
+        snapshot = self.state.snapshot
+        idle = snapshot.connected and snapshot.phase in self.IDLE_PHASES
+        self._idle_since = now if idle else None
+    
+    def _track_ws_traffic(self, connection=None) -> None:
+        """
+        Attribue le trafic WebSocket reçu depuis le dernier relevé à la phase en cours.
+        
+        Appelé à la connexion, avant chaque changement de phase et à la fermeture.
+        """
+        connection = connection or self.connection
+        stats = getattr(connection, "ws_stats", None)
+        if stats is None:
+            self._ws_mark = None
+            return
+        pending = self._pending_ws_traffic(stats)
+        if pending is not None:
+            phase, delta = pending
+            totals = self._ws_traffic.setdefault(phase, [0.0, 0, 0])
+            for index, value in enumerate(delta):
+                totals[index] += value
+        self._ws_mark = (self.state.snapshot.phase, monotonic(), stats.messages, stats.bytes)
+    
+    def _pending_ws_traffic(self, stats) -> Optional[Tuple[str, List[float]]]:
+        """Trafic reçu depuis le dernier relevé: (phase, [secondes, messages, octets])."""
+        mark = self._ws_mark
+        if mark is None:
+            return None
+        phase, since, messages, size = mark
+        # Compteurs remis à zéro: nouvelle connexion
+        if stats.messages < messages:
+            messages = size = 0
+        return phase, [monotonic() - since, stats.messages - messages, stats.bytes - size]
+    
+    def get_ws_stats(self) -> Dict[str, Any]:
+        """Trafic WebSocket de la connexion courante et débits cumulés par phase (lecture seule)."""
+        stats = getattr(self.connection, "ws_stats", None)
+        traffic = {phase: list(totals) for phase, totals in self._ws_traffic.items()}
+        pending = self._pending_ws_traffic(stats) if stats is not None else None
+        if pending is not None:
+            phase, delta = pending
+            totals = traffic.setdefault(phase, [0.0, 0, 0])
+            for index, value in enumerate(delta):
+                totals[index] += value
+        phases = {}
+        for phase, (seconds, messages, size) in traffic.items():
+            minutes = max(seconds, 1e-6) / 60
+            phases[phase] = {
+                "seconds": round(seconds, 1),
+                "messages": messages,
+                "bytes_decoded": size,
+                "messages_per_min": round(messages / minutes, 1),
+                "bytes_per_min": round(size / minutes),
+            }
+        watcher = getattr(self._connector, "lockfile_watcher", None)
+        return {
+            "connection": stats.get_stats() if stats is not None else None,
+            "phases": phases,
+            "discovery": watcher.get_stats() if watcher is not None else None,
+        }
+    
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Compteurs du limiteur de débit par classe (requêtes freinées, tentatives abandonnées...)."""
+        return self.rate_limiter.get_stats()
+    
+    def get_task_stats(self) -> Dict[str, Dict[str, int]]:
+        """Compteurs des tâches annexes par groupe (tâches en cours, annulées, en échec...)."""
+        return {group.name: group.get_stats() for group in self._task_groups}
+    
+    def get_refresh_stats(self) -> Dict[str, Any]:
+        """Compteurs du rafraîchissement joueur/région, dont les requêtes évitées par heure d'inactivité."""
+        stats: Dict[str, Any] = dict(self.refresh_stats)
+        idle_seconds = self._idle_seconds
+        if self._idle_since is not None:
+            idle_seconds += monotonic() - self._idle_since
+        stats["idle_hours"] = round(idle_seconds / 3600, 3)
+        stats["requests_saved_per_idle_hour"] = (
+            round(stats["requests_saved"] * 3600 / idle_seconds, 1) if idle_seconds >= 1 else 0.0
+        )
+        return stats
     
     @staticmethod
     def _platform_to_region_routing(platform: str) -> str:
@@ -672,21 +1180,20 @@ class WebSocketManager:
             return
         
         timer = None
-        resp = await self.connection.request('get', "/lol-champ-select/v1/session/timer")
-        if resp.status != 200:
-            resp = await self.connection.request('get', "/lol-champ-select-legacy/v1/session/timer")
-        if resp.status == 200:
+        resp = await self.capabilities.request(self.connection, "cs_timer")
+        if resp is not None and resp.status == 200:
             timer = await resp.json()
         
         # Timer info available but not actively used in current version
-
+    
     async def _champ_select_tick(self) -> None:
         """Tick principal de la sélection des champions."""
         if not self.connection:
             return
         
+        # Première étape de tout pick/ban: voie prioritaire, jamais freinée
         try:
-            response = await self.connection.request('get', "/lol-champ-select/v1/session")
+            response = await self.connection.request('get', "/lol-champ-select/v1/session", lane=LANE_PRIORITY)
             if response.status != 200:
                 return
             session = await response.json()
@@ -712,7 +1219,7 @@ class WebSocketManager:
                 pos = (my_player_obj.get("assignedPosition") or "").upper()
                 if pos:
                     self.state.assigned_position = pos
-                    self._notify_ui(self.EVENT_STATUS, (f"Rôle assigné détecté : {pos}", "ℹ️"))
+                    self._publish(self.EVENT_STATUS, (f"Rôle assigné détecté : {pos}", "ℹ️"))
         
         # Récupérer mes actions
         actions_groups = session.get("actions", [])
@@ -729,9 +1236,7 @@ class WebSocketManager:
                 target_champion_id = self.dd.resolve_champion(params.get("selected_pick_1"))
                 current_hover = pick_action.get("championId")
                 if target_champion_id and target_champion_id != 0 and current_hover != target_champion_id:
-                    if time() - self.state.last_intent_try_ts > 0.5:
-                        await self._hover_champion(pick_action["id"], target_champion_id)
-                        self.state.last_intent_try_ts = time()
+                    await self._hover_champion(pick_action["id"], target_champion_id)
         
         # ACTIONS (BAN & PICK)
         active_action = next((a for a in my_actions if a.get("isInProgress") is True), None)
@@ -746,18 +1251,20 @@ class WebSocketManager:
                 await self._logic_do_pick(active_action, params)
     
     async def _hover_champion(self, action_id: int, champion_id: int) -> None:
-        """Survole (hover) un champion."""
+        """Survole (hover) un champion (au plus au débit de la classe "hover")."""
+        if not self.rate_limiter.try_acquire(LANE_HOVER):
+            return
+        # Déjà limité par la classe "hover": la requête ne doit pas attendre en plus
         url = f"/lol-champ-select/v1/session/actions/{action_id}"
-        await self.connection.request('patch', url, json={"championId": champion_id})
+        await self.connection.request('patch', url, lane=LANE_PRIORITY, json={"championId": champion_id})
     
-    async def _logic_do_ban(self, action: Dict[str, Any], params: Dict[str, Any]) -> None:
+    async def _logic_do_ban(self, action: Dict[str, Any], params: Mapping[str, Any]) -> None:
         """Logique de ban automatique."""
         selected_ban = params.get("selected_ban")
         if not selected_ban:
             return
-        if time() - self.state.last_action_try_ts < 0.1:
+        if not self.rate_limiter.try_acquire(LANE_ACTION):
             return
-        self.state.last_action_try_ts = time()
         
         champion_id = self.dd.resolve_champion(selected_ban)
         if not champion_id:
@@ -766,18 +1273,20 @@ class WebSocketManager:
         success = await self._lock_in_champion(action["id"], champion_id)
         if success:
             self.state.has_banned = True
-            self._notify_ui(self.EVENT_CHAMPION_BANNED, selected_ban)
-            self._notify_ui(self.EVENT_STATUS, (f"Ciao ! {selected_ban} a été banni.", "💀"))
+            self._publish(self.EVENT_CHAMPION_BANNED, selected_ban)
+            self._publish(self.EVENT_STATUS, (f"Ciao ! {selected_ban} a été banni.", "💀"))
     
-    async def _logic_do_pick(self, action: Dict[str, Any], params: Dict[str, Any]) -> None:
+    async def _logic_do_pick(self, action: Dict[str, Any], params: Mapping[str, Any]) -> None:
         """Logique de pick automatique avec fallback."""
-        if time() - self.state.last_action_try_ts < 0.1:
+        if not self.rate_limiter.try_acquire(LANE_ACTION):
             return
-        self.state.last_action_try_ts = time()
         
+        # Sur le chemin du verrouillage: voie prioritaire, jamais freinée
         pickable_ids = []
         try:
-            response = await self.connection.request('get', "/lol-champ-select/v1/pickable-champion-ids")
+            response = await self.connection.request(
+                'get', "/lol-champ-select/v1/pickable-champion-ids", lane=LANE_PRIORITY
+            )
             if response.status == 200:
                 pickable_ids = await response.json()
         except Exception as e:
@@ -805,35 +1314,35 @@ class WebSocketManager:
                 success = await self._lock_in_champion(action["id"], champion_id)
                 if success:
                     self.state.has_picked = True
-                    self._notify_ui(self.EVENT_CHAMPION_PICKED, champion_name)
-                    self._notify_ui(self.EVENT_STATUS, (f"{champion_name} sécurisé ! À toi de jouer.", "🔒"))
+                    self._publish(self.EVENT_CHAMPION_PICKED, champion_name)
+                    self._publish(self.EVENT_STATUS, (f"{champion_name} sécurisé ! À toi de jouer.", "🔒"))
                     
                     if params.get("auto_summoners_enabled"):
-                        asyncio.create_task(self._set_spells(params))
+                        self.champ_select_tasks.spawn(self._set_spells(params), "spells")
                     
                     return
         
-        self._notify_ui(self.EVENT_STATUS, ("Aucun champion dispo ou configuré (ou tous bannis) !", "⚠️"))
+        self._publish(self.EVENT_STATUS, ("Aucun champion dispo ou configuré (ou tous bannis) !", "⚠️"))
     
     async def _lock_in_champion(self, action_id: int, champion_id: int) -> bool:
-        """Verrouille un champion (double méthode pour robustesse)."""
+        """Verrouille un champion (double méthode pour robustesse, voie prioritaire non freinée)."""
         url_action = f"/lol-champ-select/v1/session/actions/{action_id}"
         
         # 1. Sélectionner (Hover)
-        await self.connection.request('patch', url_action, json={"championId": champion_id})
+        await self.connection.request('patch', url_action, lane=LANE_PRIORITY, json={"championId": champion_id})
         
         # 2. Pause technique
         await asyncio.sleep(0.05)
         
         # 3. Méthode 1: completed: True dans PATCH
-        await self.connection.request('patch', url_action, json={"championId": champion_id, "completed": True})
+        await self.connection.request('patch', url_action, lane=LANE_PRIORITY, json={"championId": champion_id, "completed": True})
         
         # 4. Méthode 2: POST complete
-        r = await self.connection.request('post', f"{url_action}/complete")
+        r = await self.connection.request('post', f"{url_action}/complete", lane=LANE_PRIORITY)
         
         return r.status < 400
     
-    async def _set_spells(self, params: Dict[str, Any]) -> None:
+    async def _set_spells(self, params: Mapping[str, Any]) -> None:
         """Configure les sorts d'invocateur."""
         if not self.connection:
             return
@@ -847,8 +1356,8 @@ class WebSocketManager:
         r = await self.connection.request('patch', "/lol-champ-select/v1/session/my-selection", json=payload)
         
         if r and r.status < 400:
-            self._notify_ui(self.EVENT_SPELLS_SET, (spell1_name, spell2_name))
-            self._notify_ui(self.EVENT_STATUS, (f"Sorts auto-sélectionnés ({spell1_name}, {spell2_name})", "🪄"))
+            self._publish(self.EVENT_SPELLS_SET, (spell1_name, spell2_name))
+            self._publish(self.EVENT_STATUS, (f"Sorts auto-sélectionnés ({spell1_name}, {spell2_name})", "🪄"))
     
     async def _handle_post_game(self) -> None:
         """Gère le retour automatique au lobby après une partie."""
@@ -858,10 +1367,11 @@ class WebSocketManager:
         
         for i in range(3):
             await asyncio.sleep(2)
-            if self.state.current_phase not in ["EndOfGame", "WaitingForStats"]:
+            # Garde-fou: la tâche est normalement annulée au changement de phase
+            if self.connection is None or self.state.snapshot.phase not in self.POST_GAME_PHASES:
                 break
             r = await self.connection.request('post', "/lol-lobby/v2/play-again")
             if r and r.status < 400:
-                self._notify_ui(self.EVENT_PLAY_AGAIN, None)
-                self._notify_ui(self.EVENT_STATUS, ("Rejouer auto réussi !", "✅"))
+                self._publish(self.EVENT_PLAY_AGAIN, None)
+                self._publish(self.EVENT_STATUS, ("Rejouer auto réussi !", "✅"))
                 break
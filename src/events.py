@@ -0,0 +1,403 @@
+"""
+MAIN LOL - Bus d'événements
+---------------------------
+Publication/abonnement en processus entre le core et ses consommateurs
+(UI, mode headless, métriques, superviseur multi-clients).
+
+Chaque abonné possède sa propre file bornée, et chaque abonné à callback
+son propre thread: un consommateur lent ne ralentit jamais l'éditeur
+(boucle WebSocket) ni les autres abonnés. Quand la file est pleine, l'événement le plus ancien est supprimé.
+
+Avec la politique COALESCE, seul le dernier événement en attente de
+chaque type fusionnable est conservé, à la place du précédent (l'ordre
+relatif avec les autres événements est préservé). Les types non
+fusionnables (connexion, déconnexion, pick...) ne sont jamais supprimés:
+file pleine, on supprime le plus ancien événement fusionnable, ou à
+défaut le nouvel événement s'il est fusionnable; sinon la file dépasse
+exceptionnellement sa taille.
+
+Trois modes de consommation:
+- callback: appelé sur le thread de l'abonné ("EventBus-<nom>")
+- pull:     drain() depuis le thread de son choix (ex: boucle Tk)
+- asyncio:  await subscription.get() / async for, depuis une boucle asyncio
+"""
+
+import asyncio
+import logging
+from collections import deque
+from time import perf_counter
+from threading import Thread, Lock, Condition, current_thread
+from typing import Optional, Dict, Any, List, Callable, Iterable, NamedTuple, Tuple, Deque
+
+
+# Politiques de file pleine / fusion
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_COALESCE = "coalesce"
+
+# Taille par défaut de la file d'un abonné
+DEFAULT_QUEUE_SIZE: int = 256
+
+
+class Event(NamedTuple):
+    """Événement publié sur le bus (immuable)."""
+    
+    type: str
+    data: Any
+    source: str
+    published_at: float
+
+
+class SubscriptionClosed(Exception):
+    """Levée par Subscription.get() une fois l'abonnement retiré ou le bus fermé."""
+
+
+class Subscription:
+    """
+    Abonnement au bus: file bornée propre à un consommateur.
+    
+    Créé par EventBus.subscribe(); thread-safe.
+    """
+    
+    def __init__(
+        self,
+        bus: "EventBus",
+        name: str,
+        types: Optional[Iterable[str]],
+        policy: str,
+        coalesce_types: Optional[Iterable[str]],
+        maxsize: int,
+        callback: Optional[Callable[[Event], None]],
+        loop: Optional[asyncio.AbstractEventLoop]
+    ):
+        if policy not in (POLICY_DROP_OLDEST, POLICY_COALESCE):
+            raise ValueError(f"Politique inconnue: {policy}")
+        self.bus = bus
+        self.name = name
+        self.types = frozenset(types) if types is not None else None
+        self.policy = policy
+        self.coalesce_types = frozenset(coalesce_types) if coalesce_types is not None else None
+        self.maxsize = max(1, maxsize)
+        self.callback = callback
+        self.loop = loop
+        
+        self._events: Deque[Event] = deque()
+        self._lock = Lock()
+        # Réveille le thread du callback (même verrou que la file)
+        self._ready = Condition(self._lock)
+        self._thread: Optional[Thread] = None
+        self._waiter: Optional[asyncio.Future] = None
+        self.active: bool = True
+        
+        # Compteurs exposés via get_stats()
+        self.enqueued: int = 0
+        self.coalesced: int = 0
+        self.dropped: int = 0
+        self.overflowed: int = 0
+        self.delivered: int = 0
+        self._latency_total: float = 0.0
+        self._latency_max: float = 0.0
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # CÔTÉ ÉDITEUR
+    # ───────────────────────────────────────────────────────────────────────
+    
+    def accepts(self, event_type: str) -> bool:
+        """Indique si l'abonné reçoit ce type d'événement."""
+        return self.active and (self.types is None or event_type in self.types)
+    
+    def _should_coalesce(self, event_type: str) -> bool:
+        return self.policy == POLICY_COALESCE and (
+            self.coalesce_types is None or event_type in self.coalesce_types
+        )
+    
+    def _offer(self, event: Event) -> None:
+        """Ajoute un événement à la file (thread de l'éditeur) et réveille le consommateur."""
+        with self._lock:
+            self.enqueued += 1
+            if self._store(event):
+                return
+            if self.callback is not None:
+                self._ready.notify()
+            waiter, self._waiter = self._waiter, None
+        
+        if waiter is not None:
+            self._wake(waiter)
+    
+    def _store(self, event: Event) -> bool:
+        """
+        Place l'événement dans la file (verrou tenu).
+        
+        Returns:
+            True si l'événement a été abandonné (rien à réveiller)
+        """
+        coalescable = self._should_coalesce(event.type)
+        if coalescable:
+            for index, pending in enumerate(self._events):
+                if pending.type == event.type:
+                    # Remplacé sur place; la latence est mesurée depuis le premier changement en attente
+                    self._events[index] = event._replace(published_at=pending.published_at)
+                    self.coalesced += 1
+                    return False
+        
+        if len(self._events) >= self.maxsize:
+            if self.policy == POLICY_DROP_OLDEST:
+                self._events.popleft()
+                self.dropped += 1
+            else:
+                evictable = next(
+                    (index for index, pending in enumerate(self._events) if self._should_coalesce(pending.type)),
+                    None
+                )
+                if evictable is not None:
+                    del self._events[evictable]
+                    self.dropped += 1
+                elif coalescable:
+                    self.dropped += 1
+                    return True
+                else:
+                    # File pleine d'événements non fusionnables: jamais supprimés
+                    self.overflowed += 1
+        self._events.append(event)
+        return False
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # CÔTÉ CONSOMMATEUR
+    # ───────────────────────────────────────────────────────────────────────
+    
+    @property
+    def depth(self) -> int:
+        """Nombre d'événements en attente."""
+        with self._lock:
+            return len(self._events)
+    
+    def drain(self) -> List[Event]:
+        """Retire et retourne tous les événements en attente (mode pull)."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+    
+    def record_delivery(self, event: Event) -> None:
+        """Enregistre la latence publication -> traitement d'un événement."""
+        latency = perf_counter() - event.published_at
+        with self._lock:
+            self.delivered += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+    
+    def _start_callback_thread(self) -> None:
+        """Démarre le thread qui appelle le callback (abonnés avec callback)."""
+        self._thread = Thread(target=self._callback_loop, name=f"EventBus-{self.name}", daemon=True)
+        self._thread.start()
+    
+    def _callback_loop(self) -> None:
+        """Appelle le callback pour chaque événement, jusqu'au retrait de l'abonnement."""
+        while True:
+            with self._ready:
+                while self.active and not self._events:
+                    self._ready.wait()
+                if not self.active:
+                    return
+                event = self._events.popleft()
+            try:
+                self.callback(event)
+            except Exception as e:
+                logging.warning(f"[EventBus] Abonné '{self.name}' en erreur sur {event.type}: {e}")
+            self.record_delivery(event)
+    
+    async def get(self) -> Event:
+        """
+        Attend et retourne le prochain événement (boucle asyncio de l'abonnement).
+        
+        Un abonnement créé hors d'une boucle est lié à celle du premier get().
+        
+        Raises:
+            SubscriptionClosed: Abonnement retiré ou bus fermé
+        """
+        if self.loop is None:
+            # Lié avant tout _waiter: _wake() ne lit la boucle qu'après
+            self.loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if not self.active:
+                    raise SubscriptionClosed(self.name)
+                if self._events:
+                    event = self._events.popleft()
+                    break
+                waiter = self.loop.create_future()
+                self._waiter = waiter
+            await waiter
+        self.record_delivery(event)
+        return event
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> Event:
+        try:
+            return await self.get()
+        except SubscriptionClosed:
+            raise StopAsyncIteration
+    
+    def unsubscribe(self) -> None:
+        """Retire l'abonnement du bus (les événements en attente sont abandonnés)."""
+        self.bus.unsubscribe(self)
+    
+    def _close(self) -> None:
+        """Désactive l'abonnement et réveille son consommateur (thread du callback ou get())."""
+        with self._ready:
+            self.active = False
+            self._ready.notify_all()
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._wake(waiter)
+    
+    def _wake(self, waiter: asyncio.Future) -> None:
+        """Réveille un get() en attente depuis n'importe quel thread."""
+        try:
+            self.loop.call_soon_threadsafe(_resolve_waiter, waiter)
+        except RuntimeError:
+            # Boucle déjà fermée: plus personne n'attend
+            pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les compteurs de l'abonnement (latences en millisecondes)."""
+        with self._lock:
+            avg = self._latency_total / self.delivered if self.delivered else 0.0
+            return {
+                "depth": len(self._events),
+                "enqueued": self.enqueued,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "overflowed": self.overflowed,
+                "delivered": self.delivered,
+                "latency_avg_ms": round(avg * 1000, 2),
+                "latency_max_ms": round(self._latency_max * 1000, 2),
+            }
+
+
+def _resolve_waiter(waiter: asyncio.Future) -> None:
+    """Réveille un abonné asyncio en attente (thread de sa boucle)."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class EventBus:
+    """
+    Bus d'événements en processus.
+    
+    publish() est appelable depuis n'importe quel thread et ne bloque
+    jamais sur un consommateur: il ne fait qu'ajouter l'événement aux
+    files des abonnés concernés.
+    """
+    
+    def __init__(self):
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._lock = Lock()
+        self._closed: bool = False
+        self.published: int = 0
+    
+    def subscribe(
+        self,
+        callback: Optional[Callable[[Event], None]] = None,
+        types: Optional[Iterable[str]] = None,
+        policy: str = POLICY_DROP_OLDEST,
+        coalesce_types: Optional[Iterable[str]] = None,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        name: str = "",
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Subscription:
+        """
+        Crée un abonnement (depuis n'importe quel thread).
+        
+        Args:
+            callback: Appelé avec chaque Event sur un thread propre à
+                l'abonné; sans callback, l'abonné consomme via drain() ou get()
+            types: Types d'événements reçus (tous par défaut)
+            policy: POLICY_DROP_OLDEST ou POLICY_COALESCE
+            coalesce_types: Types fusionnés avec POLICY_COALESCE (tous par défaut)
+            maxsize: Taille maximale de la file (le plus ancien est supprimé au-delà)
+            name: Nom de l'abonné (métriques, journaux)
+            loop: Boucle asyncio pour get(); par défaut la boucle courante si
+                subscribe() est appelé depuis une coroutine, sinon celle du
+                premier get()
+        
+        Returns:
+            Abonnement
+        """
+        if callback is None and loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        subscription = Subscription(
+            self, name or f"abonné-{len(self._subscriptions) + 1}", types,
+            policy, coalesce_types, maxsize, callback, loop
+        )
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._subscriptions = self._subscriptions + (subscription,)
+        if closed:
+            subscription._close()
+        elif callback is not None:
+            subscription._start_callback_thread()
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Retire un abonnement et réveille son consommateur (get() lève SubscriptionClosed)."""
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+        subscription._close()
+    
+    def publish(self, event_type: str, data: Any = None, source: str = "") -> Event:
+        """
+        Publie un événement vers les abonnés concernés (non bloquant).
+        
+        Args:
+            event_type: Type d'événement (ex: WebSocketManager.EVENT_STATUS)
+            data: Données associées
+            source: Émetteur (ex: "client 1234" en mode multi-clients)
+        
+        Returns:
+            Événement publié
+        """
+        event = Event(event_type, data, source, perf_counter())
+        with self._lock:
+            self.published += 1
+            subscriptions = self._subscriptions
+        for subscription in subscriptions:
+            if subscription.accepts(event_type):
+                subscription._offer(event)
+        return event
+    
+    def close(self, timeout: float = 0.5) -> bool:
+        """
+        Ferme tous les abonnements (les événements en attente sont abandonnés)
+        et attend la fin des threads des callbacks dans la limite du délai.
+        
+        Returns:
+            True si tous les threads sont terminés
+        """
+        with self._lock:
+            self._closed = True
+            subscriptions = self._subscriptions
+        for subscription in subscriptions:
+            subscription._close()
+        
+        deadline = perf_counter() + timeout
+        for subscription in subscriptions:
+            thread = subscription._thread
+            if thread is not None and thread is not current_thread():
+                thread.join(max(0.0, deadline - perf_counter()))
+        return not any(
+            s._thread is not None and s._thread.is_alive() and s._thread is not current_thread()
+            for s in subscriptions
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne le nombre d'événements publiés et les compteurs par abonné."""
+        return {
+            "published": self.published,
+            "subscribers": {s.name: s.get_stats() for s in self._subscriptions},
+        }
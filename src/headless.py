@@ -0,0 +1,217 @@
+"""
+MAIN LOL - Mode Headless
+------------------------
+Exécute DataDragon et le WebSocketManager sans interface: ni Tk, ni
+pygame, ni pystray, ni keyboard. Les événements du core sont publiés sur
+le bus, auquel un puits (HeadlessSink) est abonné pour les journaliser
+et les compter.
+
+Auto-accept, auto-pick/ban, sorts et "rejouer" fonctionnent selon
+parameters.json, comme en mode graphique.
+
+Avec --multi, un superviseur (src/supervisor.py) gère tous les clients
+LoL ouverts, chacun avec ses paramètres et ses métriques.
+
+Usage:
+    python launcher.py --headless [--multi]
+    python -m src.headless [--multi] [--startup-probe]
+"""
+
+import sys
+import json
+import signal
+import logging
+from time import perf_counter
+from threading import Event, Lock
+from typing import Optional, Dict, Any, Mapping
+
+from . import config
+from .config import load_parameters, ParamsStore, CURRENT_VERSION, cache_max_bytes
+from .utils import check_single_instance, release_single_instance, get_peak_memory_kb
+from .core import DataDragon, WebSocketManager
+from .events import EventBus, Event as BusEvent
+
+
+# Intervalle de journalisation des métriques
+METRICS_INTERVAL_S: float = 300.0
+
+# Modules qui ne doivent jamais être chargés en mode headless
+GUI_MODULES = ("tkinter", "ttkbootstrap", "pygame", "pystray", "keyboard", "PIL.ImageTk", "src.ui")
+
+
+class HeadlessSink:
+    """Puits d'événements du core (abonné au bus): journalisation et compteurs."""
+    
+    def __init__(self):
+        self._lock = Lock()
+        self._counts: Dict[str, int] = {}
+        self.connected: bool = False
+        self.phase: str = "None"
+    
+    def __call__(self, event: BusEvent) -> None:
+        """Reçoit un événement du core (thread de l'abonné "headless")."""
+        event_type, data = event.type, event.data
+        prefix = f"[Headless] [{event.source}]" if event.source else "[Headless]"
+        with self._lock:
+            self._counts[event_type] = self._counts.get(event_type, 0) + 1
+        
+        if event_type == WebSocketManager.EVENT_STATUS:
+            message, emoji = data
+            logging.info(" ".join(part for part in (prefix, emoji, message) if part))
+        elif event_type == WebSocketManager.EVENT_CONNECTED:
+            self.connected = True
+        elif event_type == WebSocketManager.EVENT_DISCONNECTED:
+            self.connected = False
+        elif event_type == WebSocketManager.EVENT_PHASE_CHANGE:
+            self.phase = data
+        elif data is not None:
+            logging.info(f"{prefix} {event_type}: {data}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les compteurs d'événements et l'état courant."""
+        with self._lock:
+            counts = dict(self._counts)
+        return {"connected": self.connected, "phase": self.phase, "events": counts}
+
+
+class HeadlessApp:
+    """Cycle de vie du mode headless."""
+    
+    def __init__(self, t0: Optional[float] = None, multi: bool = False):
+        """
+        Args:
+            t0: Référence perf_counter() du démarrage du processus
+            multi: Gérer tous les clients LoL ouverts (superviseur)
+        """
+        self.t0 = t0 if t0 is not None else perf_counter()
+        self._stop_event = Event()
+        self.sink = HeadlessSink()
+        self.bus = EventBus()
+        self.bus.subscribe(self.sink, name="headless")
+        self.params = ParamsStore(load_parameters())
+        
+        self.dd = DataDragon()
+        self.dd.cache.max_bytes = cache_max_bytes(self.params.get())
+        self.ws_manager: Optional[WebSocketManager] = None
+        self.supervisor = None
+        if multi:
+            from .supervisor import ClientSupervisor
+            self.supervisor = ClientSupervisor(self.dd, self.params, self.bus)
+        else:
+            self.ws_manager = WebSocketManager(
+                bus=self.bus,
+                dd=self.dd,
+                get_params=self.params.get
+            )
+        self.ready_ms: Optional[float] = None
+    
+    def start(self) -> None:
+        """Charge DataDragon puis démarre le WebSocket."""
+        logging.info(f"MAIN LOL v{CURRENT_VERSION} démarré (headless).")
+        self._log_enabled_features(self.params.get())
+        self.dd.load()
+        if self.supervisor is not None:
+            self.supervisor.start()
+        else:
+            self.ws_manager.start()
+        self.ready_ms = (perf_counter() - self.t0) * 1000
+        logging.info(f"[Headless] Prêt en {self.ready_ms:.0f} ms, en attente du client LoL...")
+    
+    @staticmethod
+    def _log_enabled_features(params: Mapping[str, Any]) -> None:
+        """Journalise les automatismes actifs."""
+        features = {
+            "auto-accept": params.get("auto_accept_enabled"),
+            "auto-pick": params.get("auto_pick_enabled"),
+            "auto-ban": params.get("auto_ban_enabled"),
+            "sorts": params.get("auto_summoners_enabled"),
+            "rejouer": params.get("auto_play_again_enabled"),
+        }
+        enabled = ", ".join(name for name, on in features.items() if on) or "aucun"
+        logging.info(f"[Headless] Automatismes actifs: {enabled}")
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Métriques du mode headless (démarrage, mémoire, événements, cache)."""
+        metrics = {
+            "ready_ms": round(self.ready_ms, 1) if self.ready_ms is not None else None,
+            "peak_memory_kb": get_peak_memory_kb(),
+            "gui_modules": sorted(name for name in GUI_MODULES if name in sys.modules),
+        }
+        if self.supervisor is not None:
+            metrics.update(self.supervisor.get_metrics())
+        else:
+            metrics.update(self.sink.get_stats())
+            metrics["refresh"] = self.ws_manager.get_refresh_stats()
+            metrics["websocket"] = self.ws_manager.get_ws_stats()
+            metrics["tasks"] = self.ws_manager.get_task_stats()
+            metrics["rate_limits"] = self.ws_manager.get_rate_limit_stats()
+        metrics["cache"] = {"hits": self.dd.cache.hits, "misses": self.dd.cache.misses}
+        metrics["bus"] = self.bus.get_stats()
+        return metrics
+    
+    def run_forever(self) -> None:
+        """Attend l'arrêt en journalisant les métriques périodiquement."""
+        while not self._stop_event.wait(METRICS_INTERVAL_S):
+            logging.info(f"[Headless] Métriques: {self.get_metrics()}")
+    
+    def stop(self) -> None:
+        """Demande l'arrêt (signal, Ctrl+C)."""
+        self._stop_event.set()
+    
+    def shutdown(self) -> None:
+        """Arrête le WebSocket et journalise les métriques finales."""
+        if self.supervisor is not None:
+            self.supervisor.stop()
+        else:
+            self.ws_manager.stop()
+        self.bus.close()
+        self.dd.cache.flush()
+        logging.info(f"[Headless] Métriques finales: {self.get_metrics()}")
+
+
+def main(argv: Optional[list] = None, t0: Optional[float] = None) -> int:
+    """
+    Point d'entrée du mode headless.
+    
+    Args:
+        argv: Arguments (sys.argv[1:] par défaut); --startup-probe affiche
+            le temps de démarrage et la mémoire puis quitte, --multi
+            active le superviseur multi-clients
+        t0: Référence perf_counter() du démarrage du processus
+    
+    Returns:
+        Code de sortie
+    """
+    t0 = t0 if t0 is not None else perf_counter()
+    argv = sys.argv[1:] if argv is None else argv
+    startup_probe = "--startup-probe" in argv
+    
+    config.init(console_log=not startup_probe)
+    if not check_single_instance():
+        logging.info("Une autre instance est déjà en cours. Fermeture.")
+        config.shutdown_logging()
+        return 0
+    
+    app = HeadlessApp(t0=t0, multi="--multi" in argv)
+    try:
+        signal.signal(signal.SIGTERM, lambda signum, frame: app.stop())
+    except (ValueError, AttributeError):
+        pass
+    
+    try:
+        app.start()
+        if startup_probe:
+            print(f"STARTUP_PROBE {json.dumps(app.get_metrics())}", flush=True)
+        else:
+            app.run_forever()
+    except KeyboardInterrupt:
+        logging.info("Interruption clavier détectée.")
+    finally:
+        app.shutdown()
+        release_single_instance()
+        config.shutdown_logging()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,666 @@
+"""
+MAIN LOL - Accès LCU
+--------------------
+Outils autour de l'API locale du client LoL (LCU).
+
+Registre de capacités: certains endpoints existent sous plusieurs noms
+selon la version du client (ex: /riotclient/get_region_locale remplacé
+par /riotclient/region-locale). Plutôt que d'essayer l'ancien puis le
+nouveau à chaque appel, le registre sonde les variantes une fois par
+version du client (/system/v1/builds), mémorise celle qui répond et y
+envoie directement les appels suivants. Le résultat est conservé sur
+disque: un redémarrage avec la même version ne sonde plus rien.
+
+Abonnements WebSocket ciblés: le Connector de lcu_driver s'abonne à
+tous les événements (OnJsonApiEvent) et filtre ensuite les URIs: chat,
+boutique, patcher, butin... sont tous décodés pour rien. Les connecteurs
+construits par get_lcu_classes() s'abonnent uniquement aux événements
+des URIs enregistrées (OnJsonApiEvent_<uri>) et comptent le trafic reçu.
+
+Découverte par lockfile: au lieu de parcourir tous les processus toutes
+les 0.5 s (psutil, coûteux en continu quand le client est fermé), les
+connecteurs peuvent surveiller le fichier `lockfile` écrit par le client
+dans son dossier d'installation: un simple os.stat par passage, le
+fichier n'étant relu que s'il change.
+
+Limiteur de débit: toute requête envoyée par une connexion de
+get_lcu_classes() consomme un jeton de sa classe (seau à jetons avec
+rafale, voir LCU_RATE_LIMITS). Les tentatives répétées à chaque événement
+(survol, pick/ban, timer) prennent un jeton sans attendre et sont
+abandonnées s'il n'y en a pas; le verrouillage du champion passe par une
+voie prioritaire jamais freinée.
+"""
+
+import os
+import json
+import asyncio
+import logging
+from time import monotonic
+from typing import Optional, Dict, Any, Tuple, List, Mapping, Iterable
+
+from .config import (
+    EP_BUILDS, EP_REGION_LOCALE_OLD, EP_REGION_LOCALE,
+    EP_SESSION_TIMER, EP_SESSION_TIMER_LEGACY,
+    LCU_CAPABILITIES_FILE, LOL_INSTALL_DIRS, LOCKFILE_NAME, CLIENT_POLL_INTERVAL_S,
+    LCU_RATE_LIMITS, write_json_atomic
+)
+
+
+# Capacité -> variantes de l'endpoint, dans l'ordre d'essai
+LCU_CAPABILITIES: Dict[str, Tuple[str, ...]] = {
+    "region_locale": (EP_REGION_LOCALE_OLD, EP_REGION_LOCALE),
+    "cs_timer": (EP_SESSION_TIMER, EP_SESSION_TIMER_LEGACY),
+}
+
+# Nombre de versions du client conservées dans le fichier
+CAPABILITIES_MAX_VERSIONS: int = 5
+
+# Version utilisée si /system/v1/builds ne répond pas (sondage non persisté)
+UNKNOWN_VERSION = "inconnue"
+
+# Événement WAMP de l'API JSON du LCU (tous les endpoints)
+LCU_EVENT_PREFIX = "OnJsonApiEvent"
+# Opcodes WAMP utilisés par le LCU
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+# Taille maximale d'un message WebSocket (comme lcu_driver)
+WS_MAX_MSG_SIZE = 8 * 1024 * 1024
+
+# Classes de requêtes par défaut (voir LCU_RATE_LIMITS)
+LANE_READ = "read"
+LANE_WRITE = "write"
+LANE_PRIORITY = "priority"
+# Tentatives abandonnées sans jeton (RateLimiter.try_acquire)
+LANE_HOVER = "hover"
+LANE_ACTION = "action"
+LANE_CS_TIMER = "cs_timer"
+
+# Modes de découverte du client (paramètre "client_discovery")
+DISCOVERY_AUTO = "auto"
+DISCOVERY_LOCKFILE = "lockfile"
+DISCOVERY_PROCESS = "process"
+
+
+class CapabilityRegistry:
+    """
+    Endpoints LCU disponibles, sondés une fois par version du client.
+    
+    Utilisé depuis la boucle asyncio du WebSocket uniquement.
+    """
+    
+    def __init__(
+        self,
+        path: str = LCU_CAPABILITIES_FILE,
+        capabilities: Dict[str, Tuple[str, ...]] = LCU_CAPABILITIES
+    ):
+        """
+        Args:
+            path: Fichier JSON {version: {capacité: endpoint}}
+            capabilities: Capacités connues et leurs variantes
+        """
+        self.path = path
+        self.capabilities = capabilities
+        self.version: str = UNKNOWN_VERSION
+        self._known: Optional[Dict[str, Dict[str, str]]] = None
+        self._resolved: Dict[str, str] = {}
+        
+        # Métriques
+        self.requests_sent: int = 0
+        self.probe_requests: int = 0
+        self.direct_requests: int = 0
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # PERSISTANCE
+    # ───────────────────────────────────────────────────────────────────────
+    
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        """Charge le fichier des capacités à la première utilisation."""
+        if self._known is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    known = json.load(f)
+                self._known = known if isinstance(known, dict) else {}
+            except (OSError, ValueError):
+                self._known = {}
+        return self._known
+    
+    async def _save(self) -> None:
+        """Enregistre les capacités de la version courante (hors boucle asyncio)."""
+        if self.version == UNKNOWN_VERSION:
+            return
+        known = self._load()
+        known.pop(self.version, None)
+        known[self.version] = dict(self._resolved)
+        # Les versions les plus récemment vues sont en fin de dictionnaire
+        for version in list(known)[:-CAPABILITIES_MAX_VERSIONS]:
+            del known[version]
+        snapshot = dict(known)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, write_json_atomic, self.path, snapshot)
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"[LCU] Capacités non enregistrées: {e}")
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # CONNEXION & REQUÊTES
+    # ───────────────────────────────────────────────────────────────────────
+    
+    async def bind(self, connection) -> None:
+        """
+        Associe le registre à une nouvelle connexion: lit la version du client
+        et reprend les endpoints déjà sondés pour cette version.
+        """
+        self._resolved = {}
+        self.version = UNKNOWN_VERSION
+        try:
+            response = await connection.request('get', EP_BUILDS)
+            self.requests_sent += 1
+            if response.status == 200:
+                builds = await response.json()
+                self.version = str((builds or {}).get("version") or UNKNOWN_VERSION)
+        except Exception as e:
+            logging.debug(f"[LCU] Version du client illisible: {e}")
+        
+        known = self._load().get(self.version, {})
+        self._resolved = {
+            name: endpoint for name, endpoint in known.items()
+            if endpoint in self.capabilities.get(name, ())
+        }
+        if self._resolved:
+            logging.info(f"[LCU] Client {self.version}: capacités connues {self._resolved}")
+        else:
+            logging.info(f"[LCU] Client {self.version}: capacités sondées à la première utilisation")
+    
+    def endpoint(self, capability: str) -> Optional[str]:
+        """Endpoint retenu pour une capacité (None tant qu'elle n'a pas été sondée)."""
+        return self._resolved.get(capability)
+    
+    async def request(self, connection, capability: str, method: str = 'get', **kwargs: Any):
+        """
+        Appelle une capacité: directement si l'endpoint est connu, sinon en
+        essayant les variantes dans l'ordre (la première qui répond est retenue).
+        
+        Args:
+            connection: Connexion lcu_driver
+            capability: Nom de la capacité (clé de LCU_CAPABILITIES)
+            method: Méthode HTTP
+            **kwargs: Arguments de connection.request (data=...)
+        
+        Returns:
+            Réponse de la variante retenue, ou de la dernière essayée si aucune ne répond
+        """
+        endpoint = self._resolved.get(capability)
+        if endpoint is not None:
+            self.requests_sent += 1
+            self.direct_requests += 1
+            return await connection.request(method, endpoint, **kwargs)
+        
+        response = None
+        attempts = []
+        for candidate in self.capabilities[capability]:
+            self.requests_sent += 1
+            self.probe_requests += 1
+            response = await connection.request(method, candidate, **kwargs)
+            attempts.append(f"{candidate}={response.status}")
+            if response.status < 400:
+                self._resolved[capability] = candidate
+                logging.info(f"[LCU] Client {self.version}: {capability} -> {candidate} (essais: {', '.join(attempts)})")
+                await self._save()
+                return response
+        # Aucune variante ne répond (ex: timer hors sélection): nouveau sondage au prochain appel
+        logging.debug(f"[LCU] {capability} indisponible (essais: {', '.join(attempts)})")
+        return response
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Version du client, capacités retenues et compteurs de requêtes."""
+        return {
+            "version": self.version,
+            "resolved": dict(self._resolved),
+            "requests": self.requests_sent,
+            "probe_requests": self.probe_requests,
+            "direct_requests": self.direct_requests,
+        }
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# LIMITEUR DE DÉBIT
+# ───────────────────────────────────────────────────────────────────────────
+
+class TokenBucket:
+    """Seau à jetons: `rate` jetons par seconde, au plus `burst` en réserve (rate None = illimité)."""
+    
+    def __init__(self, rate: Optional[float], burst: int):
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.tokens: float = float(self.burst)
+        self._updated: float = monotonic()
+        self.allowed: int = 0
+        self.throttled: int = 0
+        self.dropped: int = 0
+        self.wait_total: float = 0.0
+    
+    def _refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self) -> float:
+        """
+        Réserve un jeton, quitte à l'emprunter sur le futur.
+        
+        Returns:
+            Attente en secondes avant de pouvoir l'utiliser (0 si disponible)
+        """
+        self.allowed += 1
+        if self.rate is None:
+            return 0.0
+        self._refill()
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        delay = -self.tokens / self.rate
+        self.throttled += 1
+        self.wait_total += delay
+        return delay
+    
+    def try_take(self) -> bool:
+        """Prend un jeton s'il est disponible, sans attendre."""
+        if self.rate is not None:
+            self._refill()
+            if self.tokens < 1:
+                self.dropped += 1
+                return False
+            self.tokens -= 1
+        self.allowed += 1
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst if self.rate is not None else None,
+            "allowed": self.allowed,
+            "throttled": self.throttled,
+            "dropped": self.dropped,
+            "wait_ms": round(self.wait_total * 1000, 1),
+        }
+
+
+class RateLimiter:
+    """
+    Seaux à jetons par classe de requêtes LCU.
+    
+    Utilisé depuis la boucle asyncio du WebSocket uniquement; get_stats()
+    est lisible depuis n'importe quel thread.
+    """
+    
+    def __init__(self, limits: Mapping[str, Optional[Tuple[float, int]]] = LCU_RATE_LIMITS):
+        """
+        Args:
+            limits: Classe -> (jetons par seconde, rafale), None = illimité
+        """
+        self.defaults = dict(limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.configure()
+    
+    def configure(self, overrides: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Applique les limites par défaut remplacées par `overrides`
+        ("lcu_rate_limits" de parameters.json). Les compteurs d'une classe
+        sont conservés si sa limite ne change pas.
+        """
+        limits = dict(self.defaults)
+        for lane, limit in (overrides or {}).items():
+            if limit is None:
+                limits[lane] = None
+                continue
+            try:
+                rate, burst = float(limit[0]), int(limit[1])
+            except (TypeError, ValueError, IndexError, KeyError):
+                logging.warning(f"[LCU] Limite de débit invalide pour '{lane}': {limit!r}")
+                continue
+            limits[lane] = (rate, burst) if rate > 0 else None
+        
+        for lane, limit in limits.items():
+            rate, burst = limit if limit is not None else (None, 1)
+            bucket = self._buckets.get(lane)
+            if bucket is None or (bucket.rate, bucket.burst) != (rate, max(1, burst)):
+                self._buckets[lane] = TokenBucket(rate, burst)
+    
+    def _bucket(self, lane: str) -> TokenBucket:
+        bucket = self._buckets.get(lane)
+        if bucket is None:
+            raise KeyError(f"Classe de requêtes LCU inconnue: {lane}")
+        return bucket
+    
+    async def acquire(self, lane: str) -> None:
+        """Attend un jeton de la classe (requêtes)."""
+        delay = self._bucket(lane).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def try_acquire(self, lane: str) -> bool:
+        """Prend un jeton sans attendre (tentatives): False si la tentative doit être abandonnée."""
+        return self._bucket(lane).try_take()
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Compteurs par classe: requêtes autorisées, freinées (attente), abandonnées."""
+        return {lane: bucket.get_stats() for lane, bucket in self._buckets.items()}
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# ABONNEMENTS WEBSOCKET CIBLÉS
+# ───────────────────────────────────────────────────────────────────────────
+
+def lcu_event_name(uri: str) -> str:
+    """
+    Nom de l'événement WAMP d'une URI.
+    
+    Ex: "/lol-gameflow/v1/gameflow-phase" -> "OnJsonApiEvent_lol-gameflow_v1_gameflow-phase"
+    """
+    return f"{LCU_EVENT_PREFIX}{uri.replace('/', '_')}"
+
+
+def subscription_names(registered_uris: List[Dict[str, Any]]) -> List[str]:
+    """
+    Événements WAMP à demander pour les URIs enregistrées sur un connecteur.
+    
+    Une URI enregistrée comme préfixe ("/lol-chat/v1/") ne correspond à
+    aucun événement précis: on revient alors à l'abonnement global.
+    """
+    names: List[str] = []
+    for entry in registered_uris:
+        uri = entry["uri"]
+        if uri.endswith("/"):
+            return [LCU_EVENT_PREFIX]
+        name = lcu_event_name(uri)
+        if name not in names:
+            names.append(name)
+    return names
+
+
+class WsTrafficStats:
+    """Compteurs du trafic WebSocket reçu d'un client (thread de la boucle LCU)."""
+    
+    def __init__(self):
+        self.started_at: float = monotonic()
+        self.subscriptions: int = 0
+        self.messages: int = 0
+        self.bytes: int = 0
+        self.dispatched: int = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les compteurs et les débits par minute."""
+        minutes = max(monotonic() - self.started_at, 1e-6) / 60
+        return {
+            "subscriptions": self.subscriptions,
+            "messages": self.messages,
+            "bytes_decoded": self.bytes,
+            "dispatched": self.dispatched,
+            "messages_per_min": round(self.messages / minutes, 1),
+            "bytes_per_min": round(self.bytes / minutes),
+        }
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# DÉCOUVERTE DU CLIENT (LOCKFILE)
+# ───────────────────────────────────────────────────────────────────────────
+
+def parse_lockfile(content: str) -> Optional[str]:
+    """
+    Convertit le contenu d'un lockfile en chaîne de connexion lcu_driver.
+    
+    Le lockfile ("LeagueClient:<pid>:<port>:<mot de passe>:https") donne
+    le PID de LeagueClient et non celui de LeagueClientUx: il sert pour les
+    deux PID attendus par Connection ("lcu_pid:pid:port:token").
+    
+    Args:
+        content: Contenu du lockfile
+    
+    Returns:
+        Chaîne de connexion ou None si le contenu est invalide
+    """
+    parts = content.strip().split(":")
+    if len(parts) < 4 or not parts[3]:
+        return None
+    try:
+        pid, port = int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+    return f"{pid}:{pid}:{port}:{parts[3]}"
+
+
+def lockfile_paths(params: Mapping[str, Any], auto_lockfile: bool = True) -> Optional[List[str]]:
+    """
+    Lockfiles à surveiller selon les paramètres.
+    
+    Args:
+        params: Paramètres ("client_discovery", "lol_install_dir")
+        auto_lockfile: Le mode "auto" peut utiliser le lockfile
+    
+    Returns:
+        Chemins des lockfiles, ou None pour la recherche de processus
+        (mode "process", ou mode "auto" sans dossier d'installation trouvé)
+    """
+    mode = params.get("client_discovery", DISCOVERY_AUTO)
+    if mode == DISCOVERY_PROCESS or (mode != DISCOVERY_LOCKFILE and not auto_lockfile):
+        return None
+    install_dir = (params.get("lol_install_dir") or "").strip()
+    folders = (install_dir,) if install_dir else LOL_INSTALL_DIRS
+    if mode != DISCOVERY_LOCKFILE:
+        folders = tuple(folder for folder in folders if os.path.isdir(folder))
+        if not folders:
+            return None
+    return [os.path.join(folder, LOCKFILE_NAME) for folder in folders]
+
+
+class LockfileWatcher:
+    """
+    Surveille des lockfiles par os.stat; le contenu n'est relu que si la
+    date de modification ou la taille change.
+    
+    Un lockfile dont le PID n'existe plus (client planté) est ignoré.
+    """
+    
+    def __init__(self, paths: Iterable[str]):
+        self.paths: List[str] = list(paths)
+        self._seen: Dict[str, Tuple[Tuple[int, int], Optional[str]]] = {}
+        self.polls: int = 0
+        self.reads: int = 0
+        self.stale_skips: int = 0
+    
+    def poll(self) -> List[str]:
+        """Retourne les chaînes de connexion des clients en cours d'exécution."""
+        from psutil import pid_exists
+        
+        self.polls += 1
+        found: List[str] = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self._seen.pop(path, None)
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            seen = self._seen.get(path)
+            if seen is None or seen[0] != key:
+                self.reads += 1
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        seen = (key, parse_lockfile(f.read()))
+                except OSError:
+                    continue
+                self._seen[path] = seen
+            credentials = seen[1]
+            if credentials is None:
+                continue
+            if not pid_exists(int(credentials.split(":")[1])):
+                self.stale_skips += 1
+                continue
+            found.append(credentials)
+        return found
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"paths": self.paths, "polls": self.polls, "reads": self.reads, "stale_skips": self.stale_skips}
+
+
+def configure_discovery(connector, params: Mapping[str, Any], auto_lockfile: bool = True) -> str:
+    """
+    Choisit la découverte du client d'un connecteur de get_lcu_classes().
+    
+    Args:
+        connector: Connecteur à configurer
+        params: Paramètres ("client_discovery", "lol_install_dir")
+        auto_lockfile: Le mode "auto" peut utiliser le lockfile
+    
+    Returns:
+        Description du mode retenu (journaux)
+    """
+    paths = lockfile_paths(params, auto_lockfile)
+    if paths is None:
+        connector.lockfile_watcher = None
+        return "recherche de processus"
+    connector.lockfile_watcher = LockfileWatcher(paths)
+    return f"lockfile ({', '.join(paths)})"
+
+
+_LCU_CLASSES: Optional[Tuple[type, type]] = None
+
+
+def get_lcu_classes() -> Tuple[type, type]:
+    """
+    Retourne (Connector, MultipleClientConnector) à abonnements ciblés.
+    
+    lcu_driver (et aiohttp, psutil) n'est importé qu'au premier appel,
+    depuis le thread WebSocket.
+    """
+    global _LCU_CLASSES
+    if _LCU_CLASSES is None:
+        _LCU_CLASSES = _build_lcu_classes()
+    return _LCU_CLASSES
+
+
+def _build_lcu_classes() -> Tuple[type, type]:
+    """Construit les sous-classes lcu_driver (import paresseux)."""
+    import time
+    import aiohttp
+    from lcu_driver import Connector, MultipleClientConnector
+    from lcu_driver.connection import Connection
+    from lcu_driver.utils import _return_ux_process
+    
+    def find_clients(watcher: Optional[LockfileWatcher]) -> Iterable:
+        """Processus LeagueClientUx, ou chaînes de connexion des lockfiles."""
+        if watcher is not None:
+            return watcher.poll()
+        return _return_ux_process()
+    
+    class NarrowConnection(Connection):
+        """Connexion abonnée aux seuls événements des URIs enregistrées."""
+        
+        def __init__(self, connector, process_or_string):
+            super().__init__(connector, process_or_string)
+            self.ws_stats = WsTrafficStats()
+            # Limiteur de la session (WebSocketManager), posé à la connexion
+            self.rate_limiter: Optional[RateLimiter] = None
+        
+        async def request(self, method: str, endpoint: str, lane: Optional[str] = None, **kwargs):
+            """
+            Connection.request passant par le limiteur de débit.
+            
+            Args:
+                lane: Classe de la requête (par défaut "read" pour GET, "write" sinon)
+            """
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(lane or (LANE_READ if method.lower() == "get" else LANE_WRITE))
+            return await super().request(method, endpoint, **kwargs)
+        
+        async def run_ws(self):
+            """Remplace Connection.run_ws: un abonnement par URI au lieu de OnJsonApiEvent."""
+            local_session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth('riot', self._auth_key),
+                headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+            )
+            stats = self.ws_stats
+            try:
+                self._ws = await local_session.ws_connect(self.ws_address, ssl=False, max_msg_size=WS_MAX_MSG_SIZE)
+                names = subscription_names(self._connector.ws.registered_uris)
+                for name in names:
+                    await self._ws.send_json([WAMP_SUBSCRIBE, name])
+                stats.subscriptions = len(names)
+                logging.info(f"[LCU] WebSocket: {len(names)} abonnement(s) ciblé(s)")
+                
+                while not self.closed:
+                    msg = await self._ws.receive()
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        stats.messages += 1
+                        stats.bytes += len(msg.data)
+                        try:
+                            payload = json.loads(msg.data)
+                        except ValueError:
+                            logging.debug(f"[LCU] Message WebSocket illisible ({len(msg.data)} octets)")
+                            continue
+                        if (isinstance(payload, list) and len(payload) >= 3
+                                and payload[0] == WAMP_EVENT and isinstance(payload[2], dict)):
+                            stats.dispatched += 1
+                            self._connector.ws.match_event(self._connector, self, payload[2])
+                    elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.ERROR):
+                        break
+            finally:
+                if self._ws is not None:
+                    await self._ws.close()
+                await local_session.close()
+    
+    class LcuConnector(Connector):
+        """Connector mono-client utilisant NarrowConnection."""
+        
+        connection_class = NarrowConnection
+        lockfile_watcher: Optional[LockfileWatcher] = None
+        
+        def start(self) -> None:
+            """Recherche le client, le sert jusqu'à sa fermeture, puis recommence (sauf arrêt)."""
+            try:
+                while True:
+                    target = next(iter(find_clients(self.lockfile_watcher)), None)
+                    while not target:
+                        # Arrêt demandé pendant la recherche (WebSocketManager.stop)
+                        if not self._repeat_flag:
+                            return
+                        time.sleep(CLIENT_POLL_INTERVAL_S)
+                        target = next(iter(find_clients(self.lockfile_watcher)), None)
+                    connection = self.connection_class(self, target)
+                    self.register_connection(connection)
+                    self.loop.run_until_complete(connection.init())
+                    if not (self._repeat_flag and self.ws.registered_uris):
+                        break
+            except KeyboardInterrupt:
+                logging.info("[LCU] Boucle interrompue au clavier.")
+            finally:
+                self.loop.close()
+    
+    class LcuMultipleClientConnector(MultipleClientConnector):
+        """
+        MultipleClientConnector utilisant NarrowConnection.
+        
+        unregister_connection de lcu_driver 3.0.2 ne retire pas la connexion
+        fermée (del sur une variable locale, et PID du processus UX comparé
+        au PID de l'application): un client relancé ne serait plus jamais
+        redécouvert.
+        """
+        
+        connection_class = NarrowConnection
+        lockfile_watcher: Optional[LockfileWatcher] = None
+        
+        def unregister_connection(self, lcu_pid):
+            self.connections = [c for c in self.connections if c._lcu_pid != lcu_pid]
+        
+        async def _astart(self):
+            tasks = []
+            try:
+                while True:
+                    for target in find_clients(self.lockfile_watcher):
+                        connection = self.connection_class(self, target)
+                        if not self._process_was_initialized(connection):
+                            tasks.append(asyncio.create_task(connection.init()))
+                    await asyncio.sleep(CLIENT_POLL_INTERVAL_S)
+            finally:
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return LcuConnector, LcuMultipleClientConnector
@@ -0,0 +1,213 @@
+"""
+MAIN LOL - Module Démarrage
+---------------------------
+Graphe de démarrage: étapes avec dépendances, exécutées en parallèle
+lorsque c'est possible, chronométrées et résumées dans un rapport.
+
+Trois catégories d'étapes:
+- CRITICAL:   attendues avant la boucle Tk (instance unique, paramètres, UI)
+- BACKGROUND: lancées immédiatement mais non attendues (DataDragon)
+- DEFERRED:   lancées après la première itération de la boucle Tk (son, tray...)
+"""
+
+import logging
+from time import perf_counter
+from threading import Thread, Event, current_thread
+from typing import Optional, Dict, Any, List, Callable, Tuple
+
+
+STAGE_CRITICAL = "critical"
+STAGE_BACKGROUND = "background"
+STAGE_DEFERRED = "deferred"
+
+
+class _Stage:
+    """Étape du graphe de démarrage."""
+    
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        deps: Tuple[str, ...],
+        after: Tuple[str, ...],
+        kind: str,
+        main_thread: bool
+    ):
+        self.name = name
+        self.func = func
+        self.deps = deps
+        self.after = after
+        self.kind = kind
+        self.main_thread = main_thread
+        
+        self.done = Event()
+        self.started: bool = False
+        self.ok: bool = False
+        self.result: Any = None
+        self.start_ms: Optional[float] = None
+        self.duration_ms: Optional[float] = None
+        self.thread_name: str = ""
+        self.status: str = "pending"
+
+
+class StartupPipeline:
+    """
+    Exécute un graphe d'étapes de démarrage.
+    
+    Une étape qui lève une exception ou retourne explicitement False est
+    considérée comme échouée: les étapes qui en dépendent sont ignorées.
+    """
+    
+    def __init__(self, t0: Optional[float] = None):
+        """
+        Args:
+            t0: Référence perf_counter() du démarrage du processus
+        """
+        self.t0 = t0 if t0 is not None else perf_counter()
+        self._stages: Dict[str, _Stage] = {}
+        self.first_iteration_ms: Optional[float] = None
+    
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        deps: Tuple[str, ...] = (),
+        kind: str = STAGE_CRITICAL,
+        main_thread: bool = False,
+        after: Tuple[str, ...] = ()
+    ) -> None:
+        """
+        Déclare une étape.
+        
+        Args:
+            name: Nom unique de l'étape
+            func: Fonction à exécuter
+            deps: Étapes devant être terminées avec succès avant celle-ci
+            kind: STAGE_CRITICAL, STAGE_BACKGROUND ou STAGE_DEFERRED
+            main_thread: Exécuter sur le thread appelant (Tk) plutôt qu'en parallèle
+            after: Étapes à attendre (succès ou échec) sans en dépendre,
+                pour éviter de les exécuter en concurrence
+        """
+        for dep in tuple(deps) + tuple(after):
+            if dep not in self._stages:
+                raise ValueError(f"Étape '{name}': dépendance inconnue '{dep}'")
+        if main_thread and kind != STAGE_CRITICAL:
+            raise ValueError(f"Étape '{name}': seules les étapes critiques peuvent tourner sur le thread principal")
+        self._stages[name] = _Stage(name, func, tuple(deps), tuple(after), kind, main_thread)
+    
+    def succeeded(self, name: str) -> bool:
+        """Indique si une étape s'est terminée avec succès."""
+        stage = self._stages[name]
+        return stage.done.is_set() and stage.ok
+    
+    def result(self, name: str) -> Any:
+        """Retourne le résultat d'une étape terminée."""
+        return self._stages[name].result
+    
+    def _elapsed_ms(self) -> float:
+        """Millisecondes écoulées depuis t0."""
+        return (perf_counter() - self.t0) * 1000
+    
+    def _execute(self, stage: _Stage) -> None:
+        """Attend les dépendances puis exécute l'étape (thread courant)."""
+        for dep in stage.deps + stage.after:
+            self._stages[dep].done.wait()
+        
+        failed_deps = [dep for dep in stage.deps if not self._stages[dep].ok]
+        if failed_deps:
+            stage.status = f"ignorée ({', '.join(failed_deps)})"
+            stage.done.set()
+            return
+        
+        stage.thread_name = current_thread().name
+        stage.start_ms = self._elapsed_ms()
+        try:
+            stage.result = stage.func()
+            stage.ok = stage.result is not False
+            stage.status = "ok" if stage.ok else "interrompue"
+        except Exception as e:
+            stage.status = f"erreur: {e}"
+            logging.error(f"[Startup] Étape '{stage.name}' en erreur: {e}", exc_info=True)
+        finally:
+            stage.duration_ms = self._elapsed_ms() - stage.start_ms
+            stage.done.set()
+    
+    def _start_workers(self, kinds: Tuple[str, ...]) -> None:
+        """Lance un thread par étape parallèle des catégories données."""
+        for stage in self._stages.values():
+            if stage.kind in kinds and not stage.main_thread and not stage.started:
+                stage.started = True
+                Thread(
+                    target=self._execute, args=(stage,),
+                    name=f"Startup-{stage.name}", daemon=True
+                ).start()
+    
+    def run_critical(self) -> None:
+        """
+        Lance les étapes critiques et d'arrière-plan, exécute les étapes du
+        thread principal dans l'ordre de déclaration et attend la fin des
+        étapes critiques.
+        """
+        self._start_workers((STAGE_CRITICAL, STAGE_BACKGROUND))
+        
+        for stage in self._stages.values():
+            if stage.kind == STAGE_CRITICAL and stage.main_thread and not stage.started:
+                stage.started = True
+                self._execute(stage)
+        
+        for stage in self._stages.values():
+            if stage.kind == STAGE_CRITICAL:
+                stage.done.wait()
+    
+    def run_deferred(self) -> None:
+        """
+        Marque la première itération de la boucle Tk, lance les étapes
+        différées et journalise le rapport quand tout est terminé.
+        """
+        if self.first_iteration_ms is None:
+            self.first_iteration_ms = self._elapsed_ms()
+        self._start_workers((STAGE_DEFERRED,))
+        Thread(target=self._report_when_done, name="Startup-report", daemon=True).start()
+    
+    def _report_when_done(self) -> None:
+        """Attend la fin de toutes les étapes puis journalise le rapport."""
+        for stage in self._stages.values():
+            stage.done.wait()
+        for line in self.report_lines():
+            logging.info(line)
+    
+    def get_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Retourne les mesures par étape (millisecondes depuis t0)."""
+        return {
+            stage.name: {
+                "kind": stage.kind,
+                "start_ms": round(stage.start_ms, 1) if stage.start_ms is not None else None,
+                "duration_ms": round(stage.duration_ms, 1) if stage.duration_ms is not None else None,
+                "thread": stage.thread_name,
+                "status": stage.status,
+            }
+            for stage in self._stages.values()
+        }
+    
+    def report_lines(self) -> List[str]:
+        """Construit le rapport de démarrage."""
+        stages = sorted(
+            self._stages.values(),
+            key=lambda s: s.start_ms if s.start_ms is not None else float("inf")
+        )
+        lines = ["[Startup] Rapport de démarrage:"]
+        for stage in stages:
+            if stage.start_ms is None:
+                lines.append(f"[Startup]   {stage.name:<16} {stage.kind:<10} {stage.status}")
+                continue
+            lines.append(
+                f"[Startup]   {stage.name:<16} {stage.kind:<10} "
+                f"début {stage.start_ms:8.1f} ms  durée {stage.duration_ms:8.1f} ms  "
+                f"[{stage.thread_name}] {stage.status}"
+            )
+        if self.first_iteration_ms is not None:
+            lines.append(f"[Startup]   Interactif (1re itération Tk) à {self.first_iteration_ms:.1f} ms")
+        ends = [s.start_ms + s.duration_ms for s in stages if s.duration_ms is not None]
+        if ends:
+            lines.append(f"[Startup]   Toutes étapes terminées à {max(ends):.1f} ms")
+        return lines
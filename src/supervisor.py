@@ -0,0 +1,290 @@
+"""
+MAIN LOL - Superviseur multi-clients
+------------------------------------
+Gère plusieurs clients LoL ouverts en même temps (ex: deux comptes sur
+la même machine): chaque instance LCU découverte reçoit sa propre
+session (WebSocketManager), toutes partageant une seule boucle asyncio,
+un seul thread et un seul DataDragon.
+
+Chaque session lit ses paramètres via une surcouche: les valeurs de
+base de parameters.json, remplacées par celles de
+params["clients"]["GameName#TagLine"] si elles existent.
+"""
+
+import asyncio
+import logging
+from time import time, perf_counter
+from threading import Thread, Lock, Event as ThreadEvent
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Mapping, Tuple
+
+from .config import ParamsStore
+from .core import DataDragon, WebSocketManager, register_session_handlers
+from .events import EventBus, Event
+from .lcu import get_lcu_classes, configure_discovery
+
+
+# Clé de parameters.json contenant les réglages propres à chaque client
+CLIENTS_PARAMS_KEY = "clients"
+
+
+class ClientParams:
+    """Paramètres d'un client: base commune + réglages propres au Riot ID."""
+    
+    def __init__(self, store: ParamsStore, get_riot_id: Callable[[], Optional[str]]):
+        """
+        Args:
+            store: Paramètres communs
+            get_riot_id: Retourne le Riot ID du client (None tant qu'inconnu)
+        """
+        self._store = store
+        self._get_riot_id = get_riot_id
+        self._cache_key: Optional[Tuple[int, Optional[str]]] = None
+        self._cached: Mapping[str, Any] = MappingProxyType({})
+    
+    def get(self) -> Mapping[str, Any]:
+        """Retourne l'instantané fusionné (recalculé seulement si la base ou le Riot ID change)."""
+        version, base = self._store.get_versioned()
+        riot_id = self._get_riot_id()
+        key = (version, riot_id)
+        if key == self._cache_key:
+            return self._cached
+        
+        overrides = (base.get(CLIENTS_PARAMS_KEY) or {}).get(riot_id) if riot_id else None
+        if overrides:
+            merged = dict(base)
+            merged.update(overrides)
+            snapshot = MappingProxyType(merged)
+        else:
+            snapshot = base
+        self._cache_key, self._cached = key, snapshot
+        return snapshot
+
+
+class ClientMetrics:
+    """Compteurs d'événements d'une session (alimentés par l'abonnement du superviseur)."""
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.events: Dict[str, int] = {}
+        self.connected_at: float = time()
+    
+    def record(self, event_type: str) -> None:
+        with self._lock:
+            self.events[event_type] = self.events.get(event_type, 0) + 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            events = dict(self.events)
+        return {"uptime_s": round(time() - self.connected_at, 1), "events": events}
+
+
+class _ClientSession:
+    """Session d'un client LCU: WebSocketManager + paramètres + métriques."""
+    
+    def __init__(self, key: str, manager: WebSocketManager, metrics: ClientMetrics):
+        self.key = key
+        self.manager = manager
+        self.metrics = metrics
+
+
+class ClientSupervisor:
+    """
+    Découvre toutes les instances LCU et exécute une session par client.
+    
+    Thread-safe: start/stop/get_metrics depuis n'importe quel thread, les
+    sessions vivent sur le thread "WebSocket-supervisor".
+    """
+    
+    def __init__(
+        self,
+        dd: DataDragon,
+        params: ParamsStore,
+        bus: EventBus
+    ):
+        """
+        Args:
+            dd: DataDragon partagé par toutes les sessions
+            params: Paramètres communs
+            bus: Bus sur lequel chaque session publie (source "client <PID>")
+        """
+        self.dd = dd
+        self.params = params
+        self.bus = bus
+        
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connector = None
+        self._thread: Optional[Thread] = None
+        # Créé avant le thread: un stop() précoce n'est jamais perdu
+        self._stop_flag = ThreadEvent()
+        self._stop_requested: Optional[asyncio.Event] = None
+        self._sessions: Dict[str, _ClientSession] = {}
+        self._lock = Lock()
+        self._subscription = None
+        
+        # Métriques globales
+        self.sessions_opened: int = 0
+        self.sessions_closed: int = 0
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # SESSIONS
+    # ───────────────────────────────────────────────────────────────────────
+    
+    def _session_for(self, connection) -> WebSocketManager:
+        """Retourne (ou crée) la session associée à une connexion LCU."""
+        key = f"client {connection.pid}"
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                return session.manager
+        
+        holder: Dict[str, WebSocketManager] = {}
+        client_params = ClientParams(self.params, lambda: holder["manager"].get_riot_id())
+        metrics = ClientMetrics()
+        manager = WebSocketManager(bus=self.bus, dd=self.dd, get_params=client_params.get, source=key)
+        manager.loop = self.loop
+        holder["manager"] = manager
+        
+        with self._lock:
+            self._sessions[key] = _ClientSession(key, manager, metrics)
+            self.sessions_opened += 1
+            count = len(self._sessions)
+        logging.info(f"[Supervisor] {key.capitalize()} détecté ({count} client(s) connecté(s)).")
+        return manager
+    
+    async def _on_close(self, connection) -> None:
+        """Retire la session d'un client fermé (après ses propres handlers)."""
+        with self._lock:
+            session = self._sessions.pop(f"client {connection.pid}", None)
+            if session is None:
+                return
+            self.sessions_closed += 1
+            count = len(self._sessions)
+        logging.info(
+            f"[Supervisor] {session.key.capitalize()} ({session.manager.get_riot_id() or '?'}) fermé, "
+            f"{count} client(s) restant(s). Métriques: {session.metrics.get_stats()}"
+        )
+    
+    def _record_event(self, event: Event) -> None:
+        """Compte les événements par client (thread de l'abonné "supervisor")."""
+        with self._lock:
+            session = self._sessions.get(event.source)
+        if session is not None:
+            session.metrics.record(event.type)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Métriques par client, indexées par Riot ID (ou "client <PID>" tant qu'inconnu)."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            opened, closed = self.sessions_opened, self.sessions_closed
+        clients = {}
+        for session in sessions:
+            stats = session.metrics.get_stats()
+            stats.update({
+                "source": session.key,
+                "connected": session.manager.is_active,
+                "phase": session.manager.get_snapshot().phase,
+                "region": session.manager.get_platform_for_websites(),
+                "refresh": session.manager.get_refresh_stats(),
+                "websocket": session.manager.get_ws_stats(),
+                "tasks": session.manager.get_task_stats(),
+                "rate_limits": session.manager.get_rate_limit_stats(),
+            })
+            clients[session.manager.get_riot_id() or session.key] = stats
+        return {"sessions_opened": opened, "sessions_closed": closed, "clients": clients}
+    
+    # ───────────────────────────────────────────────────────────────────────
+    # CYCLE DE VIE
+    # ───────────────────────────────────────────────────────────────────────
+    
+    def start(self) -> None:
+        """Démarre le thread du superviseur (lcu_driver y est importé)."""
+        self._stop_flag.clear()
+        self._subscription = self.bus.subscribe(self._record_event, name="supervisor")
+        self._thread = Thread(target=self._run, name="WebSocket-supervisor", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Boucle asyncio partagée par toutes les sessions."""
+        try:
+            _, connector_class = get_lcu_classes()
+        except ImportError:
+            logging.error("[Supervisor] 'lcu_driver' manquant.")
+            return
+        
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            connector = connector_class(loop=loop)
+            self._connector = connector
+            # Un lockfile par dossier d'installation: plusieurs clients lancés
+            # depuis le même dossier n'en laissent voir qu'un. Le mode "auto"
+            # garde donc la recherche de processus.
+            discovery = configure_discovery(connector, self.params.get(), auto_lockfile=False)
+            logging.info(f"[Supervisor] Découverte des clients: {discovery}")
+            register_session_handlers(connector, self._session_for)
+            connector.close(self._on_close)
+            loop.run_until_complete(self._main(connector))
+        except Exception as e:
+            logging.critical(f"[Supervisor] Erreur critique: {e}", exc_info=True)
+        finally:
+            loop.close()
+    
+    async def _main(self, connector) -> None:
+        """Recherche des clients jusqu'à la demande d'arrêt, puis ferme les sessions."""
+        self._stop_requested = asyncio.Event()
+        # stop() lève le drapeau avant de lire _stop_requested: un arrêt
+        # demandé avant cette ligne est vu ici
+        if self._stop_flag.is_set():
+            self._stop_requested.set()
+        discovery = asyncio.create_task(connector._astart())
+        stop_wait = asyncio.create_task(self._stop_requested.wait())
+        await asyncio.wait((discovery, stop_wait), return_when=asyncio.FIRST_COMPLETED)
+        
+        with self._lock:
+            managers = [session.manager for session in self._sessions.values()]
+        for manager in managers:
+            manager._stop_event.set()
+        
+        current = asyncio.current_task()
+        pending = [
+            task for task in asyncio.all_tasks()
+            if task is not current and not task.done()
+            and getattr(task.get_coro(), "__qualname__", "") != "Connection.init"
+        ]
+        for task in pending:
+            task.cancel()
+        # La découverte attend ses tâches Connection.init dans son finally:
+        # elles se terminent à la fermeture des WebSockets
+        for manager in managers:
+            await manager.close_connection()
+        remaining = [task for task in asyncio.all_tasks() if task is not current]
+        if remaining:
+            await asyncio.wait(remaining, timeout=1.0)
+    
+    def stop(self, timeout: float = 1.5) -> bool:
+        """
+        Ferme toutes les sessions et attend la fin du thread dans la limite du délai.
+        
+        Returns:
+            True si le thread du superviseur est terminé
+        """
+        deadline = perf_counter() + timeout
+        if self._subscription is not None:
+            self._subscription.unsubscribe()
+        self._stop_flag.set()
+        thread, loop, stop_requested = self._thread, self.loop, self._stop_requested
+        if thread is None or not thread.is_alive():
+            return True
+        if loop is not None and stop_requested is not None:
+            try:
+                loop.call_soon_threadsafe(stop_requested.set)
+            except RuntimeError:
+                pass  # Boucle déjà fermée: le thread se termine
+        thread.join(max(0.0, deadline - perf_counter()))
+        if thread.is_alive():
+            logging.info("[Supervisor] Thread toujours actif, abandonné à la fermeture.")
+            return False
+        return True
+
@@ -2,36 +2,45 @@
 MAIN LOL - Module Interface Graphique (Refactorisé v6.1)
 ---------------------------------------------------------
 Contient LoLAssistantUI (fenêtre principale) et SettingsWindow.
-Toutes les mises à jour UI utilisent root.after() pour la thread-safety.
+Les événements du core transitent par une file vidée par le thread Tk.
 
 Améliorations v6.1:
-- ThreadPoolExecutor pour le chargement des icônes
+- ThreadPoolExecutor pour les tâches de fond
+- Ordonnanceur d'images à priorités, annulable (widgets détruits, filtres périmés)
+- Cache PhotoImage sur le thread Tk, images appliquées par lots (une frame)
+- File d'événements core -> UI fusionnée, vidée à cadence fixe
+- Fenêtre de paramètres préconstruite, affichée/masquée instantanément
+- pygame, pystray et keyboard chargés en arrière-plan après le premier rendu
+  (étapes différées du graphe de démarrage)
 - Méthodes create_widgets() décomposées en sous-méthodes
 - Logging des erreurs au lieu de pass silencieux
 - Imports explicites (plus de wildcard)
 """
 
 import os
+import heapq
+import queue
 import logging
+import itertools
 import webbrowser
+from time import perf_counter
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
+from threading import Thread, Condition
+from typing import Optional, Dict, Any, Callable, List, Tuple, Mapping
 
 import tkinter as tk
 from tkinter import ttk as ttk_widget
 import ttkbootstrap as ttk
 from ttkbootstrap.scrolled import ScrolledFrame
 from PIL import Image, ImageTk, ImageEnhance
-import pystray
-import keyboard
-import pygame
 
 from .config import (
     resource_path, CURRENT_VERSION, GITHUB_REPO_URL,
     REGION_LIST, SUMMONER_SPELL_LIST, DEFAULT_PARAMS
 )
 from .utils import build_opgg_url, build_porofessor_url
+from .events import EventBus, POLICY_COALESCE
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -46,23 +55,310 @@ BOOTSTYLE_DANGER = "danger"
 BOOTSTYLE_INFO = "info"
 BOOTSTYLE_WARNING = "warning"
 
+# Priorités du chargement d'images (plus petit = plus prioritaire)
+PRIORITY_VISIBLE = 0      # Boutons visibles à l'écran
+PRIORITY_PREFETCH = 1     # Boutons hors écran (préchargement)
+PRIORITY_BACKGROUND = 2   # Splash art de fond
+
+# Nombre de boutons du sélecteur de champion considérés comme visibles
+PICKER_VISIBLE_COUNT = 32
+
+# Application des images sur le thread Tk: une frame (~60 fps), budget par lot
+IMAGE_FRAME_MS = 16
+IMAGE_BATCH_BUDGET_MS = 8
+
+# Cadence de traitement des événements du core sur le thread Tk
+UI_EVENT_INTERVAL_MS = 50
+# Taille maximale de la file d'événements de l'UI (bus du core)
+UI_EVENT_QUEUE_SIZE = 1000
+
+# Délai avant la construction (cachée) de la fenêtre de paramètres
+SETTINGS_PREBUILD_DELAY_MS = 1500
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# CHARGEMENT D'IMAGES (ORDONNANCEUR À PRIORITÉS)
+# ───────────────────────────────────────────────────────────────────────────
+
+class CancelToken:
+    """Jeton d'annulation partagé entre une tâche et son widget."""
+    
+    __slots__ = ("cancelled",)
+    
+    def __init__(self):
+        self.cancelled: bool = False
+    
+    def cancel(self) -> None:
+        """Marque la tâche associée comme obsolète."""
+        self.cancelled = True
+
+
+class _ImageTask:
+    """Tâche de chargement d'image en attente dans l'ordonnanceur."""
+    
+    __slots__ = ("work", "on_result", "token", "generation", "on_drop")
+    
+    def __init__(
+        self,
+        work: Callable[[], Any],
+        on_result: Optional[Callable[[Any], None]],
+        token: Optional[CancelToken],
+        generation: Optional[Tuple[str, int]],
+        on_drop: Optional[Callable[[], None]] = None
+    ):
+        self.work = work
+        self.on_result = on_result
+        self.token = token
+        self.generation = generation
+        self.on_drop = on_drop
+
+
+class ImageTaskScheduler:
+    """
+    Ordonnanceur de chargement d'images à priorités et annulable.
+    
+    Les tâches sont servies par priorité (visibles, puis préchargement, puis
+    arrière-plan). Une tâche dont le widget a été détruit ou dont la génération
+    de filtre est périmée est abandonnée sans être exécutée.
+    """
+    
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialise l'ordonnanceur et démarre les threads de travail.
+        
+        Args:
+            max_workers: Nombre de threads de chargement
+        """
+        self._heap: List[Tuple[int, int, _ImageTask]] = []
+        self._cond = Condition()
+        self._seq = itertools.count()
+        self._generations: Dict[str, int] = {}
+        self._running = True
+        self._active: int = 0
+        
+        # Compteurs exposés via get_stats()
+        self.submitted: int = 0
+        self.executed: int = 0
+        self.dropped: int = 0   # Tâches abandonnées avant exécution
+        self.wasted: int = 0    # Tâches exécutées dont le résultat a été jeté
+        
+        self._workers = [
+            Thread(target=self._worker, name=f"ImageWorker-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+    
+    @property
+    def queue_depth(self) -> int:
+        """Nombre de tâches en attente."""
+        with self._cond:
+            return len(self._heap)
+    
+    @property
+    def in_flight(self) -> int:
+        """Nombre de tâches en attente ou en cours d'exécution."""
+        with self._cond:
+            return len(self._heap) + self._active
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les compteurs de l'ordonnanceur."""
+        with self._cond:
+            return {
+                "queue_depth": len(self._heap),
+                "submitted": self.submitted,
+                "executed": self.executed,
+                "dropped": self.dropped,
+                "wasted": self.wasted,
+            }
+    
+    def new_generation(self, key: str) -> int:
+        """
+        Démarre une nouvelle génération pour une clé (ex: filtre du sélecteur).
+        Toutes les tâches des générations précédentes deviennent obsolètes.
+        
+        Returns:
+            Numéro de la nouvelle génération
+        """
+        with self._cond:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            return generation
+    
+    def token_for_widget(self, widget: Any) -> CancelToken:
+        """
+        Crée un jeton annulé à la destruction du widget (thread principal).
+        
+        Un nouveau jeton remplace et annule le précédent: seule la dernière
+        image demandée pour un widget est chargée.
+        """
+        previous = getattr(widget, "_img_token", None)
+        if previous is not None:
+            previous.cancel()
+        else:
+            widget.bind(
+                "<Destroy>",
+                lambda e, w=widget: w._img_token.cancel() if e.widget is w else None,
+                add="+"
+            )
+        token = CancelToken()
+        widget._img_token = token
+        return token
+    
+    def submit(
+        self,
+        work: Callable[[], Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        priority: int = PRIORITY_VISIBLE,
+        widget: Any = None,
+        generation: Optional[Tuple[str, int]] = None,
+        on_drop: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Planifie une tâche de chargement.
+        
+        Args:
+            work: Fonction exécutée dans un thread de travail
+            on_result: Appelée avec le résultat si la tâche est toujours d'actualité
+            priority: PRIORITY_VISIBLE, PRIORITY_PREFETCH ou PRIORITY_BACKGROUND
+            widget: Widget destinataire (la tâche est annulée s'il est détruit)
+            generation: Couple (clé, génération) issu de new_generation()
+            on_drop: Appelée (thread de travail) si on_result ne l'est jamais:
+                échec, tâche obsolète ou annulée, arrêt de l'ordonnanceur
+        """
+        token = self.token_for_widget(widget) if widget is not None else None
+        task = _ImageTask(work, on_result, token, generation, on_drop)
+        with self._cond:
+            running = self._running
+            if running:
+                self.submitted += 1
+                heapq.heappush(self._heap, (priority, next(self._seq), task))
+                self._cond.notify()
+        if not running:
+            self._drop(task)
+    
+    def note_wasted(self) -> None:
+        """Comptabilise un résultat calculé mais jeté (widget disparu)."""
+        with self._cond:
+            self.wasted += 1
+    
+    def _is_stale(self, task: _ImageTask) -> bool:
+        """Indique si une tâche n'a plus de destinataire valide."""
+        if task.token is not None and task.token.cancelled:
+            return True
+        if task.generation is not None:
+            key, generation = task.generation
+            if self._generations.get(key) != generation:
+                return True
+        return False
+    
+    def _worker(self) -> None:
+        """Boucle d'un thread de travail."""
+        while True:
+            with self._cond:
+                while self._running and not self._heap:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                _, _, task = heapq.heappop(self._heap)
+                stale = self._is_stale(task)
+                if stale:
+                    self.dropped += 1
+                # Reste "en cours" jusqu'à son rappel, même abandonnée
+                self._active += 1
+            
+            try:
+                if stale:
+                    self._drop(task)
+                else:
+                    self._run_task(task)
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify_all()
+    
+    def _run_task(self, task: _ImageTask) -> None:
+        """Exécute une tâche puis transmet son résultat s'il est encore utile."""
+        try:
+            result = task.work()
+        except Exception as e:
+            logging.debug(f"Erreur tâche image: {e}")
+            self._drop(task)
+            return
+        
+        with self._cond:
+            self.executed += 1
+            stale = not self._running or self._is_stale(task)
+            if stale:
+                self.wasted += 1
+        if stale:
+            self._drop(task)
+            return
+        
+        if task.on_result is not None:
+            try:
+                task.on_result(result)
+            except Exception as e:
+                logging.debug(f"Erreur callback tâche image: {e}")
+                self._drop(task)
+    
+    @staticmethod
+    def _drop(task: _ImageTask) -> None:
+        """Prévient le demandeur qu'une tâche n'aura pas de résultat."""
+        if task.on_drop is None:
+            return
+        try:
+            task.on_drop()
+        except Exception as e:
+            logging.debug(f"Erreur callback abandon tâche image: {e}")
+    
+    def shutdown(self, timeout: float = 0.0) -> bool:
+        """
+        Arrête les threads et abandonne les tâches en attente.
+        
+        Les résultats des tâches encore en cours (téléchargements) sont
+        ignorés; leurs threads daemon sont abandonnés à la sortie.
+        
+        Args:
+            timeout: Délai maximal d'attente des tâches en cours
+            
+        Returns:
+            True si aucune tâche n'est plus en cours
+        """
+        with self._cond:
+            self._running = False
+            self.dropped += len(self._heap)
+            abandoned = [task for _, _, task in self._heap]
+            self._heap.clear()
+            self._cond.notify_all()
+        for task in abandoned:
+            self._drop(task)
+        with self._cond:
+            return self._cond.wait_for(lambda: self._active == 0, timeout=timeout)
+
 
 # ───────────────────────────────────────────────────────────────────────────
 # SETTINGS WINDOW
 # ───────────────────────────────────────────────────────────────────────────
 
 class SettingsWindow:
-    """Fenêtre de paramètres de l'application."""
+    """
+    Fenêtre de paramètres de l'application.
+    
+    Construite une seule fois (cachée) après le démarrage, puis affichée et
+    masquée: show() resynchronise son état depuis les paramètres.
+    """
     
     def __init__(self, parent: "LoLAssistantUI"):
         """
-        Initialise la fenêtre de paramètres.
+        Initialise la fenêtre de paramètres (masquée).
         
         Args:
             parent: Instance de LoLAssistantUI
         """
         self.parent = parent
         self.window = ttk.Toplevel(parent.root)
+        self.window.withdraw()
         self.window.title("Paramètres - MAIN LOL")
         self.window.geometry("500x750")
         self.window.resizable(False, False)
@@ -74,16 +370,106 @@ class SettingsWindow:
         # Variables liées aux paramètres
         self._init_variables()
         
-        # Liste des champions
-        self.all_champions = parent.dd.all_names if parent.dd.all_names else ["Garen", "Teemo", "Ashe"]
         self.spell_list = SUMMONER_SPELL_LIST[:]
         
         # Frame principal
         self.main_frame: Optional[ttk.Frame] = None
         
+        # Contenu affiché par bouton: (nom, icône présente) pour ne recharger
+        # que ce qui a changé à l'ouverture
+        self._btn_contents: Dict[str, Tuple[str, bool]] = {}
+        # Bouton -> numéro de la dernière demande d'icône non terminée
+        self._pending_icons: Dict[str, int] = {}
+        self._icon_requests = itertools.count()
+        self._open_started_at: Optional[float] = None
+        # Version du dernier instantané GameSnapshot affiché (compte, région)
+        self._account_version: Optional[int] = None
+        
         self.create_widgets()
         self.window.after(100, self.toggle_summoner_entry)
-        self.window.after(1000, self._poll_summoner_label)
+        
+        # Mise à jour du compte détecté sur événement (plus de polling)
+        from .core import WebSocketManager
+        self._unsubscribe_account = parent.subscribe_core_events(
+            (
+                WebSocketManager.EVENT_SUMMONER_UPDATE,
+                WebSocketManager.EVENT_REGION_UPDATE,
+                WebSocketManager.EVENT_CONNECTED,
+                WebSocketManager.EVENT_DISCONNECTED,
+            ),
+            self._on_account_event
+        )
+    
+    @property
+    def all_champions(self) -> List[str]:
+        """Liste des champions (DataDragon peut finir de charger après la construction)."""
+        return self.parent.dd.all_names if self.parent.dd.all_names else ["Garen", "Teemo", "Ashe"]
+    
+    @property
+    def is_visible(self) -> bool:
+        """Indique si la fenêtre est affichée."""
+        return self.window.winfo_exists() and self.window.state() != "withdrawn"
+    
+    def show(self, started_at: Optional[float] = None) -> None:
+        """
+        Affiche la fenêtre après avoir resynchronisé son état.
+        
+        Args:
+            started_at: perf_counter() du clic sur l'engrenage (mesure de latence)
+        """
+        if self.is_visible:
+            self.window.lift()
+            self.window.focus_force()
+            return
+        
+        self._open_started_at = started_at
+        self._sync_from_params()
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+        self._check_open_complete()
+    
+    def _sync_from_params(self) -> None:
+        """Recopie les paramètres courants dans les variables et boutons."""
+        params = self.parent.get_params()
+        
+        self.auto_accept_var.set(params.get("auto_accept_enabled", True))
+        self.auto_pick_var.set(params.get("auto_pick_enabled", True))
+        self.auto_ban_var.set(params.get("auto_ban_enabled", True))
+        self.auto_summoners_var.set(params.get("auto_summoners_enabled", True))
+        self.summoner_auto_detect_var.set(params.get("summoner_name_auto_detect", True))
+        self.summoner_entry_var.set(params.get("manual_summoner_name", ""))
+        self.saved_manual_name = params.get("manual_summoner_name", "")
+        self.region_var.set(params.get("region", "euw"))
+        self.play_again_var.set(params.get("auto_play_again_enabled", False))
+        self.auto_hide_var.set(params.get("auto_hide_on_connect", True))
+        self.close_on_exit_var.set(params.get("close_app_on_lol_exit", True))
+        
+        self.toggle_pick()
+        self.toggle_ban()
+        self.toggle_spells()
+        self.toggle_summoner_entry()
+        self._load_initial_icons()
+    
+    def _icon_applied(self, btn_key: str, request: int) -> None:
+        """
+        Appelé quand l'icône d'un bouton a été appliquée ou abandonnée.
+        
+        Une demande remplacée par une plus récente ne termine pas le bouton.
+        """
+        if self._pending_icons.get(btn_key) != request:
+            return
+        del self._pending_icons[btn_key]
+        self._check_open_complete()
+    
+    def _check_open_complete(self) -> None:
+        """Journalise la latence d'ouverture une fois toutes les icônes affichées."""
+        if self._open_started_at is None or self._pending_icons:
+            return
+        self.window.update_idletasks()
+        latency_ms = (perf_counter() - self._open_started_at) * 1000
+        self._open_started_at = None
+        logging.info(f"Paramètres: ouverture en {latency_ms:.1f} ms (icônes comprises)")
     
     def _setup_window_icon(self) -> None:
         """Configure l'icône de la fenêtre."""
@@ -307,15 +693,22 @@ class SettingsWindow:
         return start_row + 2
     
     def _load_initial_icons(self) -> None:
-        """Charge les icônes initiales dans tous les boutons."""
+        """Charge les icônes des boutons dont le contenu a changé."""
         params = self.parent.get_params()
         
-        self._update_btn_content(self.btn_ban, params.get("selected_ban", ""), is_champ=True)
-        self._update_btn_content(self.btn_pick_1, params.get("selected_pick_1", ""), is_champ=True)
-        self._update_btn_content(self.btn_pick_2, params.get("selected_pick_2", ""), is_champ=True)
-        self._update_btn_content(self.btn_pick_3, params.get("selected_pick_3", ""), is_champ=True)
-        self._update_btn_content(self.btn_spell_1, params.get("global_spell_1", ""), is_champ=False)
-        self._update_btn_content(self.btn_spell_2, params.get("global_spell_2", ""), is_champ=False)
+        buttons = (
+            (self.btn_ban, "selected_ban", True),
+            (self.btn_pick_1, "selected_pick_1", True),
+            (self.btn_pick_2, "selected_pick_2", True),
+            (self.btn_pick_3, "selected_pick_3", True),
+            (self.btn_spell_1, "global_spell_1", False),
+            (self.btn_spell_2, "global_spell_2", False),
+        )
+        for btn, key, is_champ in buttons:
+            name = params.get(key, "") or "..."
+            # Recharger si le nom a changé ou si l'icône n'avait pas pu être chargée
+            if self._btn_contents.get(str(btn)) != (name, True):
+                self._update_btn_content(btn, name, is_champ=is_champ)
     
     def _open_champion_picker(self, context: str = "pick", slot_num: int = 1) -> None:
         """Ouvre le sélecteur de champion."""
@@ -358,11 +751,16 @@ class SettingsWindow:
         
         valid_champs = [c for c in self.all_champions if c not in excluded]
         
+        generation_key = f"champion_picker_{id(picker)}"
+        
         def populate_grid(filter_text: str = "") -> None:
+            # Invalide les chargements de la frappe précédente
+            generation = (generation_key, self.parent.image_scheduler.new_generation(generation_key))
             for widget in grid_frame.winfo_children():
                 widget.destroy()
             filter_text = filter_text.lower()
             row, col = 0, 0
+            shown = 0
             for champ_name in valid_champs:
                 if filter_text in champ_name.lower():
                     btn = ttk.Button(
@@ -370,7 +768,9 @@ class SettingsWindow:
                         command=lambda c=champ_name: on_select(c)
                     )
                     btn.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-                    self._load_img_into_btn(btn, champ_name, is_champ=True)
+                    priority = PRIORITY_VISIBLE if shown < PICKER_VISIBLE_COUNT else PRIORITY_PREFETCH
+                    self._load_img_into_btn(btn, champ_name, is_champ=True, priority=priority, generation=generation)
+                    shown += 1
                     col += 1
                     if col >= 4:
                         col = 0
@@ -442,61 +842,46 @@ class SettingsWindow:
                 row += 1
     
     def _update_btn_content(self, btn_widget: ttk.Button, name: str, is_champ: bool = True) -> None:
-        """Met à jour le contenu d'un bouton avec icône (thread-safe via ThreadPoolExecutor)."""
+        """Met à jour le contenu d'un bouton avec icône (cache PhotoImage du thread Tk)."""
         if not name:
             name = "..."
         
-        def task():
-            try:
-                if is_champ:
-                    img = self.parent.dd.get_champion_icon(name)
-                else:
-                    img = self.parent.dd.get_summoner_icon(name)
-                
-                if img:
-                    img = img.resize((30, 30), Image.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    def update_ui():
-                        if btn_widget.winfo_exists():
-                            btn_widget.configure(image=photo, text=f"  {name}", compound="left")
-                            btn_widget.image = photo
-                    
-                    btn_widget.after(0, update_ui)
-                else:
-                    def update_ui_no_img():
-                        if btn_widget.winfo_exists():
-                            btn_widget.configure(image='', text=f"  {name}", compound="left")
-                    btn_widget.after(0, update_ui_no_img)
-            except Exception as e:
-                logging.debug(f"Erreur chargement icône pour {name}: {e}")
-        
-        self.parent.executor.submit(task)
-    
-    def _load_img_into_btn(self, btn_widget: ttk.Button, name: str, is_champ: bool = True) -> None:
-        """Charge une image dans un bouton (thread-safe via ThreadPoolExecutor)."""
-        def task():
-            try:
-                if is_champ:
-                    img = self.parent.dd.get_champion_icon(name)
-                else:
-                    img = self.parent.dd.get_summoner_icon(name)
-                
-                if img:
-                    size = (40, 40) if is_champ else (48, 48)
-                    img = img.resize(size, Image.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
+        def apply(photo):
+            if photo:
+                btn_widget.configure(image=photo, text=f"  {name}", compound="left")
+                btn_widget.image = photo
+            else:
+                btn_widget.configure(image='', text=f"  {name}", compound="left")
+            self._btn_contents[str(btn_widget)] = (name, bool(photo))
+            self._icon_applied(btn_key, request)
+        
+        # Une nouvelle demande pour le même bouton remplace la précédente.
+        # Échec ou annulation terminent aussi le bouton (latence d'ouverture).
+        btn_key = str(btn_widget)
+        request = next(self._icon_requests)
+        self._pending_icons[btn_key] = request
+        self.parent.load_icon_photo(
+            name, (30, 30), is_champ, btn_widget, apply, PRIORITY_VISIBLE,
+            on_drop=lambda: self._icon_applied(btn_key, request)
+        )
                     
-                    def update_ui():
-                        if btn_widget.winfo_exists():
-                            btn_widget.configure(image=photo)
-                            btn_widget.image = photo
+    def _load_img_into_btn(
+        self,
+        btn_widget: ttk.Button,
+        name: str,
+        is_champ: bool = True,
+        priority: int = PRIORITY_VISIBLE,
+        generation: Optional[Tuple[str, int]] = None
+    ) -> None:
+        """Charge une image dans un bouton (cache PhotoImage du thread Tk)."""
+        size = (40, 40) if is_champ else (48, 48)
                     
-                    btn_widget.after(0, update_ui)
-            except Exception as e:
-                logging.debug(f"Erreur chargement image pour {name}: {e}")
+        def apply(photo):
+            if photo:
+                btn_widget.configure(image=photo)
+                btn_widget.image = photo
         
-        self.parent.executor.submit(task)
+        self.parent.load_icon_photo(name, size, is_champ, btn_widget, apply, priority, generation)
     
     def toggle_summoner_entry(self) -> None:
         """Bascule l'état de l'entrée pseudo selon la détection auto."""
@@ -541,36 +926,47 @@ class SettingsWindow:
         self.btn_spell_1.configure(state=state)
         self.btn_spell_2.configure(state=state)
     
-    def _update_detect_label_text(self) -> None:
-        """Met à jour le label de détection auto."""
-        detected = self.parent.get_auto_summoner_name()
+    def _update_detect_label_text(self, snapshot=None) -> None:
+        """
+        Met à jour le label de détection auto.
+        
+        Args:
+            snapshot: Instantané GameSnapshot à afficher (courant par défaut)
+        """
+        snapshot = snapshot or self.parent.get_game_snapshot()
+        detected = snapshot.riot_id if snapshot else None
         
-        if self.parent.is_ws_active() and detected:
-            self.lbl_auto_detect.configure(text=f"Détection auto du compte (compte détecté : {detected})")
+        if snapshot and snapshot.connected and detected:
+            text = f"Détection auto du compte (compte détecté : {detected})"
         else:
-            self.lbl_auto_detect.configure(text="Détection auto du compte")
+            text = "Détection auto du compte"
+        if self.lbl_auto_detect.cget("text") != text:
+            self.lbl_auto_detect.configure(text=text)
     
-    def _poll_summoner_label(self) -> None:
-        """Polling périodique pour mettre à jour le label summoner."""
+    def _on_account_event(self, event_type: str, data: Any) -> None:
+        """Met à jour le compte et la région détectés lorsqu'ils changent."""
         if not self.window.winfo_exists():
             return
         
-        self._update_detect_label_text()
+        # Un seul instantané pour le nom, le tag et la région; plusieurs
+        # événements traités dans la même frame n'entraînent qu'une mise à jour
+        snapshot = self.parent.get_game_snapshot()
+        version = snapshot.version if snapshot else None
+        if version is not None and version == self._account_version:
+            return
+        self._account_version = version
+        
+        self._update_detect_label_text(snapshot)
         
         if self.summoner_auto_detect_var.get():
-            curr = self.parent.get_auto_summoner_name() or "(détection auto...)"
+            curr = (snapshot.riot_id if snapshot else None) or "(détection auto...)"
             if self.summoner_entry_var.get() != curr:
                 self.summoner_entry_var.set(curr)
-            areg = self.parent.get_platform_for_websites()
+            areg = self.parent.get_platform_for_websites(snapshot)
             if self.region_var.get() != areg:
                 self.region_var.set(areg)
                 self.parent.update_param("region", areg)
         
-        if not self.summoner_auto_detect_var.get():
-            self.saved_manual_name = self.summoner_entry_var.get()
-        
-        self.window.after(1000, self._poll_summoner_label)
-    
     def on_close(self) -> None:
         """Ferme la fenêtre et sauvegarde les paramètres."""
         self.parent.update_param("auto_summoners_enabled", self.auto_summoners_var.get())
@@ -584,7 +980,15 @@ class SettingsWindow:
         self.parent.update_param("auto_hide_on_connect", self.auto_hide_var.get())
         self.parent.update_param("close_app_on_lol_exit", self.close_on_exit_var.get())
         self.parent.save_and_notify()
-        self.window.destroy()
+        # La fenêtre est conservée pour une réouverture instantanée
+        self._open_started_at = None
+        self.window.withdraw()
+    
+    def destroy(self) -> None:
+        """Détruit définitivement la fenêtre."""
+        self._unsubscribe_account()
+        if self.window.winfo_exists():
+            self.window.destroy()
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -594,17 +998,20 @@ class SettingsWindow:
 class LoLAssistantUI:
     """Interface graphique principale de MAIN LOL."""
     
-    # ThreadPoolExecutor partagé pour le chargement des icônes
+    # ThreadPoolExecutor partagé pour les tâches de fond (DataDragon, mises à jour, tray)
     MAX_WORKERS = 4
+    # Threads de l'ordonnanceur de chargement d'images
+    IMAGE_WORKERS = 4
     
     def __init__(
         self, 
         dd,  # DataDragon instance
-        params: Dict[str, Any],
+        params: Mapping[str, Any],
         save_callback: Callable[[], None],
         update_param_callback: Callable[[str, Any], None],
-        get_params_callback: Callable[[], Dict[str, Any]],
-        quit_callback: Callable[[], None]
+        get_params_callback: Callable[[], Mapping[str, Any]],
+        quit_callback: Callable[[], None],
+        bus: EventBus
     ):
         """
         Initialise l'interface principale.
@@ -616,6 +1023,7 @@ class LoLAssistantUI:
             update_param_callback: Fonction pour mettre à jour un paramètre
             get_params_callback: Fonction pour récupérer les paramètres
             quit_callback: Fonction pour quitter l'application
+            bus: Bus d'événements du core
         """
         self.dd = dd
         self._params = params
@@ -628,11 +1036,40 @@ class LoLAssistantUI:
         self.settings_win: Optional[SettingsWindow] = None
         self.ws_manager = None  # Sera défini par main.py
         
-        # ThreadPoolExecutor pour le chargement des icônes
+        # ThreadPoolExecutor pour les tâches de fond
         self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
         
-        # Initialiser le son
-        self._init_sound()
+        # Ordonnanceur à priorités pour le chargement des icônes et splash arts
+        self.image_scheduler = ImageTaskScheduler(max_workers=self.IMAGE_WORKERS)
+        
+        # Cache PhotoImage détenu par le thread Tk, clé (nom, taille).
+        # Les workers ne produisent que des images PIL décodées, déposées dans
+        # _image_updates et appliquées par lots à chaque frame.
+        self._photo_cache: Dict[Tuple[str, Tuple[int, int]], ImageTk.PhotoImage] = {}
+        self._image_updates: "queue.SimpleQueue[Tuple[Any, Any, Any, Optional[Callable], Optional[Callable]]]" = queue.SimpleQueue()
+        self._image_pump_scheduled: bool = False
+        
+        # Abonnement au bus du core, vidé à cadence fixe par le thread Tk.
+        # Les événements "d'état" sont fusionnés (seule la dernière valeur
+        # compte); les autres gardent leur ordre.
+        from .core import WebSocketManager
+        self._core_events = bus.subscribe(
+            name="ui",
+            policy=POLICY_COALESCE,
+            coalesce_types={
+                WebSocketManager.EVENT_STATUS,
+                WebSocketManager.EVENT_PHASE_CHANGE,
+                WebSocketManager.EVENT_SUMMONER_UPDATE,
+                WebSocketManager.EVENT_REGION_UPDATE,
+            },
+            maxsize=UI_EVENT_QUEUE_SIZE
+        )
+        self._last_status: Optional[str] = None
+        self._core_subscribers: Dict[str, List[Callable[[str, Any], None]]] = {}
+        
+        # Son, tray et hotkeys: initialisés par les étapes différées du démarrage
+        self.sound_effect = None
+        self._hotkeys_installed: bool = False
         
         # Créer la fenêtre
         self.theme = params.get("theme", "darkly")
@@ -650,12 +1087,20 @@ class LoLAssistantUI:
         self.status_label: Optional[ttk.Label] = None
         
         self.create_ui()
-        self.create_system_tray()
-        self.setup_hotkeys()
     
-    def _init_sound(self) -> None:
-        """Initialise le système de son."""
+        self.root.after(UI_EVENT_INTERVAL_MS, self._pump_core_events)
+        self.root.after(SETTINGS_PREBUILD_DELAY_MS, lambda: self.root.after_idle(self._prebuild_settings))
+    
+    def init_sound(self) -> None:
+        """
+        Initialise le système de son.
+        
+        pygame (comme pystray et keyboard) n'est importé qu'ici: ces
+        initialisations sont lancées après le premier affichage.
+        """
         try:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            import pygame
             pygame.mixer.init()
             self.sound_effect = pygame.mixer.Sound(resource_path("config/son.wav"))
         except Exception as e:
@@ -666,8 +1111,8 @@ class LoLAssistantUI:
         """Définit le gestionnaire WebSocket."""
         self.ws_manager = ws_manager
     
-    def get_params(self) -> Dict[str, Any]:
-        """Retourne les paramètres actuels."""
+    def get_params(self) -> Mapping[str, Any]:
+        """Retourne l'instantané courant des paramètres (lecture seule, sans copie)."""
         return self._get_params_callback()
     
     def update_param(self, key: str, value: Any) -> None:
@@ -687,10 +1132,19 @@ class LoLAssistantUI:
         """Retourne le nom du summoner détecté automatiquement."""
         return self.ws_manager.get_riot_id() if self.ws_manager else None
     
-    def get_platform_for_websites(self) -> str:
-        """Retourne la région pour les URLs."""
+    def get_game_snapshot(self):
+        """Retourne l'instantané GameSnapshot courant (None sans WebSocket)."""
+        return self.ws_manager.get_snapshot() if self.ws_manager else None
+    
+    def get_platform_for_websites(self, snapshot=None) -> str:
+        """
+        Retourne la région pour les URLs.
+        
+        Args:
+            snapshot: Instantané GameSnapshot à utiliser (courant par défaut)
+        """
         if self.ws_manager:
-            return self.ws_manager.get_platform_for_websites()
+            return self.ws_manager.get_platform_for_websites(snapshot)
         return self.get_params().get("region", "euw")
     
     def force_refresh_summoner(self) -> None:
@@ -786,76 +1240,214 @@ class LoLAssistantUI:
         opgg_btn.place(relx=0.5, rely=0.75, anchor="center")
     
     def build_opgg_url(self) -> str:
-        """Construit l'URL OP.GG."""
-        riot_id = self._get_riot_id_display()
+        """Construit l'URL OP.GG (appelable depuis le thread des hotkeys)."""
+        # Riot ID et région lus dans le même instantané
+        snapshot = self.get_game_snapshot()
+        riot_id = self._get_riot_id_display(snapshot)
         if not riot_id:
             riot_id = self.get_params().get("manual_summoner_name", "")
-        return build_opgg_url(self.get_platform_for_websites(), riot_id)
+        return build_opgg_url(self.get_platform_for_websites(snapshot), riot_id)
     
     def build_porofessor_url(self) -> str:
-        """Construit l'URL Porofessor."""
-        riot_id = self._get_riot_id_display()
+        """Construit l'URL Porofessor (appelable depuis le thread des hotkeys)."""
+        # Riot ID et région lus dans le même instantané
+        snapshot = self.get_game_snapshot()
+        riot_id = self._get_riot_id_display(snapshot)
         if not riot_id:
             riot_id = self.get_params().get("manual_summoner_name", "")
-        return build_porofessor_url(self.get_platform_for_websites(), riot_id)
+        return build_porofessor_url(self.get_platform_for_websites(snapshot), riot_id)
     
-    def _get_riot_id_display(self) -> Optional[str]:
-        """Retourne le Riot ID à afficher selon le mode de détection."""
+    def _get_riot_id_display(self, snapshot=None) -> Optional[str]:
+        """
+        Retourne le Riot ID à afficher selon le mode de détection.
+        
+        Args:
+            snapshot: Instantané GameSnapshot à utiliser (courant par défaut)
+        """
         params = self.get_params()
         if params.get("summoner_name_auto_detect", True):
-            return self.get_auto_summoner_name()
+            snapshot = snapshot or self.get_game_snapshot()
+            return snapshot.riot_id if snapshot else None
         return params.get("manual_summoner_name")
     
+    def load_icon_photo(
+        self,
+        name: str,
+        size: Tuple[int, int],
+        is_champ: bool,
+        widget: Any,
+        apply: Callable[[Optional[ImageTk.PhotoImage]], None],
+        priority: int = PRIORITY_VISIBLE,
+        generation: Optional[Tuple[str, int]] = None,
+        on_drop: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Charge l'icône d'un champion ou d'un sort à la taille demandée."""
+        def loader():
+            if is_champ:
+                img = self.dd.get_champion_icon(name)
+            else:
+                img = self.dd.get_summoner_icon(name)
+            if img:
+                return img.resize(size, Image.LANCZOS)
+            return None
+        
+        self.request_photo(name, size, loader, apply, priority, widget, generation, on_drop)
+    
+    def request_photo(
+        self,
+        name: str,
+        size: Tuple[int, int],
+        loader: Callable[[], Optional[Image.Image]],
+        apply: Callable[[Optional[ImageTk.PhotoImage]], None],
+        priority: int = PRIORITY_VISIBLE,
+        widget: Any = None,
+        generation: Optional[Tuple[str, int]] = None,
+        on_drop: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Demande une PhotoImage (thread Tk uniquement).
+        
+        Si (name, size) est déjà en cache, apply() est appelé immédiatement.
+        Sinon loader() est exécuté par l'ordonnanceur d'images et la PhotoImage
+        est créée sur le thread Tk lors du prochain lot.
+        
+        Args:
+            name: Nom de l'image (champion, sort, splash...)
+            size: Taille finale de l'image
+            loader: Retourne l'image PIL décodée à la bonne taille (thread de travail)
+            apply: Reçoit la PhotoImage (ou None) sur le thread Tk
+            priority: Priorité de l'ordonnanceur
+            widget: Widget destinataire (annulation si détruit)
+            generation: Génération de filtre associée
+            on_drop: Appelée sur le thread Tk si apply() ne le sera jamais
+                (échec du chargement, annulation, widget détruit)
+        """
+        key = (name, size)
+        photo = self._photo_cache.get(key)
+        if photo is not None:
+            apply(photo)
+            return
+        
+        def work():
+            img = loader()
+            if img is not None:
+                img.load()  # Décodage complet hors du thread Tk
+            return img
+        
+        def on_result(img):
+            self._image_updates.put((key, img, widget, apply, on_drop))
+        
+        def on_dropped():
+            self._image_updates.put((key, None, widget, None, on_drop))
+        
+        self.image_scheduler.submit(
+            work, on_result, priority, widget=widget, generation=generation,
+            on_drop=on_dropped if on_drop is not None else None
+        )
+        self._schedule_image_pump()
+    
+    def _schedule_image_pump(self) -> None:
+        """Planifie le prochain lot d'application d'images (thread Tk)."""
+        if not self._image_pump_scheduled and self.running:
+            self._image_pump_scheduled = True
+            self.root.after(IMAGE_FRAME_MS, self._drain_image_updates)
+    
+    def _drain_image_updates(self) -> None:
+        """Applique un lot d'images dans le budget d'une frame."""
+        self._image_pump_scheduled = False
+        deadline = perf_counter() + IMAGE_BATCH_BUDGET_MS / 1000.0
+        
+        while perf_counter() < deadline:
+            try:
+                key, img, widget, apply, on_drop = self._image_updates.get_nowait()
+            except queue.Empty:
+                break
+            
+            if apply is None:
+                # Tâche abandonnée: seul le rappel d'abandon reste à faire
+                self._run_image_drop(key, on_drop)
+                continue
+            
+            photo = self._photo_cache.get(key)
+            if photo is None and img is not None:
+                photo = ImageTk.PhotoImage(img)
+                self._photo_cache[key] = photo
+            
+            if widget is not None and not widget.winfo_exists():
+                self.image_scheduler.note_wasted()
+                self._run_image_drop(key, on_drop)
+                continue
+            try:
+                apply(photo)
+            except tk.TclError as e:
+                logging.debug(f"Erreur application image {key[0]}: {e}")
+                self._run_image_drop(key, on_drop)
+        
+        # Continuer tant que des images sont en cours de chargement ou en file.
+        # in_flight d'abord: une tâche dépose son résultat avant d'en sortir.
+        if self.image_scheduler.in_flight > 0 or not self._image_updates.empty():
+            self._schedule_image_pump()
+    
+    @staticmethod
+    def _run_image_drop(key: Tuple[str, Tuple[int, int]], on_drop: Optional[Callable[[], None]]) -> None:
+        """Exécute le rappel d'abandon d'une image (thread Tk)."""
+        if on_drop is None:
+            return
+        try:
+            on_drop()
+        except tk.TclError as e:
+            logging.debug(f"Erreur abandon image {key[0]}: {e}")
+    
     def set_background_splash(self, champion_name: str) -> None:
         """Met le splash art d'un champion en arrière-plan."""
         def task():
-            try:
-                img = self.dd.get_splash_art(champion_name)
-                if not img:
-                    return
+            img = self.dd.get_splash_art(champion_name)
+            if not img:
+                return None
                 
-                # Resize and crop
-                window_w, window_h = 380, 180
-                base_width = window_w
-                w_percent = base_width / float(img.size[0])
-                h_size = int(float(img.size[1]) * w_percent)
+            # Resize and crop
+            window_w, window_h = 380, 180
+            base_width = window_w
+            w_percent = base_width / float(img.size[0])
+            h_size = int(float(img.size[1]) * w_percent)
                 
-                if h_size < window_h:
-                    base_height = window_h
-                    h_percent = base_height / float(img.size[1])
-                    w_size = int(float(img.size[0]) * h_percent)
-                    img = img.resize((w_size, base_height), Image.Resampling.LANCZOS)
-                else:
-                    img = img.resize((base_width, h_size), Image.Resampling.LANCZOS)
-                
-                # Center crop
-                left = (img.width - window_w) / 2
-                top = (img.height - window_h) / 2
-                right = (img.width + window_w) / 2
-                bottom = (img.height + window_h) / 2
-                img = img.crop((left, top, right, bottom))
+            if h_size < window_h:
+                base_height = window_h
+                h_percent = base_height / float(img.size[1])
+                w_size = int(float(img.size[0]) * h_percent)
+                img = img.resize((w_size, base_height), Image.Resampling.LANCZOS)
+            else:
+                img = img.resize((base_width, h_size), Image.Resampling.LANCZOS)
                 
-                # Darken
-                enhancer = ImageEnhance.Brightness(img)
-                img = enhancer.enhance(0.4)
+            # Center crop
+            left = (img.width - window_w) / 2
+            top = (img.height - window_h) / 2
+            right = (img.width + window_w) / 2
+            bottom = (img.height + window_h) / 2
+            img = img.crop((left, top, right, bottom))
                 
-                tk_img = ImageTk.PhotoImage(img)
+            # Darken
+            enhancer = ImageEnhance.Brightness(img)
+            img = enhancer.enhance(0.4)
                 
-                def update_ui():
-                    if self.root.winfo_exists() and self.bg_label:
-                        self.bg_label.configure(image=tk_img)
-                        self.bg_label.image = tk_img
+            return img
                 
-                self.root.after(0, update_ui)
+        def apply(tk_img):
+            if tk_img and self.bg_label:
+                self.bg_label.configure(image=tk_img)
+                self.bg_label.image = tk_img
                 
-            except Exception as e:
-                logging.warning(f"Erreur Splash Art pour {champion_name}: {e}")
-        
-        self.executor.submit(task)
+        # Un nouveau pick rend obsolète le splash précédent encore en file
+        generation = ("splash", self.image_scheduler.new_generation("splash"))
+        self.request_photo(
+            f"splash:{champion_name}", (380, 180), task, apply,
+            PRIORITY_BACKGROUND, generation=generation
+        )
     
     def create_system_tray(self) -> None:
         """Crée l'icône du system tray."""
         try:
+            import pystray
             image = Image.open(resource_path("./config/imgs/garen.webp")).resize((64, 64))
             menu = pystray.Menu(
                 pystray.MenuItem("Afficher/Masquer", self.toggle_window),
@@ -876,8 +1468,10 @@ class LoLAssistantUI:
     def setup_hotkeys(self) -> None:
         """Configure les raccourcis clavier."""
         try:
+            import keyboard
             keyboard.add_hotkey('alt+p', self.open_porofessor)
             keyboard.add_hotkey('alt+c', self.toggle_window)
+            self._hotkeys_installed = True
         except Exception as e:
             logging.debug(f"Impossible de configurer les hotkeys: {e}")
     
@@ -905,13 +1499,19 @@ class LoLAssistantUI:
         else:
             self.hide_window()
     
+    def _prebuild_settings(self) -> None:
+        """Construit la fenêtre de paramètres (masquée) pendant que l'UI est inactive."""
+        if self.settings_win is None and self.running:
+            started_at = perf_counter()
+            self.settings_win = SettingsWindow(self)
+            logging.info(f"Paramètres: préconstruits en {(perf_counter() - started_at) * 1000:.1f} ms")
+    
     def open_settings(self) -> None:
-        """Ouvre la fenêtre de paramètres."""
-        if self.settings_win and self.settings_win.window.winfo_exists():
-            self.settings_win.window.lift()
-            self.settings_win.window.focus_force()
-            return
-        self.settings_win = SettingsWindow(self)
+        """Affiche la fenêtre de paramètres (préconstruite si possible)."""
+        started_at = perf_counter()
+        if not self.settings_win or not self.settings_win.window.winfo_exists():
+            self.settings_win = SettingsWindow(self)
+        self.settings_win.show(started_at)
     
     def update_status(self, message: str, emoji: str = "") -> None:
         """Met à jour le label de statut (thread-safe)."""
@@ -1023,12 +1623,47 @@ class LoLAssistantUI:
         popup.attributes('-topmost', True)
         popup.focus_force()
     
-    def on_core_event(self, event_type: str, data: Any) -> None:
+    def _pump_core_events(self) -> None:
+        """Traite les événements en attente (thread principal, cadence fixe)."""
+        for event in self._core_events.drain():
+            try:
+                self._handle_core_event(event.type, event.data)
+            except Exception as e:
+                logging.warning(f"Erreur traitement événement {event.type}: {e}")
+            self._core_events.record_delivery(event)
+        
+        if self.running:
+            self.root.after(UI_EVENT_INTERVAL_MS, self._pump_core_events)
+    
+    def subscribe_core_events(
+        self,
+        event_types: Tuple[str, ...],
+        callback: Callable[[str, Any], None]
+    ) -> Callable[[], None]:
         """
-        Gestionnaire d'événements du core (thread-safe).
-        Planifie les mises à jour UI sur le thread principal.
+        Abonne un callback à des événements du core (appelé sur le thread Tk).
+        
+        Args:
+            event_types: Types d'événements WebSocketManager.EVENT_*
+            callback: Fonction appelée avec (event_type, data)
+            
+        Returns:
+            Fonction de désabonnement
         """
-        self.root.after(0, lambda: self._handle_core_event(event_type, data))
+        for event_type in event_types:
+            self._core_subscribers.setdefault(event_type, []).append(callback)
+        
+        def unsubscribe():
+            for event_type in event_types:
+                callbacks = self._core_subscribers.get(event_type, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+        
+        return unsubscribe
+    
+    def get_event_stats(self) -> Dict[str, Any]:
+        """Retourne les métriques de l'abonnement de l'UI au bus du core."""
+        return self._core_events.get_stats()
     
     def _handle_core_event(self, event_type: str, data: Any) -> None:
         """Traite un événement du core sur le thread principal."""
@@ -1050,7 +1685,9 @@ class LoLAssistantUI:
         
         elif event_type == WebSocketManager.EVENT_STATUS:
             message, emoji = data
-            self.update_status(message, emoji)
+            if message != self._last_status:
+                self._last_status = message
+                self.update_status(message, emoji)
         
         elif event_type == WebSocketManager.EVENT_CHAMPION_PICKED:
             self.set_background_splash(data)
@@ -1058,25 +1695,54 @@ class LoLAssistantUI:
         elif event_type == WebSocketManager.EVENT_TOAST:
             self.show_toast(data)
     
-    def run(self) -> None:
-        """Lance la boucle principale Tkinter."""
+        for callback in list(self._core_subscribers.get(event_type, [])):
+            callback(event_type, data)
+    
+    def run(self, on_first_iteration: Optional[Callable[[], None]] = None) -> None:
+        """
+        Lance la boucle principale Tkinter.
+        
+        Args:
+            on_first_iteration: Appelée lors de la première itération de la boucle
+        """
+        if on_first_iteration is not None:
+            self.root.after_idle(on_first_iteration)
         self.root.mainloop()
     
-    def stop(self) -> None:
-        """Arrête l'interface."""
+    def stop(self, timeout: float = 0.5) -> None:
+        """
+        Arrête l'interface: hotkeys, tray, tâches de fond puis boucle Tk.
+        
+        Args:
+            timeout: Délai maximal d'attente des tâches d'images en cours
+        """
         self.running = False
         
-        # Arrêter le ThreadPoolExecutor
-        try:
-            self.executor.shutdown(wait=False)
-        except Exception as e:
-            logging.debug(f"Erreur arrêt executor: {e}")
+        # Retirer les hooks clavier globaux
+        if self._hotkeys_installed:
+            try:
+                import keyboard
+                keyboard.unhook_all()
+                self._hotkeys_installed = False
+            except Exception as e:
+                logging.debug(f"Erreur retrait hotkeys: {e}")
         
-        # Arrêter le system tray
+        # Arrêter le system tray (termine icon.run() dans l'executor)
         try:
             if hasattr(self, 'icon'):
                 self.icon.stop()
         except Exception as e:
             logging.debug(f"Erreur arrêt tray icon: {e}")
         
+        # Arrêter le ThreadPoolExecutor et l'ordonnanceur d'images
+        try:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            stats = self.image_scheduler.get_stats()
+            if not self.image_scheduler.shutdown(timeout):
+                logging.info("Tâches d'images encore en cours, résultats ignorés.")
+            logging.info(f"Ordonnanceur d'images: {stats}")
+            logging.info(f"File d'événements UI: {self.get_event_stats()}")
+        except Exception as e:
+            logging.debug(f"Erreur arrêt executor: {e}")
+        
         self.root.quit()
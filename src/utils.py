@@ -1,19 +1,24 @@
 """
 MAIN LOL - Module Utilitaires
 -----------------------------
-Fonctions utilitaires: lockfile, mise à jour, DPI, etc.
+Fonctions utilitaires: instance unique, mise à jour, DPI, etc.
 """
 
 import os
+import re
 import sys
+import json
+import time
+import socket
 import logging
-import requests
-from typing import Optional
+from threading import Thread, Lock
+from typing import Optional, Callable, Dict, Any, Tuple
 import urllib.parse
 
-import psutil
-
-from .config import LOCKFILE_PATH, GITHUB_RELEASES_API, CURRENT_VERSION
+from .config import (
+    SINGLE_INSTANCE_PORT, GITHUB_RELEASES_API, CURRENT_VERSION,
+    UPDATE_CHECK_CACHE_PATH, UPDATE_CHECK_TTL_S, write_json_atomic
+)
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -30,56 +35,269 @@ def enable_high_dpi() -> None:
 
 
 # ───────────────────────────────────────────────────────────────────────────
-# SINGLE INSTANCE (LOCKFILE)
+# SINGLE INSTANCE (SOCKET LOCAL + IPC)
 # ───────────────────────────────────────────────────────────────────────────
 
+# Messages échangés entre la nouvelle instance et l'instance en cours
+_IPC_SHOW_REQUEST = b"MAINLOL SHOW\n"
+_IPC_SHOW_REPLY = b"MAINLOL OK\n"
+_IPC_TIMEOUT_S = 1.0
+
+
+class SingleInstanceLock:
+    """
+    Verrou d'instance unique basé sur un socket local.
+    
+    Le bind exclusif sur 127.0.0.1:port est atomique (deux lancements
+    simultanés ne peuvent pas réussir tous les deux) et l'OS libère le
+    port à la mort du processus, même en cas de crash. Le socket sert
+    aussi de canal IPC: une seconde instance demande à la première
+    d'afficher sa fenêtre.
+    """
+    
+    def __init__(self, port: int = SINGLE_INSTANCE_PORT):
+        """
+        Args:
+            port: Port local réservé à l'application
+        """
+        self.port = port
+        self._server: Optional[socket.socket] = None
+        self._on_show: Optional[Callable[[], None]] = None
+        self._pending_show: bool = False
+        self._lock = Lock()
+    
+    def acquire(self) -> bool:
+        """
+        Tente de prendre le verrou.
+        
+        Returns:
+            True si cette instance détient le verrou
+        """
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+            # Windows: interdit à un autre processus de partager le port
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            # POSIX: ignore les connexions TIME_WAIT d'une instance précédente
+            # (un second socket en écoute reste refusé)
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            server.bind(("127.0.0.1", self.port))
+            server.listen(4)
+        except OSError:
+            server.close()
+            return False
+        
+        self._server = server
+        Thread(target=self._serve, name="SingleInstance", daemon=True).start()
+        return True
+    
+    def request_show(self, attempts: int = 5) -> bool:
+        """
+        Demande à l'instance en cours d'afficher sa fenêtre.
+        
+        Args:
+            attempts: Tentatives de connexion (l'autre instance peut être en train de démarrer)
+        
+        Returns:
+            True si l'instance en cours a confirmé la demande
+        """
+        for _ in range(attempts):
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=_IPC_TIMEOUT_S) as conn:
+                    conn.sendall(_IPC_SHOW_REQUEST)
+                    return conn.recv(len(_IPC_SHOW_REPLY)) == _IPC_SHOW_REPLY
+            except OSError:
+                time.sleep(0.1)
+        return False
+    
+    def set_show_handler(self, callback: Optional[Callable[[], None]]) -> None:
+        """
+        Définit la fonction appelée (thread IPC) quand une autre instance
+        demande l'affichage. Une demande reçue avant est rejouée.
+        """
+        with self._lock:
+            self._on_show = callback
+            replay = callback is not None and self._pending_show
+            self._pending_show = False
+        if replay:
+            callback()
+    
+    def _serve(self) -> None:
+        """Boucle d'écoute des demandes IPC."""
+        while self._server is not None:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            with conn:
+                try:
+                    conn.settimeout(_IPC_TIMEOUT_S)
+                    if conn.recv(len(_IPC_SHOW_REQUEST)) != _IPC_SHOW_REQUEST:
+                        continue
+                    conn.sendall(_IPC_SHOW_REPLY)
+                except OSError:
+                    continue
+            
+            logging.info("Autre lancement détecté: affichage de la fenêtre demandé.")
+            with self._lock:
+                callback = self._on_show
+                if callback is None:
+                    self._pending_show = True
+            if callback is not None:
+                try:
+                    callback()
+                except Exception as e:
+                    logging.error(f"Erreur affichage fenêtre (IPC): {e}")
+    
+    def release(self) -> None:
+        """Libère le verrou (aussi fait par l'OS à la fin du processus)."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+
+
+_instance_lock: Optional[SingleInstanceLock] = None
+
+
 def check_single_instance() -> bool:
     """
     Vérifie qu'une seule instance de l'application est en cours.
     
+    Si une autre instance détient le verrou, lui demande d'afficher sa
+    fenêtre.
+    
     Returns:
         True si cette instance peut continuer, False si une autre existe déjà
     """
-    if os.path.exists(LOCKFILE_PATH):
-        try:
-            with open(LOCKFILE_PATH, 'r') as f:
-                pid = int(f.read())
-            if pid != os.getpid() and psutil.pid_exists(pid):
-                logging.info(f"Instance existante détectée (PID: {pid})")
-                return False
-        except (ValueError, IOError):
-            pass
-    
-    # Créer/mettre à jour le lockfile
-    try:
-        with open(LOCKFILE_PATH, 'w') as f:
-            f.write(str(os.getpid()))
-    except IOError:
-        pass
+    global _instance_lock
+    lock = SingleInstanceLock()
+    if lock.acquire():
+        _instance_lock = lock
+        return True
+    
+    if lock.request_show():
+        logging.info("Instance existante détectée: fenêtre affichée.")
+        return False
     
+    # Port occupé par un programme qui ne répond pas au protocole
+    logging.warning(f"Port {lock.port} occupé sans réponse de MAIN LOL: vérification d'instance ignorée.")
     return True
 
 
-def remove_lockfile() -> None:
-    """Supprime le lockfile lors de la fermeture."""
+def set_show_window_handler(callback: Optional[Callable[[], None]]) -> None:
+    """Définit l'action exécutée quand un second lancement est détecté."""
+    if _instance_lock is not None:
+        _instance_lock.set_show_handler(callback)
+
+
+def release_single_instance() -> None:
+    """Libère le verrou d'instance unique lors de la fermeture."""
+    if _instance_lock is not None:
+        _instance_lock.release()
+
+
+# ───────────────────────────────────────────────────────────────────────────
+# MÉMOIRE
+# ───────────────────────────────────────────────────────────────────────────
+
+def get_peak_memory_kb() -> Optional[int]:
+    """
+    Retourne le pic de mémoire résidente du processus.
+    
+    Returns:
+        Pic de mémoire en Ko, ou None si indisponible
+    """
     try:
-        if os.path.exists(LOCKFILE_PATH):
-            os.remove(LOCKFILE_PATH)
-    except IOError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS: octets, Linux: Ko
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except ImportError:
         pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) // 1024
+    except Exception:
+        return None
 
 
 # ───────────────────────────────────────────────────────────────────────────
 # UPDATE CHECKING (GitHub Releases API)
 # ───────────────────────────────────────────────────────────────────────────
 
+def parse_version(version: str) -> Tuple[Tuple[int, ...], bool]:
+    """
+    Analyse un numéro de version sémantique ("v6.1", "6.10.2", "7.0-beta").
+    
+    Args:
+        version: Version ou tag de release
+    
+    Returns:
+        (composantes numériques sans zéros finaux, True si pré-version)
+    """
+    core, _, prerelease = version.strip().lstrip("vV").partition("-")
+    parts = []
+    for piece in core.split("."):
+        digits = re.match(r"\d+", piece)
+        parts.append(int(digits.group()) if digits else 0)
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts), bool(prerelease)
+
+
+def is_newer_version(remote: str, local: str) -> bool:
+    """
+    Indique si remote est strictement plus récente que local
+    (6.10 > 6.9, 6.1.0 == 6.1, une pré-version passe avant sa version finale).
+    """
+    remote_parts, remote_pre = parse_version(remote)
+    local_parts, local_pre = parse_version(local)
+    if remote_parts != local_parts:
+        return remote_parts > local_parts
+    return local_pre and not remote_pre
+
+
+def _load_update_cache() -> Dict[str, Any]:
+    """Charge le résultat de la dernière vérification (vide si absent ou invalide)."""
+    try:
+        with open(UPDATE_CHECK_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_update_cache(cache: Dict[str, Any]) -> None:
+    """Enregistre le résultat de la vérification."""
+    try:
+        write_json_atomic(UPDATE_CHECK_CACHE_PATH, cache)
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"[Update] Cache non enregistré: {e}")
+
+
 def check_for_updates() -> Optional[str]:
     """
     Vérifie les mises à jour via l'API GitHub Releases.
     
+    Le résultat est mis en cache UPDATE_CHECK_TTL_S secondes (aucun appel
+    réseau pendant ce délai); ensuite, la requête est conditionnelle
+    (If-None-Match) et une réponse 304 réutilise la version en cache.
+    
     Returns:
         Nouvelle version disponible (str) ou None si à jour
     """
+    cache = _load_update_cache()
+    remote_version = cache.get("remote_version")
+    checked_at = cache.get("checked_at", 0)
+    
+    if remote_version is not None and 0 <= time.time() - checked_at < UPDATE_CHECK_TTL_S:
+        logging.info(f"[Update] Résultat en cache: {remote_version or 'aucune release'} (locale: {CURRENT_VERSION})")
+        return remote_version if remote_version and is_newer_version(remote_version, CURRENT_VERSION) else None
+    
+    import requests
+    
     try:
         logging.info("[Update] Vérification via GitHub Releases API...")
         
@@ -87,25 +305,38 @@ def check_for_updates() -> Optional[str]:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "MainLoL-UpdateChecker"
         }
+        if cache.get("etag") and remote_version is not None:
+            headers["If-None-Match"] = cache["etag"]
         
         resp = requests.get(GITHUB_RELEASES_API, headers=headers, timeout=10)
         
-        if resp.status_code == 200:
+        if resp.status_code == 304:
+            logging.info(f"[Update] Release inchangée (304), version en ligne: {remote_version}")
+        
+        elif resp.status_code == 200:
             data = resp.json()
             tag_name = data.get("tag_name", "")
             
             # Extraire le numéro de version (v6.0 -> 6.0)
             remote_version = tag_name.lstrip("v").strip()
+            cache["etag"] = resp.headers.get("ETag")
             
             logging.info(f"[Update] Version en ligne: {remote_version}, locale: {CURRENT_VERSION}")
             
-            if remote_version and remote_version != CURRENT_VERSION:
-                return remote_version
-        
         elif resp.status_code == 404:
             logging.warning("[Update] Aucune release trouvée sur le repo")
+            remote_version = ""
+            cache["etag"] = None
         else:
             logging.warning(f"[Update] Réponse API: {resp.status_code}")
+            return None
+        
+        cache["remote_version"] = remote_version
+        cache["checked_at"] = time.time()
+        _save_update_cache(cache)
+        
+        if remote_version and is_newer_version(remote_version, CURRENT_VERSION):
+            return remote_version
             
     except requests.RequestException as e:
         logging.warning(f"[Update] Erreur réseau: {e}")